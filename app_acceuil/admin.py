@@ -6,7 +6,8 @@ from django.forms import inlineformset_factory
 from ckeditor.widgets import CKEditorWidget
 from ckeditor_uploader.widgets import CKEditorUploadingWidget
 
-from .models import SiteProfile, Section, SectionItem
+from .display_flags import CONTENT_TYPES, CONTEXTS, FLAGS, METADATA, METADATA_LABELS, flag_name
+from .models import OutgoingEmail, SiteProfile, Section, SectionItem
 
 
 class SectionItemForm(forms.ModelForm):
@@ -75,7 +76,15 @@ class SectionAdmin(admin.ModelAdmin):
 	fields = ("profile", "title", "title_image", "section_type", "is_active", "order")
 
 
-class SiteProfileForm(forms.ModelForm):
+# Cases à cocher de la matrice 4×3 des métadonnées : une par bit des masques
+# `<type>_display_flags` (voir display_flags.py)
+DisplayFlagsForm = type("DisplayFlagsForm", (forms.Form,), {
+	flag_name(content_type, metadata, context): forms.BooleanField(required=False, label=METADATA_LABELS[metadata])
+	for content_type in CONTENT_TYPES for metadata in METADATA for context in CONTEXTS
+})
+
+
+class SiteProfileForm(DisplayFlagsForm, forms.ModelForm):
 	bio = forms.CharField(widget=CKEditorUploadingWidget(), required=False)
 	projects_home_intro = forms.CharField(widget=CKEditorUploadingWidget(), required=False, label="Texte d'introduction Projets (Accueil)")
 	projects_page_intro = forms.CharField(widget=CKEditorUploadingWidget(), required=False, label="Texte d'introduction page Projets")
@@ -88,6 +97,18 @@ class SiteProfileForm(forms.ModelForm):
 		model = SiteProfile
 		fields = "__all__"
 
+	def __init__(self, *args, **kwargs):
+		super().__init__(*args, **kwargs)
+		for name, _field, _bit in FLAGS:
+			self.initial.setdefault(name, getattr(self.instance, name))
+
+	def save(self, commit=True):
+		# Reporter les cases cochées dans les masques avant l'enregistrement
+		for name, _field, _bit in FLAGS:
+			if name in self.cleaned_data:
+				setattr(self.instance, name, self.cleaned_data[name])
+		return super().save(commit=commit)
+
 
 @admin.register(SiteProfile)
 class SiteProfileAdmin(admin.ModelAdmin):
@@ -165,4 +186,17 @@ class SiteProfileAdmin(admin.ModelAdmin):
 
 
 # Les modèles Education, Experience, Section et SectionItem sont gérés uniquement via les inlines dans SiteProfile
-# Ils n'apparaissent pas comme sections séparées dans l'admin
\ No newline at end of file
+# Ils n'apparaissent pas comme sections séparées dans l'admin
+
+
+
+@admin.register(OutgoingEmail)
+class OutgoingEmailAdmin(admin.ModelAdmin):
+	"""Suivi de la file d'envoi du formulaire de contact (lecture seule)."""
+	list_display = ("subject", "from_email", "status", "attempts", "next_attempt_at", "sent_at")
+	list_filter = ("status",)
+	search_fields = ("subject", "from_email")
+	readonly_fields = [field.name for field in OutgoingEmail._meta.fields]
+
+	def has_add_permission(self, request):
+		return False
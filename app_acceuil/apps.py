@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class AppAcceuilConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "app_acceuil"
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from . import images
+        from .signals import connect_signals
+        from .sqlite_pragmas import apply_sqlite_pragmas
+
+        connect_signals()
+        images.connect_signals()
+        connection_created.connect(apply_sqlite_pragmas, dispatch_uid="app_acceuil_sqlite_pragmas")
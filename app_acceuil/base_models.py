@@ -8,6 +8,9 @@ from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 from ckeditor_uploader.fields import RichTextUploadingField
 
+from .slugs import allocate_slugs, unique_slug
+from .text import count_words, html_to_text, make_excerpt
+
 
 class PublishableContent(models.Model):
     """
@@ -19,12 +22,18 @@ class PublishableContent(models.Model):
     - Slug automatique
     - Métadonnées d'auteur
     - Dates de création/modification
+    - Texte brut dénormalisé du résumé (extrait des cartes, nombre de mots)
     """
     
     title = models.CharField(max_length=200, verbose_name=_("Titre"))
     slug = models.SlugField(max_length=200, unique=True, verbose_name=_("Slug"))
     resume = RichTextUploadingField(verbose_name=_("Résumé"))
     
+    # Dérivés de `resume` et `content` à chaque enregistrement (voir text.py)
+    resume_text = models.TextField(blank=True, editable=False, verbose_name=_("Résumé (texte brut)"))
+    excerpt = models.CharField(max_length=300, blank=True, editable=False, verbose_name=_("Extrait"))
+    word_count = models.PositiveIntegerField(default=0, editable=False, verbose_name=_("Nombre de mots"))
+    
     # Métadonnées
     author_name = models.CharField(
         max_length=100, 
@@ -49,20 +58,34 @@ class PublishableContent(models.Model):
     class Meta:
         abstract = True
         ordering = ['-published_at']
+        # Toutes les listes sont triées par date de publication décroissante ;
+        # `id` départage les dates égales (clé de la pagination par curseur)
+        indexes = [
+            models.Index(fields=['-published_at', '-id'], name='%(app_label)s_%(class)s_pub_idx'),
+        ]
     
     def __str__(self):
         return self.title
     
+    # Champs recalculés par `update_text_fields()`
+    TEXT_FIELDS = ('resume_text', 'excerpt', 'word_count')
+    
+    def update_text_fields(self):
+        """Recalcule le texte brut, l'extrait et le nombre de mots (résumé + contenu)."""
+        self.resume_text = html_to_text(self.resume)
+        self.excerpt = make_excerpt(self.resume_text)
+        self.word_count = count_words(self.resume_text) + count_words(html_to_text(getattr(self, 'content', '')))
+    
     def save(self, *args, **kwargs):
-        """Génère automatiquement le slug si non fourni."""
+        """Génère automatiquement le slug si non fourni et recalcule les champs texte."""
         if not self.slug:
-            self.slug = slugify(self.title)
-            # Assurer l'unicité du slug
-            original_slug = self.slug
-            counter = 1
-            while self.__class__.objects.filter(slug=self.slug).exists():
-                self.slug = f"{original_slug}-{counter}"
-                counter += 1
+            # Assurer l'unicité du slug (une seule requête, voir slugs.py)
+            self.slug = unique_slug(self.__class__, slugify(self.title))
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or {'resume', 'content'} & set(update_fields):
+            self.update_text_fields()
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, *self.TEXT_FIELDS}
         super().save(*args, **kwargs)
 
 
@@ -76,3 +99,21 @@ class PublishableContentManager(models.Manager):
     def get_by_slug(self, slug):
         """Récupère un élément par son slug."""
         return self.get(slug=slug)
+    
+    def bulk_create(self, objs, *args, **kwargs):
+        """
+        Comme `QuerySet.bulk_create`, en générant les slugs manquants et les
+        champs texte (`save()` n'est pas appelé).
+        
+        Les slugs de tout le lot sont alloués avec une seule requête : un
+        import de 500 articles « Weekly update » ne sonde plus la base
+        500 × 500 fois.
+        """
+        objs = list(objs)
+        missing = [obj for obj in objs if not obj.slug]
+        reserved = [obj.slug for obj in objs if obj.slug]
+        for obj, slug in zip(missing, allocate_slugs(self.model, [slugify(obj.title) for obj in missing], reserved=reserved)):
+            obj.slug = slug
+        for obj in objs:
+            obj.update_text_fields()
+        return super().bulk_create(objs, *args, **kwargs)
@@ -4,14 +4,12 @@ les apps projet, blog et service.
 """
 
 from django.views.generic import ListView, DetailView
-from django.shortcuts import get_object_or_404
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import never_cache
-from app_acceuil.models import SiteProfile
+from app_acceuil.middleware import get_profile_or_404
+from app_acceuil.page_cache import PublicPageCacheMixin, content_etag, item_tag, profile_tag
+from app_acceuil.pagination import paginate_by_cursor
 
 
-@method_decorator(never_cache, name='dispatch')
-class ProfileBasedListView(ListView):
+class ProfileBasedListView(PublicPageCacheMixin, ListView):
     """
     Vue de liste de base pour afficher du contenu lié à un profil.
     
@@ -20,9 +18,19 @@ class ProfileBasedListView(ListView):
     - template_name: Le template à utiliser
     - context_object_name: Le nom de la liste dans le contexte
     - profile_featured_attr: L'attribut du profil pour le contenu featured (ex: 'featured_projects')
+    - profile_config_groups: Les groupes de configuration du profil à charger (ex: ('blog',))
+    
+    `pagination_mode` choisit la pagination : 'page' (numéros `?page=`, par
+    défaut) ou 'cursor' (jetons `?cursor=` sans requête de comptage, voir
+    `pagination.py`).
+    
+    Les réponses passent par le cache de pages optionnel (voir `page_cache.py`) ;
+    sans lui, elles portent les en-têtes `never_cache`.
     """
     
     paginate_by = 9
+    pagination_mode = 'page'
+    cursor_kwarg = 'cursor'
     profile_featured_attr = None  # À définir dans les sous-classes
     
     def get_queryset(self):
@@ -33,24 +41,25 @@ class ProfileBasedListView(ListView):
             # Utiliser les contenus associés au profil via ManyToMany
             profile_content = getattr(profile, self.profile_featured_attr, None)
             if profile_content and profile_content.exists():
+                if self.pagination_mode == 'cursor':
+                    # Requête en base (la liste préchargée serait lue en entier)
+                    field = profile._meta.get_field(self.profile_featured_attr)
+                    return self.model.objects.filter(**{field.related_query_name(): profile})
                 return profile_content.all()
         
         # Fallback: retourner tous les items
         return super().get_queryset().all()
     
+    def paginate_queryset(self, queryset, page_size):
+        """Pagination par numéro de page (ListView) ou par curseur selon `pagination_mode`."""
+        if self.pagination_mode != 'cursor':
+            return super().paginate_queryset(queryset, page_size)
+        page = paginate_by_cursor(queryset, self.request.GET.get(self.cursor_kwarg), page_size)
+        return None, page, page.object_list, page.has_other_pages()
+    
     def get_profile(self):
-        """Récupère le profil depuis les paramètres d'URL ou le profil par défaut."""
-        nom = self.kwargs.get('nom')
-        profession = self.kwargs.get('profession')
-        
-        if nom and profession:
-            profile_slug = f"{nom}-{profession}"
-            return get_object_or_404(
-                SiteProfile.objects.get_published_with_content(),
-                slug=profile_slug
-            )
-        else:
-            return SiteProfile.objects.get_default_profile()
+        """Récupère le profil résolu pour la requête (partagé avec les context processors)."""
+        return get_profile_or_404(self.request, self.profile_config_groups)
     
     def get_context_data(self, **kwargs):
         """Ajoute le profil au contexte."""
@@ -59,8 +68,7 @@ class ProfileBasedListView(ListView):
         return context
 
 
-@method_decorator(never_cache, name='dispatch')
-class ProfileBasedDetailView(DetailView):
+class ProfileBasedDetailView(PublicPageCacheMixin, DetailView):
     """
     Vue de détail de base pour afficher un élément de contenu.
     
@@ -68,25 +76,39 @@ class ProfileBasedDetailView(DetailView):
     - model: Le modèle à afficher (Project, BlogPost, Service)
     - template_name: Le template à utiliser
     - context_object_name: Le nom de l'objet dans le contexte
+    - profile_config_groups: Les groupes de configuration du profil à charger (ex: ('blog',))
+    
+    Les requêtes conditionnelles (If-None-Match / If-Modified-Since) reçoivent
+    un 304 sans rendu de gabarit, que le cache de pages soit actif ou non.
     """
     
     def get_queryset(self):
         """Récupère le contenu du modèle."""
         return super().get_queryset().all()
     
-    def get_profile(self):
-        """Récupère le profil depuis les paramètres d'URL ou le profil par défaut."""
-        nom = self.kwargs.get('nom')
-        profession = self.kwargs.get('profession')
+    def get_page_cache_tags(self, profile):
+        """La page ne dépend que du profil et de l'élément affiché."""
+        return [profile_tag(profile), item_tag(self.model, self.kwargs.get('slug'))]
+    
+    def get_validators(self, profile):
+        """
+        Calcule `(etag, last_modified)` avant le rendu avec une seule requête
+        légère sur `updated_at` ; le profil vient du cache des profils.
         
-        if nom and profession:
-            profile_slug = f"{nom}-{profession}"
-            return get_object_or_404(
-                SiteProfile.objects.get_published_with_content(),
-                slug=profile_slug
-            )
-        else:
-            return SiteProfile.objects.get_default_profile()
+        Returns:
+            tuple or None: None si l'élément n'existe pas (la vue rendra un 404).
+        """
+        slug = self.kwargs.get('slug')
+        updated_at = self.model.objects.filter(slug=slug).values_list('updated_at', flat=True).first()
+        if updated_at is None:
+            return None
+        last_modified = max(updated_at, profile.updated_at) if profile else updated_at
+        etag = content_etag(item_tag(self.model, slug), updated_at, profile_tag(profile), profile and profile.updated_at)
+        return etag, last_modified
+    
+    def get_profile(self):
+        """Récupère le profil résolu pour la requête (partagé avec les context processors)."""
+        return get_profile_or_404(self.request, self.profile_config_groups)
     
     def get_context_data(self, **kwargs):
         """Ajoute le profil au contexte."""
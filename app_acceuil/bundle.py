@@ -0,0 +1,329 @@
+"""
+Feuille de style auto-hébergée : Bootstrap et Font Awesome réduits à ce que
+les gabarits utilisent.
+
+`python manage.py build_static_bundle` lit les sources de `assets/vendor/`,
+relève les mots des gabarits du projet et de nos scripts, et ne garde que
+les règles dont toutes les classes y figurent (les règles sans classe —
+éléments, `:root`, variables — sont gardées). Les polices d'icônes sont
+réduites aux glyphes restants. Le résultat (`static/app_acceuil/bundle/`)
+est versionné ; `collectstatic` le hache et le compresse comme le reste
+(voir `STORAGES` dans settings/base.py).
+
+Une classe ajoutée par du code ou du contenu (messages, texte riche) qui
+n'apparaît dans aucun gabarit doit être ajoutée à `SAFELIST`.
+
+La même commande écrit `critical.css` : les règles de nos feuilles
+(`CRITICAL_SOURCES`) utilisées par le haut de la page d'accueil
+(`CRITICAL_TEMPLATES`), insérées dans son `<head>` par `{% inline_static %}`
+pendant que les feuilles complètes se chargent sans bloquer le rendu.
+"""
+
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+from django.template.loader import get_template
+
+from .template_warmup import TEMPLATE_SUFFIXES
+
+APP_DIR = Path(__file__).resolve().parent
+VENDOR_DIR = APP_DIR / 'assets' / 'vendor'
+OUTPUT_DIR = APP_DIR / 'static' / 'app_acceuil' / 'bundle'
+BUNDLE_NAME = 'site.css'
+CRITICAL_NAME = 'critical.css'
+
+# Sources, dans l'ordre de la feuille produite
+SOURCES = (
+    VENDOR_DIR / 'bootstrap' / 'bootstrap.min.css',
+    VENDOR_DIR / 'fontawesome' / 'css' / 'all.min.css',
+)
+# Polices d'icônes (sources TrueType, produites en woff2) -> classes qui les sélectionnent
+FONTS_DIR = VENDOR_DIR / 'fontawesome' / 'webfonts'
+FONTS = {
+    'fa-solid-900': ('fa', 'fas', 'fa-solid'),
+    'fa-regular-400': ('far', 'fa-regular'),
+    'fa-brands-400': ('fab', 'fa-brands'),
+}
+
+# CSS critique : nos feuilles, dans l'ordre des <link>, réduites au haut de la page d'accueil
+CSS_DIR = APP_DIR / 'static' / 'app_acceuil' / 'css'
+CRITICAL_SOURCES = (
+    CSS_DIR / 'styles.css',
+    CSS_DIR / 'data-theme.css',
+    CSS_DIR / 'components.css',
+    CSS_DIR / 'acceuil.css',
+)
+CRITICAL_TEMPLATES = ('base.html', 'app_acceuil/acceuil.html')
+
+# Nos scripts : classes ajoutées dynamiquement (collapse, alertes)
+SCRIPT_DIRS = (APP_DIR / 'static' / 'app_acceuil' / 'js',)
+
+SAFELIST = {
+    # alert-{{ message.tags }} dans base.html
+    'alert-success', 'alert-info', 'alert-warning', 'alert-danger',
+}
+
+# Règles à blocs imbriqués, purgées récursivement
+NESTED_AT_RULES = ('@media', '@supports', '@container', '@layer')
+KEYFRAMES = ('@keyframes', '@-webkit-keyframes')
+CLASS_RE = re.compile(r'\.(-?[_a-zA-Z][\w-]*)')
+# Contenu des pseudo-classes fonctionnelles : une classe sous :not() n'a pas à être utilisée
+PSEUDO_ARGS_RE = re.compile(r':(?:not|is|where|has)\((?:[^()]|\([^()]*\))*\)')
+COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+LICENCE_RE = re.compile(r'/\*!.*?\*/', re.S)
+FONT_FAMILY_RE = re.compile(r'font-family:\s*("[^"]+"|[^;}]+)')
+FONT_FILE_RE = re.compile(r'webfonts/([\w-]+)\.woff2')
+WORD_RE = re.compile(r'[\w-]+')
+# Blancs autour de la ponctuation, hors chaînes
+COMPACT_RE = re.compile(r'("[^"]*"|\'[^\']*\')|\s*([{};,>])\s*|(:)\s+')
+# url() relative : fausse une fois le CSS inséré dans la page
+RELATIVE_URL_RE = re.compile(r'url\((?![\'"]?(?:data:|https?:|/))')
+
+
+def used_words():
+    """Mots des gabarits du projet et de nos scripts (hors gabarits des paquets installés)."""
+    base_dir = Path(settings.BASE_DIR).resolve()
+    paths = set()
+    for backend in engines.all():
+        if not isinstance(backend, DjangoTemplates):
+            continue
+        for loader in backend.engine.template_loaders:
+            # Le chargeur en cache délègue aux chargeurs qu'il enveloppe
+            for inner in getattr(loader, 'loaders', [loader]):
+                for directory in inner.get_dirs():
+                    root = Path(directory).resolve()
+                    if root.is_dir() and root.is_relative_to(base_dir):
+                        paths.update(path for path in root.rglob('*') if path.suffix in TEMPLATE_SUFFIXES)
+    for directory in SCRIPT_DIRS:
+        paths.update(directory.glob('*.js'))
+    words = set(SAFELIST)
+    for path in paths:
+        words.update(WORD_RE.findall(path.read_text(encoding='utf-8')))
+    return words
+
+
+def split_top_level(text, separator):
+    """Découpe sur `separator` hors chaînes, parenthèses et crochets."""
+    parts, depth, quote, start = [], 0, None, 0
+    for index, char in enumerate(text):
+        if quote:
+            quote = None if char == quote else quote
+        elif char in '"\'':
+            quote = char
+        elif char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:index])
+            start = index + 1
+    parts.append(text[start:])
+    return parts
+
+
+def parse_css(css):
+    """
+    Découpe une feuille en blocs de premier niveau.
+
+    Returns:
+        list[tuple]: (prélude, corps) ; corps vaut None pour une instruction
+        sans bloc (`@charset`, `@import`).
+    """
+    blocks, index, length = [], 0, len(css)
+    while index < length:
+        start = index
+        while index < length and css[index] not in '{;':
+            if css[index] in '"\'':
+                index = css.index(css[index], index + 1)
+            index += 1
+        if index >= length:
+            break
+        prelude = css[start:index].strip()
+        if css[index] == ';':
+            blocks.append((prelude, None))
+            index += 1
+            continue
+        depth, body_start, quote = 1, index + 1, None
+        index += 1
+        while depth:
+            char = css[index]
+            if quote:
+                quote = None if char == quote else quote
+            elif char in '"\'':
+                quote = char
+            elif char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+            index += 1
+        blocks.append((prelude, css[body_start:index - 1]))
+    return blocks
+
+
+def selector_is_used(selector, words):
+    """Toutes les classes du sélecteur (hors pseudo-classes fonctionnelles) sont utilisées."""
+    return all(name in words for name in CLASS_RE.findall(PSEUDO_ARGS_RE.sub('', selector)))
+
+
+def purge_blocks(blocks, words):
+    """Blocs gardés : sélecteurs réduits aux utilisés, at-rules imbriquées purgées."""
+    kept = []
+    for prelude, body in blocks:
+        if body is None or (prelude.startswith('@') and not prelude.startswith(NESTED_AT_RULES)):
+            kept.append((prelude, body))
+        elif prelude.startswith(NESTED_AT_RULES):
+            inner = purge_blocks(parse_css(body), words)
+            if inner:
+                kept.append((prelude, serialize(inner)))
+        else:
+            selectors = [s.strip() for s in split_top_level(prelude, ',') if selector_is_used(s.strip(), words)]
+            if selectors:
+                kept.append((','.join(selectors), body))
+    return kept
+
+
+def serialize(blocks):
+    return ''.join(f"{prelude};" if body is None else f"{prelude}{{{body}}}" for prelude, body in blocks)
+
+
+def drop_unreferenced(blocks, words):
+    """
+    Retire les @keyframes et @font-face dont le nom n'est plus cité par une
+    règle gardée, ainsi que les @font-face d'un style d'icônes inutilisé.
+    """
+    rules = serialize([(p, b) for p, b in blocks if not p.startswith((*KEYFRAMES, '@font-face'))])
+    kept = []
+    for prelude, body in blocks:
+        if prelude.startswith(KEYFRAMES) and prelude.split()[-1] not in rules:
+            continue
+        if prelude.startswith('@font-face'):
+            family = FONT_FAMILY_RE.search(body).group(1).strip().strip('"\'')
+            if family not in rules:
+                continue
+            font = FONT_FILE_RE.search(body)
+            if font and font.group(1) in FONTS and not words.intersection(FONTS[font.group(1)]):
+                continue
+        kept.append((prelude, body))
+    return kept
+
+
+def minify(css):
+    """Retire commentaires et sauts de ligne."""
+    return re.sub(r'\s*\n\s*', '', COMMENT_RE.sub('', css)).strip()
+
+
+def purge_css(css, words):
+    """
+    Feuille réduite aux règles utilisées.
+
+    Args:
+        css (str): Feuille source.
+        words (set): Mots présents dans les gabarits (voir `used_words`).
+    """
+    blocks = parse_css(COMMENT_RE.sub('', css))
+    charset = [block for block in blocks if block[0].startswith('@charset')]
+    blocks = drop_unreferenced(purge_blocks([b for b in blocks if b not in charset], words), words)
+    return serialize(charset[:1] + blocks)
+
+
+def licence_banners(css):
+    """Commentaires de licence (`/*! ... */`) d'une feuille source, à conserver."""
+    return ''.join(LICENCE_RE.findall(css))
+
+
+def font_src(css):
+    """Ne garde que les sources woff2 des @font-face, relatives au dossier du bundle."""
+    css = re.sub(r'src:url\(([^)]+\.woff2)\) format\("woff2"\)(?:,url\([^)]+\) format\("[^"]+"\))*', r'src:url(\1) format("woff2")', css)
+    return css.replace('url(../webfonts/', 'url(webfonts/')
+
+
+def template_words(names):
+    """Mots des gabarits nommés, tels que résolus par les chargeurs."""
+    words = set()
+    for name in names:
+        words.update(WORD_RE.findall(Path(get_template(name).origin.name).read_text(encoding='utf-8')))
+    return words
+
+
+def compact(css):
+    """Minifie une feuille écrite à la main (commentaires, sauts de ligne, blancs autour de la ponctuation)."""
+    css = COMPACT_RE.sub(lambda m: m.group(1) or m.group(2) or m.group(3), minify(css))
+    return css.replace(';}', '}')
+
+
+def build_css(words=None):
+    """Contenu de la feuille produite (déterministe : comparée par `--check`)."""
+    words = used_words() if words is None else words
+    parts = []
+    for source in SOURCES:
+        css = source.read_text(encoding='utf-8')
+        purged = purge_css(css, words)
+        charset = '@charset "UTF-8";'
+        parts.append(licence_banners(css) + minify(purged.replace(charset, '')))
+    return '@charset "UTF-8";' + font_src(''.join(parts)) + '\n'
+
+
+def build_critical_css(words=None):
+    """
+    CSS critique de la page d'accueil (déterministe : comparé par `--check`).
+
+    Sans @import ni @font-face : les feuilles complètes, chargées ensuite,
+    les apportent.
+
+    Raises:
+        ValueError: Une règle gardée cite une url() relative.
+    """
+    words = template_words(CRITICAL_TEMPLATES) if words is None else words
+    parts = []
+    for source in CRITICAL_SOURCES:
+        blocks = parse_css(purge_css(source.read_text(encoding='utf-8'), words))
+        parts.append(serialize([(p, b) for p, b in blocks if b is not None and not p.startswith('@font-face')]))
+    css = compact(''.join(parts))
+    if RELATIVE_URL_RE.search(css):
+        raise ValueError("Le CSS critique cite une url() relative : utiliser une url absolue ou data:.")
+    return css + '\n'
+
+
+def icon_codepoints(css):
+    """Points de code des glyphes cités par les propriétés `content` de la feuille."""
+    codepoints = set()
+    for value in re.findall(r'content:"((?:[^"\\]|\\.)*)"', css):
+        for escape, char in re.findall(r'\\([0-9a-fA-F]{1,6})\s?|(.)', value):
+            codepoints.add(int(escape, 16) if escape else ord(char))
+    return codepoints
+
+
+def subset_fonts(css, output_dir):
+    """
+    Écrit les polices d'icônes réduites aux glyphes utilisés.
+
+    Requiert fontTools (et brotli pour le woff2) au moment de la construction.
+
+    Returns:
+        dict: Nom de fichier -> (taille source, taille produite) en octets.
+    """
+    from fontTools import subset
+
+    codepoints = icon_codepoints(css)
+    fonts_dir = Path(output_dir) / 'webfonts'
+    fonts_dir.mkdir(parents=True, exist_ok=True)
+    sizes = {}
+    for name in FONTS:
+        target = fonts_dir / f"{name}.woff2"
+        if f"webfonts/{target.name}" not in css:
+            target.unlink(missing_ok=True)
+            continue
+        source = FONTS_DIR / f"{name}.ttf"
+        options = subset.Options()
+        options.flavor = 'woff2'
+        options.layout_features = ['*']
+        font = subset.load_font(str(source), options)
+        subsetter = subset.Subsetter(options)
+        subsetter.populate(unicodes=codepoints)
+        subsetter.subset(font)
+        subset.save_font(font, str(target), options)
+        sizes[target.name] = (source.stat().st_size, target.stat().st_size)
+    return sizes
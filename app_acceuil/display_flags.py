@@ -0,0 +1,123 @@
+"""
+Options d'affichage des métadonnées (auteur, profession, dates) par section.
+
+Les 12 cases « métadonnée × contexte » d'un type de contenu sont stockées
+dans un seul entier `<type>_display_flags` de SiteProfile, un bit par case :
+le bit de (`metadata`, `context`) vaut `1 << (index(metadata) * 3 + index(context))`.
+
+Les anciens noms booléens (`blog_show_author_detail`, ...) restent
+disponibles comme propriétés (formulaire admin, code existant), et les
+gabarits interrogent le masque avec le filtre `shows` :
+`{% if site_profile|shows:"blog.author.detail" %}` (ou `"blog.*.detail"`
+pour « au moins une métadonnée »). Les fonctions n'utilisent que des
+entiers pour servir aussi dans les migrations.
+"""
+
+CONTENT_TYPES = ('projects', 'blog', 'services')
+METADATA = ('author', 'profession', 'publish_date', 'update_date')
+CONTEXTS = ('home', 'list', 'detail')
+
+# Toutes les cases cochées (valeur par défaut des anciens booléens)
+ALL_FLAGS = (1 << (len(METADATA) * len(CONTEXTS))) - 1
+
+# Libellés des colonnes de la matrice admin (un par métadonnée)
+METADATA_LABELS = {
+    'author': "Auteur",
+    'profession': "Profession",
+    'publish_date': "Date pub",
+    'update_date': "Date MAJ",
+}
+
+
+def flag_bit(metadata, context):
+    """Bit de la case (`metadata`, `context`)."""
+    return 1 << (METADATA.index(metadata) * len(CONTEXTS) + CONTEXTS.index(context))
+
+
+def mask_field(content_type):
+    """Nom du champ entier qui porte le masque d'un type de contenu."""
+    return f"{content_type}_display_flags"
+
+
+def flag_name(content_type, metadata, context):
+    """Ancien nom booléen d'une case (ex: `blog_show_author_detail`)."""
+    return f"{content_type}_show_{metadata}_{context}"
+
+
+# (nom booléen, champ du masque, bit) pour les 36 cases, dans l'ordre de l'admin
+FLAGS = tuple(
+    (flag_name(content_type, metadata, context), mask_field(content_type), flag_bit(metadata, context))
+    for content_type in CONTENT_TYPES
+    for metadata in METADATA
+    for context in CONTEXTS
+)
+
+
+def pack_flags(values):
+    """Masque construit à partir d'un dict `{(metadata, context): bool}`."""
+    mask = 0
+    for (metadata, context), shown in values.items():
+        if shown:
+            mask |= flag_bit(metadata, context)
+    return mask
+
+
+_SPEC_CACHE = {}
+
+
+def parse_spec(spec):
+    """
+    Décode `"type.metadata.context"` en `(champ du masque, bits)`.
+
+    `metadata` peut valoir `*` (au moins une métadonnée affichée dans ce
+    contexte). Le résultat est mémorisé : les gabarits répètent les mêmes
+    chaînes à chaque rendu.
+
+    Raises:
+        ValueError: Si la chaîne ne désigne pas une case connue.
+    """
+    try:
+        return _SPEC_CACHE[spec]
+    except KeyError:
+        pass
+    try:
+        content_type, metadata, context = spec.split('.')
+        if content_type not in CONTENT_TYPES:
+            raise ValueError
+        if metadata == '*':
+            bits = 0
+            for name in METADATA:
+                bits |= flag_bit(name, context)
+        else:
+            bits = flag_bit(metadata, context)
+    except ValueError:
+        raise ValueError(f"Option d'affichage inconnue : {spec!r} (attendu « type.metadonnee.contexte »)")
+    _SPEC_CACHE[spec] = result = (mask_field(content_type), bits)
+    return result
+
+
+def shows(profile, spec):
+    """Vrai si le profil affiche la ou les cases désignées par `spec`."""
+    field, bits = parse_spec(spec)
+    return bool(getattr(profile, field) & bits)
+
+
+class DisplayFlag(property):
+    """
+    Propriété booléenne lisant/écrivant un bit du masque `field`.
+
+    Sous-classe de `property` : Django accepte donc ces noms comme arguments
+    du constructeur du modèle (`SiteProfile(blog_show_author_home=False)`).
+    """
+
+    def __init__(self, field, bit):
+        def fget(instance):
+            return bool(getattr(instance, field) & bit)
+
+        def fset(instance, shown):
+            mask = getattr(instance, field)
+            setattr(instance, field, mask | bit if shown else mask & ~bit)
+
+        super().__init__(fget, fset)
+        self.field = field
+        self.bit = bit
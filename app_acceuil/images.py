@@ -0,0 +1,292 @@
+"""
+Déclinaisons responsives des images téléversées.
+
+À l'enregistrement d'un modèle, chaque nouvelle image d'un champ listé dans
+`RESPONSIVE_IMAGE_FIELDS` est déclinée en WebP aux largeurs
+`RESPONSIVE_WIDTHS` (jamais agrandie), à côté de l'original :
+
+    projets/tableau.png -> projets/responsive/tableau-320w.webp, ...
+
+Les noms se déduisent de celui de l'original : le tag
+`{% responsive_image %}` (templatetags/utils.py) construit `srcset` sans
+accès au stockage. Il ne l'émet que si la colonne `<champ>_responsive` est
+vraie : elle est mise à jour quand les déclinaisons ont été écrites (une
+image illisible n'en a pas), sinon le navigateur choisirait dans `srcset`
+des fichiers absents. Les images déjà en place se déclinent avec
+`python manage.py build_responsive_images` (à chaque déploiement, après les
+migrations : voir .github/workflows/).
+
+Chaque champ décliné a aussi ses colonnes `<champ>_width`, `<champ>_height`
+et `<champ>_color` (couleur moyenne, fond d'attente), ajoutées par
+`add_metadata_fields()` et remplies à l'enregistrement à partir du fichier
+téléversé : le rendu émet `width`/`height` sans ouvrir le fichier.
+`python manage.py backfill_image_metadata` remplit celles des images
+existantes. (`ImageField.width_field` n'est pas utilisé : son récepteur
+`post_init` relit le fichier depuis le stockage à chaque chargement d'une
+ligne dont les dimensions sont vides.)
+"""
+
+import logging
+import posixpath
+from io import BytesIO
+
+from django.apps import apps
+from django.core.files.base import ContentFile
+from django.db import models
+from django.db.models.signals import post_save, pre_save
+from django.utils.text import format_lazy
+from PIL import ExifTags, Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+RESPONSIVE_WIDTHS = (96, 320, 640, 1280)
+WEBP_QUALITY = 80
+DERIVATIVES_DIR = 'responsive'
+
+# Modèle -> champs image déclinés (le favicon reste tel quel)
+RESPONSIVE_IMAGE_FIELDS = {
+    'app_blog.BlogPost': ('main_image',),
+    'app_projet.Project': ('main_image',),
+    'app_acceuil.SiteProfile': (
+        'profile_photo', 'navbar_avatar', 'bio_title_image', 'contact_title_image',
+        'projects_home_image', 'projects_page_image',
+        'blog_home_image', 'blog_page_image',
+        'services_home_image', 'services_page_image',
+    ),
+    'app_acceuil.Education': ('icon',),
+    'app_acceuil.Experience': ('icon',),
+    'app_acceuil.Section': ('title_image',),
+    'app_acceuil.SectionItem': ('icon',),
+}
+
+# Modèles dont `updated_at` entre dans la clé des fragments de sections
+SECTION_FRAGMENT_MODELS = ('app_acceuil.Section', 'app_acceuil.SectionItem')
+
+
+def is_responsive(fieldfile):
+    """Indique si l'image d'un champ a des déclinaisons."""
+    field = fieldfile.field
+    return field.name in RESPONSIVE_IMAGE_FIELDS.get(field.model._meta.label, ())
+
+
+def derivative_name(name, width):
+    """Nom de la déclinaison WebP d'une image à une largeur donnée."""
+    directory, filename = posixpath.split(name)
+    stem = posixpath.splitext(filename)[0]
+    return posixpath.join(directory, DERIVATIVES_DIR, f"{stem}-{width}w.webp")
+
+
+def metadata_fields(name):
+    """Colonnes (largeur, hauteur, couleur) d'un champ image."""
+    return (f"{name}_width", f"{name}_height", f"{name}_color")
+
+
+def derived_field(name):
+    """Colonne indiquant que les déclinaisons d'un champ image existent."""
+    return f"{name}_responsive"
+
+
+def add_metadata_fields(model):
+    """Ajoute au modèle les colonnes de métadonnées de ses champs déclinés."""
+    for name in RESPONSIVE_IMAGE_FIELDS[model._meta.label]:
+        label = next(field.verbose_name for field in model._meta.local_fields if field.name == name)
+        model.add_to_class(derived_field(name), models.BooleanField(
+            default=False, editable=False, verbose_name=format_lazy("{} : déclinaisons WebP", label)))
+        width, height, color = metadata_fields(name)
+        model.add_to_class(width, models.PositiveIntegerField(
+            null=True, blank=True, editable=False, verbose_name=format_lazy("{} : largeur", label)))
+        model.add_to_class(height, models.PositiveIntegerField(
+            null=True, blank=True, editable=False, verbose_name=format_lazy("{} : hauteur", label)))
+        model.add_to_class(color, models.CharField(
+            max_length=7, blank=True, editable=False, verbose_name=format_lazy("{} : couleur moyenne", label)))
+
+
+def has_derivatives(fieldfile):
+    """Indique si les déclinaisons de l'image d'un champ ont été écrites."""
+    return bool(getattr(fieldfile.instance, derived_field(fieldfile.field.name), False))
+
+
+def save_image_columns(instance, fields):
+    """
+    Enregistre des colonnes d'images calculées hors téléversement (commandes).
+
+    `post_save` invalide les caches de profils et de pages. `updated_at` ne
+    suit que pour les sections et leurs éléments, dont il forme la clé des
+    fragments en cache (section_cache.py) : ailleurs il est affiché
+    (« Date MAJ ») et sert aux validateurs HTTP, qu'une commande ne doit pas
+    renouveler.
+    """
+    fields = list(fields)
+    if instance._meta.label in SECTION_FRAGMENT_MODELS:
+        fields.append('updated_at')
+    instance.save(update_fields=fields)
+
+
+def stored_metadata(fieldfile):
+    """(largeur, hauteur, couleur) enregistrées pour l'image d'un champ."""
+    return tuple(getattr(fieldfile.instance, name, None) for name in metadata_fields(fieldfile.field.name))
+
+
+def image_metadata(file):
+    """
+    Dimensions affichées et couleur moyenne d'une image.
+
+    Args:
+        file: Fichier ouvert (téléversement ou stockage).
+
+    Returns:
+        tuple: (largeur, hauteur, « #rrggbb »).
+    """
+    image = Image.open(file)
+    width, height = image.size
+    if image.getexif().get(ExifTags.Base.Orientation) in (5, 6, 7, 8):
+        # Rotation d'un quart de tour appliquée par les navigateurs
+        width, height = height, width
+    # Décodage réduit (JPEG) : la couleur moyenne n'a pas besoin de tous les pixels
+    image.draft('RGB', (64, 64))
+    image.thumbnail((64, 64))
+    background = Image.new('RGBA', image.size, 'white')
+    background.alpha_composite(image.convert('RGBA'))
+    red, green, blue, _alpha = background.resize((1, 1), Image.BOX).getpixel((0, 0))
+    return width, height, f"#{red:02x}{green:02x}{blue:02x}"
+
+
+def srcset(fieldfile):
+    """
+    Valeur de l'attribut `srcset` (aucun accès au stockage).
+
+    Si la largeur de l'original est connue, les déclinaisons identiques
+    (non agrandies) ne sont listées qu'une fois, avec leur largeur réelle.
+    """
+    storage = fieldfile.storage
+    original_width = stored_metadata(fieldfile)[0]
+    candidates = []
+    for width in RESPONSIVE_WIDTHS:
+        if original_width and width >= original_width:
+            candidates.append((width, original_width))
+            break
+        candidates.append((width, width))
+    return ", ".join(
+        f"{storage.url(derivative_name(fieldfile.name, width))} {descriptor}w"
+        for width, descriptor in candidates
+    )
+
+
+def build_derivatives(storage, name):
+    """
+    Écrit les déclinaisons WebP d'une image (remplace les précédentes).
+
+    Returns:
+        list[str]: Noms écrits (vide si le fichier n'est pas une image lisible).
+    """
+    try:
+        with storage.open(name, 'rb') as source:
+            image = Image.open(source)
+            image.load()
+        image = ImageOps.exif_transpose(image)
+    except (OSError, Image.DecompressionBombError) as exc:
+        logger.warning("Image illisible %s : %s", name, exc)
+        return []
+
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    image = image.convert('RGBA' if has_alpha else 'RGB')
+    written = []
+    for width in RESPONSIVE_WIDTHS:
+        variant = image
+        if image.width > width:
+            variant = image.resize((width, max(1, round(image.height * width / image.width))), Image.LANCZOS)
+        buffer = BytesIO()
+        variant.save(buffer, 'WEBP', quality=WEBP_QUALITY, method=4)
+        target = derivative_name(name, width)
+        if storage.exists(target):
+            storage.delete(target)
+        written.append(storage.save(target, ContentFile(buffer.getvalue())))
+    return written
+
+
+def stored_images():
+    """
+    Images référencées en base par les champs déclinés.
+
+    Returns:
+        list[tuple]: Couples (stockage, nom), sans doublon.
+    """
+    images = {}
+    for label, names in RESPONSIVE_IMAGE_FIELDS.items():
+        model = apps.get_model(label)
+        for name in names:
+            storage = model._meta.get_field(name).storage
+            for value in model.objects.exclude(**{name: ''}).exclude(**{f"{name}__isnull": True}).values_list(name, flat=True).distinct():
+                images[(id(storage), value)] = (storage, value)
+    return list(images.values())
+
+
+def read_metadata(fieldfile):
+    """
+    Métadonnées de l'image d'un champ : fichier téléversé en mémoire s'il n'est
+    pas encore enregistré, sinon lecture depuis le stockage.
+
+    Returns:
+        tuple: (largeur, hauteur, couleur), ou (None, None, '') si illisible.
+    """
+    try:
+        if fieldfile._committed:
+            with fieldfile.storage.open(fieldfile.name, 'rb') as source:
+                return image_metadata(source)
+        upload = fieldfile.file
+        upload.seek(0)
+        try:
+            return image_metadata(upload)
+        finally:
+            upload.seek(0)
+    except (OSError, Image.DecompressionBombError) as exc:
+        logger.warning("Image illisible %s : %s", fieldfile.name, exc)
+        return None, None, ''
+
+
+def set_metadata(instance, name, metadata):
+    for field_name, value in zip(metadata_fields(name), metadata):
+        setattr(instance, field_name, value)
+
+
+def remember_uploads(sender, instance, **kwargs):
+    """
+    Récepteur de `pre_save` : note les champs dont le fichier vient d'être
+    téléversé et en remplit les métadonnées (vidées si l'image est retirée).
+    """
+    if kwargs.get('raw'):
+        return
+    instance._responsive_uploads = []
+    for name in RESPONSIVE_IMAGE_FIELDS[sender._meta.label]:
+        fieldfile = getattr(instance, name)
+        if not fieldfile:
+            set_metadata(instance, name, (None, None, ''))
+            setattr(instance, derived_field(name), False)
+        elif not fieldfile._committed:
+            set_metadata(instance, name, read_metadata(fieldfile))
+            setattr(instance, derived_field(name), False)
+            instance._responsive_uploads.append(name)
+
+
+def derive_uploads(sender, instance, **kwargs):
+    """Récepteur de `post_save` : décline les images téléversées et le note en base."""
+    derived = {}
+    for name in getattr(instance, '_responsive_uploads', ()):
+        fieldfile = getattr(instance, name)
+        if build_derivatives(fieldfile.storage, fieldfile.name):
+            derived[derived_field(name)] = True
+    instance._responsive_uploads = []
+    if derived:
+        # UPDATE direct : les caches viennent d'être invalidés par ce même enregistrement
+        sender._default_manager.filter(pk=instance.pk).update(**derived)
+        for field, value in derived.items():
+            setattr(instance, field, value)
+
+
+def connect_signals():
+    """Connecte la génération des déclinaisons aux modèles concernés."""
+    for label in RESPONSIVE_IMAGE_FIELDS:
+        model = apps.get_model(label)
+        uid = f"responsive_images_{model._meta.label_lower}"
+        pre_save.connect(remember_uploads, sender=model, dispatch_uid=f"{uid}_pre")
+        post_save.connect(derive_uploads, sender=model, dispatch_uid=uid)
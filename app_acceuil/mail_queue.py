@@ -0,0 +1,266 @@
+"""
+Boîte d'envoi persistante des emails du formulaire de contact.
+
+La vue `contact` appelle `enqueue_contact_emails()` qui enregistre les
+messages (`OutgoingEmail`) sans ouvrir de connexion SMTP : le visiteur
+n'attend plus les poignées de main TLS avec Gmail. La commande
+`send_queued_emails` appelle `deliver_due_emails()` en boucle :
+
+- les emails dus sont réservés (bail de `LEASE_SECONDS`) pour que plusieurs
+  workers ne les envoient pas deux fois ;
+- les emails d'un même profil partagent une session authentifiée prise dans
+  le pool de connexions du processus (`smtp_pool.py`) ;
+- en cas d'échec, la tentative suivante est repoussée de
+  `RETRY_BASE_SECONDS * 2 ** (tentatives - 1)` (plafonné à `RETRY_MAX_SECONDS`)
+  et l'email passe en échec définitif après `CONTACT_EMAIL_MAX_ATTEMPTS` tentatives.
+
+Sans worker (`CONTACT_EMAIL_WORKER` à False, par défaut), la vue appelle
+`deliver_without_worker()` après la mise en file : les emails de la requête,
+et eux seuls, sont envoyés dans un thread une fois la transaction validée,
+après la réponse. Les réessais d'un email en échec restent au worker ou à
+`send_queued_emails --once` (cron).
+
+Le backend est configurable (`CONTACT_EMAIL_BACKEND`) : les tests utilisent
+le backend locmem de Django à la place de Gmail.
+"""
+
+import threading
+from datetime import timedelta
+from itertools import groupby
+
+from django.conf import settings
+from django.core.mail import BadHeaderError, EmailMessage, get_connection
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import OutgoingEmail
+from .smtp_pool import smtp_pool
+
+LEASE_SECONDS = 5 * 60
+RETRY_BASE_SECONDS = 60
+RETRY_MAX_SECONDS = 6 * 60 * 60
+
+
+def max_attempts():
+    """Nombre de tentatives avant l'échec définitif d'un email."""
+    return getattr(settings, "CONTACT_EMAIL_MAX_ATTEMPTS", 6)
+
+
+def retry_delay(attempts):
+    """Délai avant la prochaine tentative, doublé à chaque échec."""
+    return timedelta(seconds=min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS))
+
+
+def _check_header(value):
+    """Refuse les retours à la ligne (injection d'en-têtes), comme `send_mail`."""
+    if "\n" in value or "\r" in value:
+        raise BadHeaderError(f"Header values can't contain newlines (got {value!r})")
+
+
+def enqueue_contact_emails(profile, name, sender_email, company, profession, subject, message_body):
+    """
+    Met en file la notification au propriétaire et, si activée, la confirmation.
+
+    Args:
+        profile (SiteProfile): Profil dont l'adresse Gmail envoie les emails.
+        name, sender_email, company, profession, subject, message_body (str):
+            Champs du formulaire de contact.
+
+    Returns:
+        list[OutgoingEmail]: Les emails enregistrés.
+
+    Raises:
+        BadHeaderError: Si l'objet ou les adresses contiennent un retour à la ligne.
+    """
+    for value in (name, sender_email, subject):
+        _check_header(value)
+
+    # === EMAIL 1 : Notification au propriétaire ===
+    owner_message = f"""
+Nouveau message reçu depuis le formulaire de contact
+
+DE: {name}
+EMAIL: {sender_email}
+{f'ENTREPRISE: {company}' if company else ''}
+{f'PROFESSION: {profession}' if profession else ''}
+
+OBJET: {subject}
+
+MESSAGE:
+{message_body}
+
+---
+Ce message a été envoyé via le formulaire de contact de votre site web.
+Pour répondre, utilisez l'adresse: {sender_email}
+    """
+    emails = [OutgoingEmail(
+        profile=profile,
+        subject=f"{subject} - Message de {name}",
+        body=owner_message.strip(),
+        from_email=profile.email,
+        recipients=[profile.email],
+    )]
+
+    # === EMAIL 2 : Confirmation à l'expéditeur ===
+    if profile.enable_confirmation_email:
+        signature = f"{profile.first_name} {profile.last_name}" if profile.first_name else "L'équipe"
+        confirmation_message = f"""
+Bonjour {name},
+
+Merci de m'avoir contacté. J'ai bien reçu votre message concernant "{subject}".
+
+Je vous répondrai dans les plus brefs délais à l'adresse {sender_email}.
+
+Voici un récapitulatif de votre message :
+{'-' * 50}
+{message_body}
+{'-' * 50}
+
+Cordialement,
+{signature}
+
+---
+Ceci est un email automatique, merci de ne pas y répondre.
+        """
+        emails.append(OutgoingEmail(
+            profile=profile,
+            subject=f"Confirmation de réception - {subject}",
+            body=confirmation_message.strip(),
+            from_email=profile.email,
+            recipients=[sender_email],
+        ))
+
+    return OutgoingEmail.objects.bulk_create(emails)
+
+
+def get_profile_connection(profile):
+    """Connexion email (non ouverte) avec les identifiants Gmail du profil."""
+    return get_connection(
+        backend=getattr(settings, "CONTACT_EMAIL_BACKEND", "django.core.mail.backends.smtp.EmailBackend"),
+        host=getattr(settings, "CONTACT_EMAIL_HOST", "smtp.gmail.com"),
+        port=getattr(settings, "CONTACT_EMAIL_PORT", 587),
+        username=profile.email,
+        password=profile.gmail_app_password,
+        use_tls=getattr(settings, "CONTACT_EMAIL_USE_TLS", True),
+        fail_silently=False,
+    )
+
+
+def claim_due_emails(batch_size=20, now=None, pks=None):
+    """
+    Réserve jusqu'à `batch_size` emails dus en repoussant leur échéance d'un bail.
+
+    Avec PostgreSQL, `select_for_update(skip_locked=True)` évite qu'un autre
+    worker réserve les mêmes lignes ; SQLite sérialise déjà les écritures.
+    `pks` limite la réservation à ces emails.
+    """
+    now = now or timezone.now()
+    due = OutgoingEmail.objects.filter(status=OutgoingEmail.STATUS_PENDING, next_attempt_at__lte=now)
+    if pks is not None:
+        due = due.filter(pk__in=pks)
+    with transaction.atomic():
+        emails = list(
+            due.select_for_update(skip_locked=True, of=("self",)).select_related("profile")[:batch_size]
+        )
+        OutgoingEmail.objects.filter(pk__in=[email.pk for email in emails]).update(
+            next_attempt_at=now + timedelta(seconds=LEASE_SECONDS)
+        )
+    return emails
+
+
+def _record_failure(email, error, now):
+    email.attempts += 1
+    email.last_error = str(error)
+    if email.attempts >= max_attempts():
+        email.status = OutgoingEmail.STATUS_FAILED
+    else:
+        email.next_attempt_at = now + retry_delay(email.attempts)
+    email.save(update_fields=["attempts", "last_error", "status", "next_attempt_at"])
+
+
+def deliver_due_emails(batch_size=20, now=None, pool=None, pks=None):
+    """
+    Envoie les emails dus en réutilisant une session SMTP par profil expéditeur.
+
+    Args:
+        batch_size (int): Nombre maximal d'emails traités.
+        now (datetime): Instant de référence (par défaut maintenant).
+        pool (SMTPConnectionPool): Pool de connexions (par défaut celui du processus).
+        pks (list[int]): Se limiter à ces emails (par défaut toute la file).
+
+    Returns:
+        tuple[int, int]: Nombre d'emails envoyés et nombre d'échecs.
+    """
+    now = now or timezone.now()
+    pool = pool or smtp_pool
+    sent = failed = 0
+    emails = sorted(claim_due_emails(batch_size, now, pks), key=lambda email: email.profile_id or 0)
+    for _, group in groupby(emails, key=lambda email: email.profile_id):
+        group = list(group)
+        profile = group[0].profile
+        if profile is None or not profile.email or not profile.gmail_app_password:
+            for email in group:
+                _record_failure(email, "La configuration email du profil n'est pas complète.", now)
+            failed += len(group)
+            continue
+
+        pending = list(group)
+        try:
+            with pool.connection(profile) as connection:
+                while pending:
+                    email = pending[0]
+                    try:
+                        pool.send(connection, EmailMessage(
+                            email.subject, email.body, email.from_email, email.recipients
+                        ))
+                    except Exception as exc:
+                        _record_failure(email, exc, now)
+                        failed += 1
+                    else:
+                        email.status = OutgoingEmail.STATUS_SENT
+                        email.attempts += 1
+                        email.sent_at = timezone.now()
+                        email.last_error = ""
+                        email.save(update_fields=["status", "attempts", "sent_at", "last_error"])
+                        sent += 1
+                    pending.pop(0)
+        except Exception as exc:
+            # Session impossible à ouvrir (réseau, authentification)
+            for email in pending:
+                _record_failure(email, exc, now)
+            failed += len(pending)
+    return sent, failed
+
+
+def _deliver_in_background(pks):
+    try:
+        deliver_due_emails(batch_size=len(pks), pks=pks)
+    finally:
+        # Connexion ouverte par ce thread, que Django ne fermera pas
+        connection.close()
+
+
+def deliver_without_worker(emails):
+    """
+    Envoie après la réponse les emails qui viennent d'être mis en file, quand
+    aucun worker n'est configuré.
+
+    L'envoi part dans un thread une fois la transaction validée : le
+    visiteur n'attend pas SMTP, et les autres emails de la file (réessais
+    compris) sont laissés au worker ou à la commande.
+
+    Args:
+        emails (list[OutgoingEmail]): Retour de `enqueue_contact_emails()`.
+
+    Returns:
+        threading.Thread or None: None avec un worker. Le thread n'est démarré
+        qu'à la validation de la transaction.
+    """
+    if getattr(settings, "CONTACT_EMAIL_WORKER", False):
+        return None
+    thread = threading.Thread(
+        target=_deliver_in_background, args=([email.pk for email in emails],),
+        name="contact-emails", daemon=True,
+    )
+    transaction.on_commit(thread.start)
+    return thread
@@ -0,0 +1,59 @@
+"""
+Remplit largeur, hauteur et couleur moyenne des images déjà téléversées.
+
+Usage:
+    python manage.py backfill_image_metadata               # images sans dimensions
+    python manage.py backfill_image_metadata --force       # tout relire
+    python manage.py backfill_image_metadata --workers 8
+
+Les nouveaux téléversements sont mesurés à l'enregistrement (voir
+`images.py`) ; cette commande lit les fichiers existants en parallèle puis
+enregistre les colonnes par `save_image_columns` : les pages concernées et
+les fragments de sections en cache sont invalidés.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from app_acceuil.images import (
+    RESPONSIVE_IMAGE_FIELDS, metadata_fields, read_metadata, save_image_columns, set_metadata,
+)
+
+
+class Command(BaseCommand):
+    help = "Remplit les dimensions et la couleur d'attente des images existantes."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 4, help="Fichiers lus en parallèle.")
+        parser.add_argument('--force', action='store_true', help="Relit aussi les images déjà mesurées.")
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        pending = []
+        for label, names in RESPONSIVE_IMAGE_FIELDS.items():
+            for instance in apps.get_model(label).objects.all():
+                stale = [
+                    name for name in names
+                    if getattr(instance, name) and (options['force'] or not getattr(instance, metadata_fields(name)[0]))
+                ]
+                if stale:
+                    pending.append((instance, stale))
+
+        jobs = [getattr(instance, name) for instance, names in pending for name in names]
+        with ThreadPoolExecutor(max_workers=max(1, options['workers'])) as executor:
+            results = iter(list(executor.map(read_metadata, jobs)))
+
+        measured = failed = 0
+        for instance, names in pending:
+            for name in names:
+                metadata = next(results)
+                set_metadata(instance, name, metadata)
+                measured += metadata[0] is not None
+                failed += metadata[0] is None
+            save_image_columns(instance, [field for name in names for field in metadata_fields(name)])
+        elapsed = time.perf_counter() - start
+        self.stdout.write(f"{measured} image(s) mesurée(s) en {elapsed:.1f} s ({failed} illisible(s)).")
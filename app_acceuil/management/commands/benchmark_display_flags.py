@@ -0,0 +1,103 @@
+"""
+Mesure le gain des masques d'affichage (`<type>_display_flags`) face aux
+36 colonnes booléennes qu'ils remplacent.
+
+Usage:
+    python manage.py benchmark_display_flags
+    python manage.py benchmark_display_flags --rows 5000 --iterations 20000
+
+Trois mesures, sur le profil par défaut (ou un profil neuf s'il n'y en a pas) :
+- taille d'une ligne : tables SQLite en mémoire, 36 booléens contre 3 entiers ;
+- entrée du cache de profil : taille et temps de désérialisation (pickle) ;
+- rendu des conditions de métadonnées d'une page de détail dans un gabarit.
+"""
+
+import pickle
+import sqlite3
+import timeit
+from types import SimpleNamespace
+
+from django.core.management.base import BaseCommand
+from django.template import Context, Template
+
+from app_acceuil.display_flags import CONTENT_TYPES, FLAGS, mask_field
+from app_acceuil.models import SiteProfile
+
+WIDE_TEMPLATE = (
+    "{% if p.blog_show_author_detail or p.blog_show_profession_detail or p.blog_show_publish_date_detail or p.blog_show_update_date_detail %}"
+    "{% if p.blog_show_author_detail %}a{% endif %}{% if p.blog_show_profession_detail %}p{% endif %}"
+    "{% if p.blog_show_publish_date_detail %}d{% endif %}{% if p.blog_show_update_date_detail %}u{% endif %}"
+    "{% endif %}"
+)
+PACKED_TEMPLATE = (
+    '{% load utils %}{% if p|shows:"blog.*.detail" %}'
+    '{% if p|shows:"blog.author.detail" %}a{% endif %}{% if p|shows:"blog.profession.detail" %}p{% endif %}'
+    '{% if p|shows:"blog.publish_date.detail" %}d{% endif %}{% if p|shows:"blog.update_date.detail" %}u{% endif %}'
+    '{% endif %}'
+)
+
+
+def table_bytes(columns, values, rows):
+    """Octets occupés par `rows` lignes identiques dans une table SQLite en mémoire."""
+    db = sqlite3.connect(':memory:')
+    db.execute(f"CREATE TABLE t (id INTEGER PRIMARY KEY, {', '.join(f'{c} integer NOT NULL' for c in columns)})")
+    empty = db.execute("PRAGMA page_count").fetchone()[0]
+    db.executemany(f"INSERT INTO t ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})", [values] * rows)
+    db.commit()
+    pages = db.execute("PRAGMA page_count").fetchone()[0] - empty
+    page_size = db.execute("PRAGMA page_size").fetchone()[0]
+    db.close()
+    return pages * page_size
+
+
+class Command(BaseCommand):
+    help = "Compare les masques d'affichage des métadonnées aux 36 booléens d'origine."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000, help="Lignes insérées pour mesurer la taille des tables.")
+        parser.add_argument('--iterations', type=int, default=10000, help="Répétitions des mesures de temps.")
+
+    def handle(self, *args, **options):
+        profile = SiteProfile.objects.filter(is_default=True).first() or SiteProfile(first_name="Bench", last_name="Mark")
+        booleans = {name: getattr(profile, name) for name, _field, _bit in FLAGS}
+        masks = [getattr(profile, mask_field(content_type)) for content_type in CONTENT_TYPES]
+
+        # Ancienne forme : les 36 booléens à la place des 3 masques
+        wide = pickle.loads(pickle.dumps(profile))
+        for content_type in CONTENT_TYPES:
+            del wide.__dict__[mask_field(content_type)]
+        wide.__dict__.update(booleans)
+
+        self.report("Colonnes de métadonnées", len(booleans), len(masks), "")
+        rows = options['rows']
+        self.report(
+            f"Table SQLite ({rows} lignes)",
+            table_bytes(list(booleans), list(booleans.values()), rows),
+            table_bytes([mask_field(content_type) for content_type in CONTENT_TYPES], masks, rows),
+            " o",
+        )
+
+        wide_entry, packed_entry = pickle.dumps(wide), pickle.dumps(profile)
+        self.report("Entrée du cache de profil", len(wide_entry), len(packed_entry), " o")
+        iterations = options['iterations']
+        self.report(
+            f"Désérialisation du profil (x{iterations})",
+            timeit.timeit(lambda: pickle.loads(wide_entry), number=iterations) * 1000,
+            timeit.timeit(lambda: pickle.loads(packed_entry), number=iterations) * 1000,
+            " ms",
+        )
+
+        wide_context = Context({'p': SimpleNamespace(**booleans)})
+        packed_context = Context({'p': profile})
+        wide_template, packed_template = Template(WIDE_TEMPLATE), Template(PACKED_TEMPLATE)
+        assert wide_template.render(wide_context) == packed_template.render(packed_context)
+        self.report(
+            f"Conditions de la page de détail (x{iterations})",
+            timeit.timeit(lambda: wide_template.render(wide_context), number=iterations) * 1000,
+            timeit.timeit(lambda: packed_template.render(packed_context), number=iterations) * 1000,
+            " ms",
+        )
+
+    def report(self, label, before, after, unit):
+        ratio = f"{after / before:.0%}" if before else "-"
+        self.stdout.write(f"{label:<45} 36 booléens: {before:>10.1f}{unit}   masques: {after:>10.1f}{unit}   ({ratio})")
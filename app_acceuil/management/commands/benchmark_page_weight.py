@@ -0,0 +1,121 @@
+"""
+Mesure le poids HTML des pages publiques et la part des styles et scripts en ligne.
+
+Usage:
+    python manage.py benchmark_page_weight
+    python manage.py benchmark_page_weight --baseline HEAD~1
+
+Pour chaque page (accueil, listes, premier détail de chaque type) : taille
+du HTML, taille gzip, et octets en ligne (`<style>`, `<script>` sans `src`,
+attributs `style=""` et `on...=""`), que le navigateur retélécharge à
+chaque page au lieu de les lire en cache. Avec `--baseline`, les mêmes
+pages sont aussi rendues avec les gabarits d'une révision git (chargeur
+locmem) et la réduction est affichée. Caches de pages et de sections
+désactivés : chaque rendu reflète les gabarits.
+"""
+
+import gzip
+import re
+import subprocess
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from app_blog.models import BlogPost
+from app_projet.models import Project
+from app_service.models import Service
+
+INLINE_RE = re.compile(
+    r'<style\b[^>]*>.*?</style>|<script\b(?![^>]*\bsrc=)[^>]*>.*?</script>|\s(?:style|on\w+)="[^"]*"',
+    re.DOTALL | re.IGNORECASE,
+)
+LIST_ROUTES = (
+    ("Blogue (liste)", 'blogue_list', BlogPost),
+    ("Projets (liste)", 'projet_list', Project),
+    ("Services (liste)", 'service_list', Service),
+)
+
+
+def public_pages():
+    """(libellé, URL) des pages mesurées."""
+    pages = [("Accueil", '/')]
+    for label, route, model in LIST_ROUTES:
+        pages.append((label, reverse(route)))
+        item = model.objects.order_by('pk').first()
+        if item:
+            pages.append((label.replace("(liste)", "(détail)"), item.get_absolute_url()))
+    return pages
+
+
+def revision_templates(revision):
+    """
+    Gabarits du dépôt à une révision git, indexés par nom de gabarit.
+
+    Raises:
+        CommandError: Révision inconnue ou git indisponible.
+    """
+    def git(*args):
+        try:
+            return subprocess.run(
+                ['git', *args], cwd=settings.BASE_DIR, capture_output=True, check=True,
+            ).stdout.decode('utf-8')
+        except (OSError, subprocess.CalledProcessError) as exc:
+            raise CommandError(f"Lecture de la révision {revision} impossible : {exc}") from exc
+
+    templates = {}
+    for path in git('ls-tree', '-r', '--name-only', revision).splitlines():
+        if path.endswith('.html') and (path.startswith('templates/') or '/templates/' in path):
+            # templates/ du projet avant ceux des applications, comme DIRS avant APP_DIRS
+            name = path.split('templates/', 1)[1]
+            if name not in templates or path.startswith('templates/'):
+                templates[name] = git('show', f"{revision}:{path}")
+    return templates
+
+
+def templates_setting(loaders):
+    """Réglage TEMPLATES du projet avec d'autres chargeurs (sans cache)."""
+    params = settings.TEMPLATES[0]
+    return [{**params, 'APP_DIRS': False, 'OPTIONS': {**params['OPTIONS'], 'loaders': loaders}}]
+
+
+def page_weight(client, url):
+    """(octets, octets gzip, octets en ligne) d'une page."""
+    response = client.get(url)
+    if response.status_code != 200:
+        raise CommandError(f"{url} : réponse {response.status_code}")
+    html = response.content
+    inline = sum(len(match.group().encode()) for match in INLINE_RE.finditer(html.decode('utf-8')))
+    return len(html), len(gzip.compress(html, mtime=0)), inline
+
+
+def measure(pages, loaders):
+    client = Client(SERVER_NAME='localhost')
+    with override_settings(TEMPLATES=templates_setting(loaders), PAGE_CACHE_TIMEOUT=0, SECTION_FRAGMENT_TIMEOUT=0):
+        return {url: page_weight(client, url) for _label, url in pages}
+
+
+class Command(BaseCommand):
+    help = "Mesure le poids HTML des pages publiques, éventuellement contre une révision git."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--baseline', help="Révision git de référence (ex. HEAD~1).")
+
+    def handle(self, *args, **options):
+        pages = public_pages()
+        current = measure(pages, settings.TEMPLATE_LOADERS)
+        baseline = None
+        if options['baseline']:
+            locmem = ('django.template.loaders.locmem.Loader', revision_templates(options['baseline']))
+            baseline = measure(pages, [locmem, *settings.TEMPLATE_LOADERS])
+
+        self.stdout.write(f"{'Page':<20} {'HTML':>9} {'gzip':>8} {'en ligne':>9}")
+        for label, url in pages:
+            size, compressed, inline = current[url]
+            line = f"{label:<20} {size:>9,} {compressed:>8,} {inline:>9,}"
+            if baseline:
+                before, before_compressed, before_inline = baseline[url]
+                line += (f"   avant : {before:,} / {before_compressed:,} / {before_inline:,}"
+                         f"   ({(size - before) / before:+.0%} HTML, {(compressed - before_compressed) / before_compressed:+.0%} gzip)")
+            self.stdout.write(line)
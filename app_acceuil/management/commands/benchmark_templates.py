@@ -0,0 +1,68 @@
+"""
+Compare le temps de rendu par requête selon la configuration des gabarits.
+
+Usage:
+    python manage.py benchmark_templates
+    python manage.py benchmark_templates --template app_acceuil/acceuil.html --requests 200
+
+Trois configurations du moteur, sur le contexte réel de la page d'accueil :
+- relecture à chaque requête + debug (gabarits relus et recompilés) ;
+- chargeur en cache + debug ;
+- chargeur en cache sans debug (production, voir `TEMPLATE_CACHE` / `TEMPLATE_DEBUG`).
+"""
+
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.template.backends.django import DjangoTemplates
+from django.test import RequestFactory
+
+from app_acceuil.middleware import get_site_profile
+from app_acceuil.services import ProfileService
+
+CONFIGURATIONS = (
+    ("Relecture + debug", False, True),
+    ("Cache + debug", True, True),
+    ("Cache sans debug (production)", True, False),
+)
+
+
+def build_backend(name, cached, debug):
+    """Moteur de gabarits du projet avec le chargeur et le mode debug demandés."""
+    params = settings.TEMPLATES[0]
+    loaders = settings.TEMPLATE_LOADERS
+    options = {
+        **params.get('OPTIONS', {}),
+        'loaders': [("django.template.loaders.cached.Loader", loaders)] if cached else loaders,
+        'debug': debug,
+    }
+    return DjangoTemplates({'NAME': name, 'DIRS': params.get('DIRS', []), 'APP_DIRS': False, 'OPTIONS': options})
+
+
+class Command(BaseCommand):
+    help = "Mesure le rendu d'une page avec et sans chargeur de gabarits en cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--template', default='app_acceuil/acceuil.html', help="Gabarit à rendre.")
+        parser.add_argument('--requests', type=int, default=100, help="Rendus mesurés par configuration.")
+
+    def handle(self, *args, **options):
+        request = RequestFactory().get('/')
+        request.user = AnonymousUser()
+        context = ProfileService.build_profile_context(get_site_profile(request))
+        count = options['requests']
+
+        baseline = None
+        for index, (label, cached, debug) in enumerate(CONFIGURATIONS):
+            backend = build_backend(f"benchmark-{index}", cached, debug)
+            # Premier rendu hors mesure (caches de profil, de sections, compilation)
+            backend.get_template(options['template']).render(context, request)
+            start = time.perf_counter()
+            for _ in range(count):
+                # Comme une vue : le gabarit est demandé au moteur à chaque requête
+                backend.get_template(options['template']).render(context, request)
+            per_request = (time.perf_counter() - start) * 1000 / count
+            baseline = baseline or per_request
+            self.stdout.write(f"{label:<32} {per_request:8.2f} ms/requête   ({per_request / baseline:.0%})")
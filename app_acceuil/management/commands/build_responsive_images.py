@@ -0,0 +1,85 @@
+"""
+Décline en WebP responsive les images déjà téléversées.
+
+Usage:
+    python manage.py build_responsive_images               # images sans déclinaisons
+    python manage.py build_responsive_images --force       # tout régénérer
+    python manage.py build_responsive_images --workers 8
+
+Les nouveaux téléversements sont déclinés à l'enregistrement (voir
+`images.py`) ; cette commande rattrape les médias existants, en parallèle
+(Pillow libère le GIL pendant le redimensionnement et l'encodage), puis met
+à jour les colonnes `<champ>_responsive` : `srcset` n'est émis que pour les
+images dont les déclinaisons existent. Lancée à chaque déploiement, après
+les migrations (workflows de .github/workflows/).
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from app_acceuil.images import (
+    RESPONSIVE_IMAGE_FIELDS, RESPONSIVE_WIDTHS, build_derivatives, derivative_name, derived_field,
+    save_image_columns, stored_images,
+)
+
+
+def record_derivatives(derived):
+    """
+    Met `<champ>_responsive` en accord avec les déclinaisons présentes.
+
+    Args:
+        derived (set): Couples (id du stockage, nom) des images déclinées.
+
+    Returns:
+        int: Nombre de lignes enregistrées.
+    """
+    saved = 0
+    for label, names in RESPONSIVE_IMAGE_FIELDS.items():
+        for instance in apps.get_model(label).objects.all():
+            changed = []
+            for name in names:
+                fieldfile = getattr(instance, name)
+                value = bool(fieldfile) and (id(fieldfile.storage), fieldfile.name) in derived
+                if getattr(instance, derived_field(name)) != value:
+                    setattr(instance, derived_field(name), value)
+                    changed.append(derived_field(name))
+            if changed:
+                save_image_columns(instance, changed)
+                saved += 1
+    return saved
+
+
+class Command(BaseCommand):
+    help = "Génère les déclinaisons WebP (srcset) des images existantes."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 4, help="Images traitées en parallèle.")
+        parser.add_argument('--force', action='store_true', help="Régénère aussi les images déjà déclinées.")
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        images = stored_images()
+        derived = set()
+        if not options['force']:
+            # La plus grande déclinaison est écrite en dernier
+            pending = []
+            for storage, name in images:
+                if storage.exists(derivative_name(name, RESPONSIVE_WIDTHS[-1])):
+                    derived.add((id(storage), name))
+                else:
+                    pending.append((storage, name))
+            images = pending
+        with ThreadPoolExecutor(max_workers=max(1, options['workers'])) as executor:
+            results = list(executor.map(lambda image: build_derivatives(*image), images))
+        derived.update((id(storage), name) for (storage, name), written in zip(images, results) if written)
+        failed = sum(1 for written in results if not written)
+        saved = record_derivatives(derived)
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f"{len(images) - failed} image(s) déclinée(s) en {elapsed:.1f} s"
+            f" ({sum(map(len, results))} fichier(s) WebP, {failed} illisible(s), {saved} ligne(s) mise(s) à jour)."
+        )
@@ -0,0 +1,53 @@
+"""
+Construit la feuille auto-hébergée Bootstrap + Font Awesome et le CSS
+critique de la page d'accueil (voir `bundle.py`).
+
+Usage:
+    python manage.py build_static_bundle           # écrit static/app_acceuil/bundle/
+    python manage.py build_static_bundle --check   # échoue si une feuille versionnée est périmée
+
+À relancer après l'ajout d'une classe Bootstrap ou d'une icône dans un
+gabarit, ou la modification d'une feuille de `CRITICAL_SOURCES`. `--check` ne relit que les CSS (fontTools n'est pas requis) : il
+s'utilise en intégration continue et dans les tests.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app_acceuil.bundle import (
+    BUNDLE_NAME, CRITICAL_NAME, OUTPUT_DIR, SOURCES, build_critical_css, build_css, subset_fonts,
+)
+
+
+class Command(BaseCommand):
+    help = "Construit la feuille Bootstrap/Font Awesome réduite aux classes utilisées."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--check', action='store_true', help="Vérifie que la feuille versionnée est à jour, sans écrire.")
+
+    def handle(self, *args, **options):
+        css = build_css()
+        target = OUTPUT_DIR / BUNDLE_NAME
+        try:
+            critical = build_critical_css()
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+        if options['check']:
+            for name, content in ((BUNDLE_NAME, css), (CRITICAL_NAME, critical)):
+                path = OUTPUT_DIR / name
+                if not path.exists() or path.read_text(encoding='utf-8') != content:
+                    raise CommandError(f"{path} est périmée : lancez `python manage.py build_static_bundle`.")
+                self.stdout.write(f"{name} à jour ({len(content.encode()) / 1024:.1f} Ko).")
+            return
+
+        try:
+            sizes = subset_fonts(css, OUTPUT_DIR)
+        except ImportError as exc:
+            raise CommandError("fontTools et brotli sont requis : pip install fonttools brotli") from exc
+        target.write_text(css, encoding='utf-8', newline='\n')
+
+        source_size = sum(source.stat().st_size for source in SOURCES)
+        self.stdout.write(f"{BUNDLE_NAME} : {source_size / 1024:.1f} Ko -> {len(css.encode()) / 1024:.1f} Ko")
+        (OUTPUT_DIR / CRITICAL_NAME).write_text(critical, encoding='utf-8', newline='\n')
+        self.stdout.write(f"{CRITICAL_NAME} : {len(critical.encode()) / 1024:.1f} Ko")
+        for name, (before, after) in sizes.items():
+            self.stdout.write(f"webfonts/{name} : {before / 1024:.1f} Ko -> {after / 1024:.1f} Ko")
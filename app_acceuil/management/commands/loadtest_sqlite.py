@@ -0,0 +1,133 @@
+"""
+Test de charge SQLite : débit de lecture pendant des écritures concurrentes.
+
+Usage:
+    python manage.py loadtest_sqlite
+    python manage.py loadtest_sqlite --readers 8 --writers 2 --duration 10
+
+Simule plusieurs workers gunicorn (un processus par lecteur ou écrivain) sur
+un fichier SQLite temporaire. Les écrivains reproduisent `SiteProfile.save()`
+(plusieurs UPDATE dans une transaction) ; les lecteurs enchaînent des SELECT.
+Deux scénarios sont comparés :
+- « avant » : réglages par défaut (journal DELETE, synchronous FULL, attente 5 s) ;
+- « après » : PRAGMA de `SQLITE_PRAGMAS` en WAL (voir `app_acceuil/sqlite_pragmas.py`).
+"""
+
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand
+
+from app_acceuil.sqlite_pragmas import pragma_statements, sqlite_pragmas
+
+ROWS = 50
+UPDATES_PER_SAVE = 5
+# Réglages de Django sans hook : délai du module sqlite3 de Django (5 s)
+BEFORE_PRAGMAS = {'busy_timeout': 5000, 'journal_mode': 'DELETE', 'synchronous': 'FULL'}
+
+
+def connect(path, pragmas):
+    """Connexion en autocommit avec les PRAGMA du scénario."""
+    connection = sqlite3.connect(path, timeout=0, isolation_level=None)
+    for statement in pragma_statements(pragmas):
+        connection.execute(statement)
+    return connection
+
+
+def create_database(path, pragmas):
+    """Table de profils factice (une ligne ≈ un SiteProfile de 4 Ko)."""
+    connection = connect(path, pragmas)
+    connection.execute("CREATE TABLE profile (id INTEGER PRIMARY KEY, payload TEXT, updated_at REAL)")
+    connection.executemany(
+        "INSERT INTO profile (id, payload, updated_at) VALUES (?, ?, ?)",
+        [(pk, "x" * 4096, time.time()) for pk in range(1, ROWS + 1)],
+    )
+    connection.close()
+
+
+def reader(path, pragmas, deadline, results):
+    """Enchaîne des lectures jusqu'à `deadline` ; compte réussites, échecs et pire latence."""
+    connection = connect(path, pragmas)
+    reads = errors = 0
+    worst = 0.0
+    while time.time() < deadline:
+        start = time.perf_counter()
+        try:
+            connection.execute("SELECT * FROM profile WHERE id = ?", (reads % ROWS + 1,)).fetchall()
+            reads += 1
+        except sqlite3.OperationalError:
+            errors += 1
+        worst = max(worst, time.perf_counter() - start)
+    connection.close()
+    results.put(('read', reads, errors, worst))
+
+
+def writer(path, pragmas, deadline, results):
+    """Transactions de plusieurs UPDATE, comme un enregistrement dans l'admin."""
+    connection = connect(path, pragmas)
+    saves = errors = 0
+    worst = 0.0
+    while time.time() < deadline:
+        start = time.perf_counter()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            for offset in range(UPDATES_PER_SAVE):
+                connection.execute(
+                    "UPDATE profile SET updated_at = ?, payload = ? WHERE id = ?",
+                    (time.time(), str(saves) * 4096, (saves + offset) % ROWS + 1),
+                )
+            connection.execute("COMMIT")
+            saves += 1
+        except sqlite3.OperationalError:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            errors += 1
+        worst = max(worst, time.perf_counter() - start)
+    connection.close()
+    results.put(('write', saves, errors, worst))
+
+
+def run_scenario(pragmas, readers, writers, duration):
+    """Lance lecteurs et écrivains sur une base neuve ; totaux par rôle."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "loadtest.sqlite3")
+        create_database(path, pragmas)
+        context = multiprocessing.get_context()
+        results = context.Queue()
+        deadline = time.time() + duration + 0.5
+        processes = [context.Process(target=reader, args=(path, pragmas, deadline, results)) for _ in range(readers)]
+        processes += [context.Process(target=writer, args=(path, pragmas, deadline, results)) for _ in range(writers)]
+        for process in processes:
+            process.start()
+        totals = {'read': [0, 0, 0.0], 'write': [0, 0, 0.0]}
+        for _ in processes:
+            role, done, errors, worst = results.get()
+            totals[role][0] += done
+            totals[role][1] += errors
+            totals[role][2] = max(totals[role][2], worst)
+        for process in processes:
+            process.join()
+    return totals
+
+
+class Command(BaseCommand):
+    help = "Compare le débit de lecture SQLite avec écrivains concurrents, sans et avec les PRAGMA du projet."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--readers', type=int, default=4, help="Processus lecteurs.")
+        parser.add_argument('--writers', type=int, default=2, help="Processus écrivains.")
+        parser.add_argument('--duration', type=float, default=5.0, help="Durée de chaque scénario (secondes).")
+
+    def handle(self, *args, **options):
+        duration = options['duration']
+        for label, pragmas in (("Avant (défauts)", BEFORE_PRAGMAS), ("Après (SQLITE_PRAGMAS)", sqlite_pragmas(wal=True))):
+            totals = run_scenario(pragmas, options['readers'], options['writers'], duration)
+            reads, read_errors, read_worst = totals['read']
+            saves, write_errors, _ = totals['write']
+            self.stdout.write(
+                f"{label:<24} lectures: {reads / duration:9.0f}/s  (échecs {read_errors}, pire {read_worst * 1000:.0f} ms)   "
+                f"enregistrements: {saves / duration:6.0f}/s  (échecs {write_errors})"
+            )
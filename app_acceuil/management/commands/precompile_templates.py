@@ -0,0 +1,29 @@
+"""
+Compile tous les gabarits du projet et signale les erreurs de syntaxe.
+
+Usage:
+    python manage.py precompile_templates    # au déploiement (Dockerfile, release)
+
+Les workers gunicorn précompilent déjà leurs gabarits au démarrage (voir
+`wsgi.py`) ; cette commande sert à échouer tôt, avant de lancer le serveur.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app_acceuil.template_warmup import precompile_templates
+
+
+class Command(BaseCommand):
+    help = "Compile tous les gabarits (chargeur en cache) et échoue sur une erreur de syntaxe."
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        compiled, errors = precompile_templates()
+        elapsed = (time.perf_counter() - start) * 1000
+        self.stdout.write(f"{compiled} gabarit(s) compilé(s) en {elapsed:.0f} ms.")
+        for name, error in errors.items():
+            self.stderr.write(f"{name} : {error}")
+        if errors:
+            raise CommandError(f"{len(errors)} gabarit(s) en erreur.")
@@ -0,0 +1,38 @@
+"""
+Worker d'envoi des emails du formulaire de contact.
+
+Usage:
+    python manage.py send_queued_emails            # boucle infinie (process worker)
+    python manage.py send_queued_emails --once     # un seul passage (cron, tests)
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from app_acceuil.mail_queue import deliver_due_emails
+from app_acceuil.smtp_pool import smtp_pool
+
+
+class Command(BaseCommand):
+    help = "Envoie les emails en file d'attente (OutgoingEmail) avec réessais et délai croissant."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="Un seul passage puis arrêt.")
+        parser.add_argument('--interval', type=float, default=5.0, help="Secondes d'attente quand la file est vide.")
+        parser.add_argument('--batch-size', type=int, default=20, help="Emails traités par passage.")
+
+    def handle(self, *args, **options):
+        try:
+            while True:
+                sent, failed = deliver_due_emails(batch_size=options['batch_size'])
+                if sent or failed:
+                    self.stdout.write(f"{sent} email(s) envoyé(s), {failed} échec(s).")
+                if options['once']:
+                    return
+                if not sent and not failed:
+                    # File vide : ne pas marteler la base
+                    time.sleep(options['interval'])
+        finally:
+            # Les sessions SMTP restent ouvertes entre deux passages
+            smtp_pool.close_all()
@@ -0,0 +1,82 @@
+"""
+Middleware et résolveur du profil courant, partagés par les context
+processors et les vues.
+
+Le profil est résolu une seule fois par requête (à partir des paramètres
+`nom`/`profession` du chemin, sinon le profil par défaut) puis mémorisé sur
+l'objet `request`. Le premier appelant choisit les groupes de configuration
+chargés (voir `SiteProfileManager.with_config`) ; les groupes manquants sont
+chargés à la demande si un gabarit les lit.
+"""
+
+from django.db import DatabaseError, OperationalError
+from django.http import Http404
+from django.utils.functional import SimpleLazyObject
+
+from .models import SiteProfile
+
+
+def get_profile_slug(request):
+    """
+    Construit le slug du profil demandé à partir des paramètres du chemin.
+
+    Returns:
+        str or None: Le slug `nom-profession`, ou None pour le profil par défaut.
+    """
+    resolver_match = getattr(request, 'resolver_match', None)
+    if not resolver_match:
+        return None
+    nom = resolver_match.kwargs.get('nom')
+    profession = resolver_match.kwargs.get('profession')
+    return f"{nom}-{profession}" if nom and profession else None
+
+
+def get_site_profile(request, groups=None):
+    """
+    Retourne le SiteProfile publié correspondant à la requête (ou None).
+
+    Le résultat est mémorisé dans `request._cached_site_profile` : les appels
+    suivants (context processors, vues) ne déclenchent aucune requête SQL.
+    Les erreurs de base de données (migrations non appliquées) donnent None.
+
+    Args:
+        groups (iterable or None): Groupes de configuration à charger si le
+            profil n'est pas encore résolu (None = toutes les colonnes,
+            () = projection étroite pour la navbar et le `<title>`).
+    """
+    if not hasattr(request, '_cached_site_profile'):
+        profile_slug = get_profile_slug(request)
+        try:
+            if profile_slug:
+                try:
+                    profile = SiteProfile.objects.get_by_slug_with_content(profile_slug, groups)
+                except SiteProfile.DoesNotExist:
+                    profile = None
+            else:
+                profile = SiteProfile.objects.get_default_profile(groups)
+        except (OperationalError, DatabaseError):
+            profile = None
+        request._cached_site_profile = profile
+    return request._cached_site_profile
+
+
+def get_profile_or_404(request, groups=None):
+    """
+    Retourne le profil de la requête, ou lève Http404 si un profil spécifique
+    est demandé dans le chemin mais n'existe pas (ou n'est pas publié).
+    """
+    profile = get_site_profile(request, groups)
+    if profile is None and get_profile_slug(request):
+        raise Http404("Aucun profil publié ne correspond à ce chemin.")
+    return profile
+
+
+class SiteProfileMiddleware:
+    """Attache un `request.site_profile` résolu paresseusement."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.site_profile = SimpleLazyObject(lambda: get_site_profile(request, groups=()))
+        return self.get_response(request)
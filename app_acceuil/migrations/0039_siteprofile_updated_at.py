@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-18 08:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_acceuil', '0038_siteprofile_bio_is_active'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='siteprofile',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Date de modification'),
+        ),
+    ]
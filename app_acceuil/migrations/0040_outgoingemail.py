@@ -0,0 +1,38 @@
+# Generated by Django 5.1.6 on 2026-10-18 08:22
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_acceuil', '0039_siteprofile_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutgoingEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=255, verbose_name='Objet')),
+                ('body', models.TextField(verbose_name='Message')),
+                ('from_email', models.EmailField(max_length=254, verbose_name='Expéditeur')),
+                ('recipients', models.JSONField(default=list, verbose_name='Destinataires')),
+                ('status', models.CharField(choices=[('pending', 'En attente'), ('sent', 'Envoyé'), ('failed', 'Échec définitif')], default='pending', max_length=10, verbose_name='Statut')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='Tentatives')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Prochaine tentative')),
+                ('last_error', models.TextField(blank=True, verbose_name='Dernière erreur')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Date de création')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name="Date d'envoi")),
+                ('profile', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='outgoing_emails', to='app_acceuil.siteprofile', verbose_name='Profil expéditeur')),
+            ],
+            options={
+                'verbose_name': "Email en file d'attente",
+                'verbose_name_plural': "Emails en file d'attente",
+                'ordering': ('next_attempt_at', 'pk'),
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='outgoingemail_due_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.6 on 2026-10-18 08:27
+
+from django.db import migrations, models
+
+from app_acceuil.navbar import build_navbar_menu
+
+
+def compute_navbar_menus(apps, schema_editor):
+    """Précalcule le menu de la navbar des profils existants"""
+    SiteProfile = apps.get_model('app_acceuil', 'SiteProfile')
+    for profile in SiteProfile.objects.all():
+        profile.navbar_menu = build_navbar_menu(profile)
+        profile.save(update_fields=['navbar_menu'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_acceuil', '0040_outgoingemail'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='siteprofile',
+            name='navbar_menu',
+            field=models.JSONField(blank=True, default=list, editable=False, verbose_name='Menu de la navbar (calculé)'),
+        ),
+        migrations.RunPython(compute_navbar_menus, migrations.RunPython.noop),
+    ]
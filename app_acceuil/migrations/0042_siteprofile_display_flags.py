@@ -0,0 +1,203 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:12
+
+from django.db import migrations, models
+
+from app_acceuil.display_flags import CONTENT_TYPES, CONTEXTS, METADATA, flag_bit, flag_name, mask_field, pack_flags
+
+
+def pack_display_flags(apps, schema_editor):
+    """Regroupe les 36 booléens d'affichage dans un masque par type de contenu"""
+    SiteProfile = apps.get_model('app_acceuil', 'SiteProfile')
+    for profile in SiteProfile.objects.all():
+        for content_type in CONTENT_TYPES:
+            values = {
+                (metadata, context): getattr(profile, flag_name(content_type, metadata, context))
+                for metadata in METADATA for context in CONTEXTS
+            }
+            setattr(profile, mask_field(content_type), pack_flags(values))
+        profile.save(update_fields=[mask_field(content_type) for content_type in CONTENT_TYPES])
+
+
+def unpack_display_flags(apps, schema_editor):
+    """Retour arrière : redistribue les masques dans les 36 booléens"""
+    SiteProfile = apps.get_model('app_acceuil', 'SiteProfile')
+    for profile in SiteProfile.objects.all():
+        fields = []
+        for content_type in CONTENT_TYPES:
+            mask = getattr(profile, mask_field(content_type))
+            for metadata in METADATA:
+                for context in CONTEXTS:
+                    name = flag_name(content_type, metadata, context)
+                    setattr(profile, name, bool(mask & flag_bit(metadata, context)))
+                    fields.append(name)
+        profile.save(update_fields=fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_acceuil', '0041_siteprofile_navbar_menu'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='siteprofile',
+            name='projects_display_flags',
+            field=models.PositiveIntegerField(default=4095, editable=False, verbose_name='Métadonnées affichées Projets'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='blog_display_flags',
+            field=models.PositiveIntegerField(default=4095, editable=False, verbose_name='Métadonnées affichées Blog'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='services_display_flags',
+            field=models.PositiveIntegerField(default=4095, editable=False, verbose_name='Métadonnées affichées Services'),
+        ),
+        migrations.RunPython(pack_display_flags, unpack_display_flags),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='projects_show_author_home',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='projects_show_author_list',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='projects_show_author_detail',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='projects_show_profession_home',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='projects_show_profession_list',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='projects_show_profession_detail',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='projects_show_publish_date_home',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='projects_show_publish_date_list',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='projects_show_publish_date_detail',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='projects_show_update_date_home',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='projects_show_update_date_list',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='projects_show_update_date_detail',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='blog_show_author_home',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='blog_show_author_list',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='blog_show_author_detail',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='blog_show_profession_home',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='blog_show_profession_list',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='blog_show_profession_detail',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='blog_show_publish_date_home',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='blog_show_publish_date_list',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='blog_show_publish_date_detail',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='blog_show_update_date_home',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='blog_show_update_date_list',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='blog_show_update_date_detail',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='services_show_author_home',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='services_show_author_list',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='services_show_author_detail',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='services_show_profession_home',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='services_show_profession_list',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='services_show_profession_detail',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='services_show_publish_date_home',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='services_show_publish_date_list',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='services_show_publish_date_detail',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='services_show_update_date_home',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='services_show_update_date_list',
+        ),
+        migrations.RemoveField(
+            model_name='siteprofile',
+            name='services_show_update_date_detail',
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_acceuil', '0042_siteprofile_display_flags'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='section',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Date de modification'),
+        ),
+        migrations.AddField(
+            model_name='sectionitem',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, verbose_name='Date de modification'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.6 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_acceuil', '0043_section_updated_at'),
+        ('app_blog', '0010_blogpost_app_blog_blogpost_pub_idx'),
+        ('app_projet', '0008_project_app_projet_project_pub_idx'),
+        ('app_service', '0007_service_app_service_service_pub_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(fields=['profile', 'order'], name='education_profile_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(fields=['profile', 'order'], name='experience_profile_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='section',
+            index=models.Index(fields=['profile', 'order'], name='section_profile_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sectionitem',
+            index=models.Index(fields=['section', 'order'], name='sectionitem_section_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='siteprofile',
+            index=models.Index(condition=models.Q(('is_default', True), ('is_published', True)), fields=['id'], name='siteprofile_default_idx'),
+        ),
+    ]
@@ -0,0 +1,223 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_acceuil', '0044_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='education',
+            name='icon_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Icône : couleur moyenne'),
+        ),
+        migrations.AddField(
+            model_name='education',
+            name='icon_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Icône : hauteur'),
+        ),
+        migrations.AddField(
+            model_name='education',
+            name='icon_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Icône : largeur'),
+        ),
+        migrations.AddField(
+            model_name='experience',
+            name='icon_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Icône : couleur moyenne'),
+        ),
+        migrations.AddField(
+            model_name='experience',
+            name='icon_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Icône : hauteur'),
+        ),
+        migrations.AddField(
+            model_name='experience',
+            name='icon_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Icône : largeur'),
+        ),
+        migrations.AddField(
+            model_name='section',
+            name='title_image_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Image du titre : couleur moyenne'),
+        ),
+        migrations.AddField(
+            model_name='section',
+            name='title_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image du titre : hauteur'),
+        ),
+        migrations.AddField(
+            model_name='section',
+            name='title_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image du titre : largeur'),
+        ),
+        migrations.AddField(
+            model_name='sectionitem',
+            name='icon_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Icône : couleur moyenne'),
+        ),
+        migrations.AddField(
+            model_name='sectionitem',
+            name='icon_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Icône : hauteur'),
+        ),
+        migrations.AddField(
+            model_name='sectionitem',
+            name='icon_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Icône : largeur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='bio_title_image_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Image du titre Bio : couleur moyenne'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='bio_title_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image du titre Bio : hauteur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='bio_title_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image du titre Bio : largeur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='blog_home_image_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Image section Blog (Accueil) : couleur moyenne'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='blog_home_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image section Blog (Accueil) : hauteur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='blog_home_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image section Blog (Accueil) : largeur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='blog_page_image_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Image page liste Blog : couleur moyenne'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='blog_page_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image page liste Blog : hauteur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='blog_page_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image page liste Blog : largeur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='contact_title_image_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Image du titre Contact : couleur moyenne'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='contact_title_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image du titre Contact : hauteur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='contact_title_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image du titre Contact : largeur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='navbar_avatar_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Avatar navbar : couleur moyenne'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='navbar_avatar_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Avatar navbar : hauteur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='navbar_avatar_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Avatar navbar : largeur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='profile_photo_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Photo de profil : couleur moyenne'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='profile_photo_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Photo de profil : hauteur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='profile_photo_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Photo de profil : largeur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='projects_home_image_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Image section Projets (Accueil) : couleur moyenne'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='projects_home_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image section Projets (Accueil) : hauteur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='projects_home_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image section Projets (Accueil) : largeur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='projects_page_image_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Image page liste Projets : couleur moyenne'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='projects_page_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image page liste Projets : hauteur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='projects_page_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image page liste Projets : largeur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='services_home_image_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Image section Services (Accueil) : couleur moyenne'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='services_home_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image section Services (Accueil) : hauteur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='services_home_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image section Services (Accueil) : largeur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='services_page_image_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Image page liste Services : couleur moyenne'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='services_page_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image page liste Services : hauteur'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='services_page_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image page liste Services : largeur'),
+        ),
+    ]
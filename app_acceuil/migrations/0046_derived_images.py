@@ -0,0 +1,83 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_acceuil', '0045_image_metadata'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='education',
+            name='icon_responsive',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Icône : déclinaisons WebP'),
+        ),
+        migrations.AddField(
+            model_name='experience',
+            name='icon_responsive',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Icône : déclinaisons WebP'),
+        ),
+        migrations.AddField(
+            model_name='section',
+            name='title_image_responsive',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Image du titre : déclinaisons WebP'),
+        ),
+        migrations.AddField(
+            model_name='sectionitem',
+            name='icon_responsive',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Icône : déclinaisons WebP'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='bio_title_image_responsive',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Image du titre Bio : déclinaisons WebP'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='blog_home_image_responsive',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Image section Blog (Accueil) : déclinaisons WebP'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='blog_page_image_responsive',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Image page liste Blog : déclinaisons WebP'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='contact_title_image_responsive',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Image du titre Contact : déclinaisons WebP'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='navbar_avatar_responsive',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Avatar navbar : déclinaisons WebP'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='profile_photo_responsive',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Photo de profil : déclinaisons WebP'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='projects_home_image_responsive',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Image section Projets (Accueil) : déclinaisons WebP'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='projects_page_image_responsive',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Image page liste Projets : déclinaisons WebP'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='services_home_image_responsive',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Image section Services (Accueil) : déclinaisons WebP'),
+        ),
+        migrations.AddField(
+            model_name='siteprofile',
+            name='services_page_image_responsive',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Image page liste Services : déclinaisons WebP'),
+        ),
+    ]
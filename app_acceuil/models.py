@@ -1,40 +1,82 @@
 from django.db import models
+from django.db.models import Q
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from ckeditor_uploader.fields import RichTextUploadingField
 
+from .display_flags import ALL_FLAGS, FLAGS, DisplayFlag
+from .images import add_metadata_fields
+from .navbar import NAVBAR_FIELDS, build_navbar_menu, navbar_state, ordered_sections
+from .profile_cache import get_or_load_profile
+from .slugs import unique_slug
+
+
+def _cache_name(name, groups):
+	"""Une entrée de cache par projection (toutes les colonnes, ou groupes listés)."""
+	return name if groups is None else f"{name}:{','.join(sorted(groups)) or 'core'}"
+
 
 class SiteProfileManager(models.Manager):
 	"""Custom manager for SiteProfile with optimized queries."""
 	
-	def get_published_with_content(self):
+	def with_config(self, groups=None):
+		"""
+		Narrow projection: core columns plus the requested configuration groups.
+		
+		Fields of the other groups (see `CONFIG_GROUPS`) are deferred; reading
+		one of them later loads its whole group with a single query.
+		
+		Args:
+			groups (iterable or None): Group names (ex: ('blog',)); None loads every column.
+		"""
+		if groups is None:
+			return self.all()
+		return self.only(*CORE_FIELDS, *(field for group in groups for field in CONFIG_GROUPS[group]))
+	
+	def get_published_with_content(self, groups=None):
 		"""
 		Get published profiles with all related content prefetched.
 		
+		Args:
+			groups (iterable or None): Configuration groups to load (None = all).
+		
 		Returns:
 			QuerySet: Optimized queryset with prefetch_related for all M2M relationships.
 		"""
-		return self.prefetch_related(
+		return self.with_config(groups).prefetch_related(
 			'sections__items',
 			'featured_projects', 'published_projects',
 			'featured_articles', 'published_articles',
 			'featured_services', 'published_services'
 		).filter(is_published=True)
 	
-	def get_default_profile(self):
+	def get_default_profile(self, groups=None):
 		"""
 		Get the default profile (is_default=True) with all content.
 		
+		The hydrated profile is served from the versioned profile cache
+		(see `profile_cache.py`) and only loaded from the database on a miss.
+		
+		Args:
+			groups (iterable or None): Configuration groups to load (None = all).
+		
 		Returns:
 			SiteProfile or None: The default profile if exists, None otherwise.
 		"""
-		return self.get_published_with_content().filter(is_default=True).first()
+		return get_or_load_profile(
+			_cache_name("default", groups),
+			lambda: self.get_published_with_content(groups).filter(is_default=True).first(),
+		)
 	
-	def get_by_slug_with_content(self, slug):
+	def get_by_slug_with_content(self, slug, groups=None):
 		"""
 		Get a specific profile by slug with all content prefetched.
 		
+		Served from the versioned profile cache like `get_default_profile()`.
+		
 		Args:
 			slug (str): The profile slug.
+			groups (iterable or None): Configuration groups to load (None = all).
 			
 		Returns:
 			SiteProfile: The profile instance.
@@ -42,7 +84,13 @@ class SiteProfileManager(models.Manager):
 		Raises:
 			SiteProfile.DoesNotExist: If no profile with this slug exists.
 		"""
-		return self.get_published_with_content().get(slug=slug)
+		profile = get_or_load_profile(
+			_cache_name(f"slug:{slug}", groups),
+			lambda: self.get_published_with_content(groups).filter(slug=slug).first(),
+		)
+		if profile is None:
+			raise self.model.DoesNotExist(f"No published SiteProfile with slug '{slug}'.")
+		return profile
 
 
 class SiteProfile(models.Model):
@@ -150,47 +198,11 @@ class SiteProfile(models.Model):
 	enable_confirmation_email = models.BooleanField(default=True, verbose_name=_("Envoyer un email de confirmation à l'expéditeur"))
 	gmail_app_password = models.CharField(max_length=100, blank=True, verbose_name=_("Mot de passe d'application Gmail"), help_text=_("Requis pour envoyer des emails. Créez-le sur https://myaccount.google.com/apppasswords"))
 
-	# Configuration Projets - Affichage des métadonnées
-	projects_show_author_home = models.BooleanField(default=True, verbose_name=_("Auteur"))
-	projects_show_author_list = models.BooleanField(default=True, verbose_name=_("Auteur"))
-	projects_show_author_detail = models.BooleanField(default=True, verbose_name=_("Auteur"))
-	projects_show_profession_home = models.BooleanField(default=True, verbose_name=_("Profession"))
-	projects_show_profession_list = models.BooleanField(default=True, verbose_name=_("Profession"))
-	projects_show_profession_detail = models.BooleanField(default=True, verbose_name=_("Profession"))
-	projects_show_publish_date_home = models.BooleanField(default=True, verbose_name=_("Date pub"))
-	projects_show_publish_date_list = models.BooleanField(default=True, verbose_name=_("Date pub"))
-	projects_show_publish_date_detail = models.BooleanField(default=True, verbose_name=_("Date pub"))
-	projects_show_update_date_home = models.BooleanField(default=True, verbose_name=_("Date MAJ"))
-	projects_show_update_date_list = models.BooleanField(default=True, verbose_name=_("Date MAJ"))
-	projects_show_update_date_detail = models.BooleanField(default=True, verbose_name=_("Date MAJ"))
-	
-	# Configuration Blog - Affichage des métadonnées
-	blog_show_author_home = models.BooleanField(default=True, verbose_name=_("Auteur"))
-	blog_show_author_list = models.BooleanField(default=True, verbose_name=_("Auteur"))
-	blog_show_author_detail = models.BooleanField(default=True, verbose_name=_("Auteur"))
-	blog_show_profession_home = models.BooleanField(default=True, verbose_name=_("Profession"))
-	blog_show_profession_list = models.BooleanField(default=True, verbose_name=_("Profession"))
-	blog_show_profession_detail = models.BooleanField(default=True, verbose_name=_("Profession"))
-	blog_show_publish_date_home = models.BooleanField(default=True, verbose_name=_("Date pub"))
-	blog_show_publish_date_list = models.BooleanField(default=True, verbose_name=_("Date pub"))
-	blog_show_publish_date_detail = models.BooleanField(default=True, verbose_name=_("Date pub"))
-	blog_show_update_date_home = models.BooleanField(default=True, verbose_name=_("Date MAJ"))
-	blog_show_update_date_list = models.BooleanField(default=True, verbose_name=_("Date MAJ"))
-	blog_show_update_date_detail = models.BooleanField(default=True, verbose_name=_("Date MAJ"))
-	
-	# Configuration Services - Affichage des métadonnées
-	services_show_author_home = models.BooleanField(default=True, verbose_name=_("Auteur"))
-	services_show_author_list = models.BooleanField(default=True, verbose_name=_("Auteur"))
-	services_show_author_detail = models.BooleanField(default=True, verbose_name=_("Auteur"))
-	services_show_profession_home = models.BooleanField(default=True, verbose_name=_("Profession"))
-	services_show_profession_list = models.BooleanField(default=True, verbose_name=_("Profession"))
-	services_show_profession_detail = models.BooleanField(default=True, verbose_name=_("Profession"))
-	services_show_publish_date_home = models.BooleanField(default=True, verbose_name=_("Date pub"))
-	services_show_publish_date_list = models.BooleanField(default=True, verbose_name=_("Date pub"))
-	services_show_publish_date_detail = models.BooleanField(default=True, verbose_name=_("Date pub"))
-	services_show_update_date_home = models.BooleanField(default=True, verbose_name=_("Date MAJ"))
-	services_show_update_date_list = models.BooleanField(default=True, verbose_name=_("Date MAJ"))
-	services_show_update_date_detail = models.BooleanField(default=True, verbose_name=_("Date MAJ"))
+	# Affichage des métadonnées (auteur, profession, dates) : un masque de 12 bits
+	# par type de contenu, cases « métadonnée × contexte » (voir display_flags.py)
+	projects_display_flags = models.PositiveIntegerField(default=ALL_FLAGS, editable=False, verbose_name=_("Métadonnées affichées Projets"))
+	blog_display_flags = models.PositiveIntegerField(default=ALL_FLAGS, editable=False, verbose_name=_("Métadonnées affichées Blog"))
+	services_display_flags = models.PositiveIntegerField(default=ALL_FLAGS, editable=False, verbose_name=_("Métadonnées affichées Services"))
 
 	# Relations Many-to-Many pour choisir les contenus à publier par profil
 	# Importation dynamique pour éviter les imports circulaires
@@ -210,10 +222,39 @@ class SiteProfile(models.Model):
 		help_text=_("Choisir si la barre de navigation doit être à gauche ou à droite")
 	)
 
+	# Menu de la navbar précalculé à l'enregistrement (voir navbar.py)
+	navbar_menu = models.JSONField(default=list, blank=True, editable=False, verbose_name=_("Menu de la navbar (calculé)"))
+
+	# Date de dernière modification (profil, sections ou contenus associés)
+	updated_at = models.DateTimeField(auto_now=True, verbose_name=_("Date de modification"))
+
 	class Meta:
 		verbose_name = _("Profil du site")
+		# Résolution du profil par défaut publié (middleware, context processors) :
+		# index partiel, car SQLite n'utilise pas un index de colonnes pour `WHERE is_published AND is_default`
+		indexes = [
+			models.Index(fields=["id"], condition=Q(is_published=True, is_default=True), name="siteprofile_default_idx"),
+		]
 		verbose_name_plural = _("Profils du site")
 
+	def refresh_from_db(self, using=None, fields=None, **kwargs):
+		# Lecture d'un champ différé : charger tout son groupe en une requête
+		if fields is not None:
+			fields = set(fields)
+			deferred = self.get_deferred_fields()
+			for group_fields in CONFIG_GROUPS.values():
+				if fields.intersection(group_fields):
+					fields |= deferred.intersection(group_fields)
+		super().refresh_from_db(using=using, fields=fields, **kwargs)
+
+	@classmethod
+	def from_db(cls, db, field_names, values):
+		instance = super().from_db(db, field_names, values)
+		# État chargé des champs du menu : save() ne recalcule que s'ils changent
+		loaded = not instance.get_deferred_fields().intersection(NAVBAR_FIELDS)
+		instance._loaded_navbar_state = navbar_state(instance) if loaded else None
+		return instance
+
 	def __str__(self) -> str:
 		default_marker = "⭐ " if self.is_default else ""
 		published_marker = "📢 " if self.is_published else "🔒 "
@@ -234,28 +275,28 @@ class SiteProfile(models.Model):
 		from django.utils.text import slugify
 		base_slug = slugify(f"{self.first_name or 'prenom'}-{self.last_name or 'nom'}-{self.profession or 'profil'}")
 		
-		# Vérifier l'unicité du slug et ajouter un numéro si nécessaire
-		slug = base_slug
-		counter = 1
-		while SiteProfile.objects.filter(slug=slug).exclude(pk=self.pk).exists():
-			slug = f"{base_slug}-{counter}"
-			counter += 1
-		self.slug = slug
+		# Premier slug libre (base, base-1, ...) trouvé en une seule requête
+		self.slug = unique_slug(SiteProfile, base_slug, exclude_pk=self.pk)
+		
+		# Recalculer le menu de la navbar seulement si ses champs ont changé
+		state = navbar_state(self)
+		if not self.navbar_menu or state != getattr(self, '_loaded_navbar_state', None):
+			self.navbar_menu = build_navbar_menu(self)
+			if kwargs.get('update_fields') is not None:
+				kwargs['update_fields'] = {*kwargs['update_fields'], 'navbar_menu'}
 		
 		# Si ce profil est défini comme défaut, retirer le défaut des autres
+		# (un par un : leur menu passe aux URLs /profil/...)
 		if self.is_default:
-			SiteProfile.objects.filter(is_default=True).exclude(pk=self.pk).update(is_default=False)
+			for other in SiteProfile.objects.filter(is_default=True).exclude(pk=self.pk):
+				other.is_default = False
+				other.save(update_fields=['is_default'])
 		super().save(*args, **kwargs)
+		self._loaded_navbar_state = state
 
 	def get_ordered_sections(self):
 		"""Retourne les sections principales dans l'ordre configuré (pour navbar et page d'accueil)"""
-		sections = [
-			{'type': 'projects', 'order': self.projects_display_order, 'in_navbar': True},
-			{'type': 'blog', 'order': self.blog_display_order, 'in_navbar': True},
-			{'type': 'services', 'order': self.services_display_order, 'in_navbar': True},
-			{'type': 'contact', 'order': self.contact_display_order, 'in_navbar': False},
-		]
-		return sorted(sections, key=lambda x: x['order'])
+		return ordered_sections(self)
 
 	@property
 	def initials(self):
@@ -267,6 +308,40 @@ class SiteProfile(models.Model):
 		return "".join(parts) or "U"
 
 
+# Anciens booléens `<type>_show_<metadonnee>_<contexte>` : propriétés sur les masques
+for _name, _field, _bit in FLAGS:
+	setattr(SiteProfile, _name, DisplayFlag(_field, _bit))
+del _name, _field, _bit
+
+# Largeur, hauteur et couleur moyenne des images (`<champ>_width`, ...), voir images.py
+add_metadata_fields(SiteProfile)
+
+
+# Groupes de configuration par section, chargés seulement par les pages qui
+# les affichent (libellés, intros, images, options d'affichage). Les libellés
+# de navbar et les ordres d'affichage restent dans le tronc commun (menu).
+CONFIG_GROUP_PREFIXES = {
+	'bio': 'bio',
+	'projects': 'projects_',
+	'blog': 'blog_',
+	'services': 'services_',
+	'contact': 'contact_',
+}
+CONFIG_GROUPS = {
+	group: tuple(
+		field.name for field in SiteProfile._meta.concrete_fields
+		if field.name.startswith(prefix) and field.name not in NAVBAR_FIELDS
+	)
+	for group, prefix in CONFIG_GROUP_PREFIXES.items()
+}
+CONFIG_GROUPS['contact'] += ('enable_confirmation_email', 'gmail_app_password')
+# Tronc commun : identité, navbar, <head>, liens sociaux, menu précalculé
+CORE_FIELDS = tuple(
+	field.name for field in SiteProfile._meta.concrete_fields
+	if not any(field.name in fields for fields in CONFIG_GROUPS.values())
+)
+
+
 class Education(models.Model):
 	profile = models.ForeignKey(SiteProfile, on_delete=models.CASCADE, related_name="educations")
 	title = models.CharField(max_length=255, verbose_name=_("Titre de la formation"))
@@ -280,6 +355,7 @@ class Education(models.Model):
 	class Meta:
 		ordering = ("order",)
 		verbose_name = _("Formation")
+		indexes = [models.Index(fields=["profile", "order"], name="education_profile_order_idx")]
 		verbose_name_plural = _("Formations")
 
 	def __str__(self) -> str:
@@ -300,6 +376,7 @@ class Experience(models.Model):
 	class Meta:
 		ordering = ("order",)
 		verbose_name = _("Expérience")
+		indexes = [models.Index(fields=["profile", "order"], name="experience_profile_order_idx")]
 		verbose_name_plural = _("Expériences")
 
 	def __str__(self) -> str:
@@ -324,10 +401,13 @@ class Section(models.Model):
 	title_image = models.ImageField(upload_to="section_images/", blank=True, null=True, verbose_name=_("Image du titre"))
 	is_active = models.BooleanField(default=True, verbose_name=_("Afficher cette section"))
 	order = models.PositiveIntegerField(default=0, verbose_name=_("Ordre d'affichage"))
+	# Date de dernière modification (section ou un de ses éléments, voir section_cache.py)
+	updated_at = models.DateTimeField(auto_now=True, verbose_name=_("Date de modification"))
 
 	class Meta:
 		ordering = ("order",)
 		verbose_name = _("Section")
+		indexes = [models.Index(fields=["profile", "order"], name="section_profile_order_idx")]
 		verbose_name_plural = _("Sections")
 
 	def __str__(self) -> str:
@@ -345,13 +425,56 @@ class SectionItem(models.Model):
 	# Détails riches optionnels, similaires à Formation/Expérience
 	details = RichTextUploadingField(blank=True, null=True, verbose_name=_("Détails"))
 	order = models.PositiveIntegerField(default=0, verbose_name=_("Ordre"))
+	updated_at = models.DateTimeField(auto_now=True, verbose_name=_("Date de modification"))
 
 	class Meta:
 		ordering = ("order",)
 		verbose_name = _("Élément de section")
+		indexes = [models.Index(fields=["section", "order"], name="sectionitem_section_order_idx")]
 		verbose_name_plural = _("Éléments de section")
 
 	def __str__(self) -> str:
 		return f"{self.section.title} - {self.title}"
 
 
+for _model in (Education, Experience, Section, SectionItem):
+	add_metadata_fields(_model)
+del _model
+
+
+class OutgoingEmail(models.Model):
+	"""Email en attente d'envoi (boîte d'envoi persistante du formulaire de contact).
+
+	La vue `contact` se contente d'enregistrer les messages ; la commande
+	`send_queued_emails` les envoie en arrière-plan avec les identifiants
+	Gmail du profil, en réessayant avec un délai croissant (voir `mail_queue.py`).
+	"""
+	STATUS_PENDING = 'pending'
+	STATUS_SENT = 'sent'
+	STATUS_FAILED = 'failed'
+	STATUS_CHOICES = (
+		(STATUS_PENDING, _("En attente")),
+		(STATUS_SENT, _("Envoyé")),
+		(STATUS_FAILED, _("Échec définitif")),
+	)
+
+	profile = models.ForeignKey(SiteProfile, on_delete=models.SET_NULL, null=True, blank=True, related_name="outgoing_emails", verbose_name=_("Profil expéditeur"))
+	subject = models.CharField(max_length=255, verbose_name=_("Objet"))
+	body = models.TextField(verbose_name=_("Message"))
+	from_email = models.EmailField(verbose_name=_("Expéditeur"))
+	recipients = models.JSONField(default=list, verbose_name=_("Destinataires"))
+	status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING, verbose_name=_("Statut"))
+	attempts = models.PositiveSmallIntegerField(default=0, verbose_name=_("Tentatives"))
+	next_attempt_at = models.DateTimeField(default=timezone.now, verbose_name=_("Prochaine tentative"))
+	last_error = models.TextField(blank=True, verbose_name=_("Dernière erreur"))
+	created_at = models.DateTimeField(auto_now_add=True, verbose_name=_("Date de création"))
+	sent_at = models.DateTimeField(null=True, blank=True, verbose_name=_("Date d'envoi"))
+
+	class Meta:
+		ordering = ("next_attempt_at", "pk")
+		indexes = [models.Index(fields=["status", "next_attempt_at"], name="outgoingemail_due_idx")]
+		verbose_name = _("Email en file d'attente")
+		verbose_name_plural = _("Emails en file d'attente")
+
+	def __str__(self) -> str:
+		return f"{self.subject} → {', '.join(self.recipients)} ({self.get_status_display()})"
@@ -0,0 +1,70 @@
+"""
+Menu de la navbar, précalculé à l'enregistrement du profil.
+
+`SiteProfile.save()` stocke le résultat de `build_navbar_menu()` dans le
+champ JSON `navbar_menu` lorsque l'un des champs de `NAVBAR_FIELDS` change :
+le context processor `menu_items` n'a plus qu'à le renvoyer. Les fonctions
+n'utilisent que des champs simples pour servir aussi dans les migrations
+(modèles historiques, sans méthodes).
+"""
+
+from django.utils.text import slugify
+
+# Champs dont dépend le menu (libellés, ordres d'affichage, noms dans les URLs)
+NAVBAR_FIELDS = (
+    'first_name', 'last_name', 'profession', 'is_default',
+    'projects_navbar_label', 'blog_navbar_label', 'services_navbar_label',
+    'projects_display_order', 'blog_display_order', 'services_display_order', 'contact_display_order',
+)
+
+# Menu utilisé sans profil (ou pendant les migrations initiales)
+DEFAULT_MENU = [
+    {"name": "acceuil", "label": "Accueil", "url": "/"},
+    {"name": "service_list", "label": "Services", "url": "/services/"},
+    {"name": "projet_list", "label": "Projets", "url": "/projets/"},
+    {"name": "blogue_list", "label": "Blogue", "url": "/blogue/"},
+]
+
+
+def ordered_sections(profile):
+    """Sections principales dans l'ordre configuré (pour navbar et page d'accueil)."""
+    sections = [
+        {'type': 'projects', 'order': profile.projects_display_order, 'in_navbar': True},
+        {'type': 'blog', 'order': profile.blog_display_order, 'in_navbar': True},
+        {'type': 'services', 'order': profile.services_display_order, 'in_navbar': True},
+        {'type': 'contact', 'order': profile.contact_display_order, 'in_navbar': False},
+    ]
+    return sorted(sections, key=lambda x: x['order'])
+
+
+def build_navbar_menu(profile):
+    """Liste des entrées `{"name", "label", "url"}` de la navbar du profil."""
+    section_config = {
+        'projects': {'name': 'projet_list', 'profile_name': 'profile_projet_list', 'label': profile.projects_navbar_label or "Projets", 'default_path': '/projets/', 'profile_path': '/projets/'},
+        'blog': {'name': 'blogue_list', 'profile_name': 'profile_blogue_list', 'label': profile.blog_navbar_label or "Blogue", 'default_path': '/blogue/', 'profile_path': '/blog/'},
+        'services': {'name': 'service_list', 'profile_name': 'profile_service_list', 'label': profile.services_navbar_label or "Services", 'default_path': '/services/', 'profile_path': '/services/'},
+    }
+    sections = [s for s in ordered_sections(profile) if s['in_navbar']]
+
+    if profile.is_default:
+        items = [{"name": "acceuil", "label": "Accueil", "url": "/"}]
+        for section in sections:
+            config = section_config[section['type']]
+            items.append({"name": config['name'], "label": config['label'], "url": config['default_path']})
+        return items
+
+    # Utiliser les paramètres dans le chemin
+    nom_slug = slugify(f"{profile.first_name}-{profile.last_name}")
+    profession_slug = slugify(profile.profession) if profile.profession else "profil"
+    base_path = f"/profil/nom={nom_slug}&profession={profession_slug}"
+
+    items = [{"name": "profile_home", "label": "Accueil", "url": f"{base_path}/"}]
+    for section in sections:
+        config = section_config[section['type']]
+        items.append({"name": config['profile_name'], "label": config['label'], "url": f"{base_path}{config['profile_path']}"})
+    return items
+
+
+def navbar_state(profile):
+    """Valeurs des champs de `NAVBAR_FIELDS`, pour détecter un changement."""
+    return tuple(getattr(profile, field) for field in NAVBAR_FIELDS)
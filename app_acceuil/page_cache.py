@@ -0,0 +1,265 @@
+"""
+Cache de pages complètes pour les pages publiques (accueil, listes, détails).
+
+Le cache est optionnel : il n'est actif que si `PAGE_CACHE_TIMEOUT` est
+strictement positif. Chaque page dépend d'un petit ensemble d'étiquettes
+(« tags ») dont la version fait partie de la clé de cache :
+
+- `profile:<slug>`            : le profil affiché (champs, sections, contenus liés)
+- `type:<app_label.model>`    : n'importe quel contenu de ce type (listes, accueil)
+- `item:<app_label.model>:<slug>` : un contenu précis (page de détail)
+
+Les signaux de `signals.py` incrémentent uniquement les étiquettes touchées
+par une modification dans l'admin : les autres pages restent en cache.
+
+La clé ne retient de l'URL que le chemin et les paramètres lus par les vues
+(`CACHED_QUERY_PARAMS`) : `?utm_source=...` ou tout autre paramètre ne crée
+pas de nouvelle entrée, sans quoi des URL arbitraires rempliraient le cache
+partagé et en chasseraient les vraies pages.
+"""
+
+import hashlib
+import re
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.utils.cache import add_never_cache_headers, get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag, urlencode
+
+from .middleware import get_profile_or_404
+
+TAG_KEY_PREFIX = "page:tag:"
+CSRF_PLACEHOLDER = "__PAGE_CACHE_CSRF_TOKEN__"
+CSRF_INPUT_RE = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+# Paramètres qui changent le contenu d'une page publique (pagination, recherche)
+CACHED_QUERY_PARAMS = ("cursor", "page", "q")
+
+
+def page_cache_timeout():
+    """Durée de vie des pages en cache (0 = cache désactivé)."""
+    return getattr(settings, "PAGE_CACHE_TIMEOUT", 0)
+
+
+def profile_tag(profile):
+    return f"profile:{profile.slug if profile else '-'}"
+
+
+def type_tag(model):
+    return f"type:{model._meta.label_lower}"
+
+
+def item_tag(model, slug):
+    return f"item:{model._meta.label_lower}:{slug}"
+
+
+def content_etag(*parts):
+    """ETag fort dérivé des éléments qui déterminent le contenu d'une page."""
+    return quote_etag(hashlib.md5("|".join(str(part) for part in parts).encode()).hexdigest())
+
+
+def bump_page_tags(*tags):
+    """Invalide toutes les pages qui dépendent d'une des étiquettes."""
+    for tag in tags:
+        key = TAG_KEY_PREFIX + tag
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 2, timeout=None)
+
+
+def _tag_versions(tags):
+    versions = cache.get_many([TAG_KEY_PREFIX + tag for tag in tags])
+    return [f"{tag}={versions.get(TAG_KEY_PREFIX + tag, 1)}" for tag in tags]
+
+
+def _should_bypass(request):
+    """Les requêtes non anonymes ou porteuses de messages ne sont pas mises en cache."""
+    if request.method not in ("GET", "HEAD"):
+        return True
+    if settings.SESSION_COOKIE_NAME in request.COOKIES:
+        # Administrateurs connectés (ou messages stockés en session)
+        return True
+    return "messages" in request.COOKIES
+
+
+def page_cache_path(request):
+    """Chemin et paramètres de `CACHED_QUERY_PARAMS` (triés) qui identifient la page."""
+    params = [(name, request.GET.getlist(name)) for name in CACHED_QUERY_PARAMS if name in request.GET]
+    return f"{request.path}?{urlencode(params, doseq=True)}" if params else request.path
+
+
+def latest_update(profile, *models):
+    """Date de modification la plus récente entre le profil et les modèles listés."""
+    stamps = [profile.updated_at] if profile else []
+    for model in models:
+        stamps.append(model.objects.aggregate(latest=Max("updated_at"))["latest"])
+    stamps = [stamp for stamp in stamps if stamp]
+    return max(stamps) if stamps else None
+
+
+def _set_validators(response, etag, last_modified):
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    # Les navigateurs peuvent conserver la page mais doivent la revalider
+    patch_cache_control(response, no_cache=True, must_revalidate=True, max_age=0)
+
+
+def not_modified_response(request, etag, last_modified):
+    """
+    Retourne une réponse 304 si le client possède déjà cette version, sinon None.
+
+    Args:
+        request: La requête courante (seuls GET et HEAD sont concernés).
+        etag (str): Validateur de la page, déjà entre guillemets.
+        last_modified (float or None): Horodatage POSIX de dernière modification.
+    """
+    if request.method not in ("GET", "HEAD"):
+        return None
+    response = get_conditional_response(
+        request, etag=etag, last_modified=last_modified and int(last_modified)
+    )
+    if response is not None:
+        _set_validators(response, etag, last_modified)
+    return response
+
+
+def cached_public_page(request, profile, tags, render, get_last_modified, never_cache=False, validators=None):
+    """
+    Sert une page publique depuis le cache, ou la génère et la met en cache.
+
+    Args:
+        request: La requête courante.
+        profile: Le SiteProfile affiché (ou None).
+        tags (list[str]): Étiquettes dont dépend la page.
+        render (callable): Génère la réponse (appelé seulement en cas d'absence).
+        get_last_modified (callable): Retourne le datetime de dernière
+            modification (appelé seulement en cas d'absence).
+        never_cache (bool): Ajouter les en-têtes `never_cache` aux réponses
+            qui ne passent pas par le cache.
+        validators (tuple or None): `(etag, last_modified)` calculés avant le
+            rendu ; permettent de répondre 304 même sans cache de pages.
+
+    Returns:
+        HttpResponse: La réponse complète, ou 304 si le client est à jour.
+    """
+    if validators is not None:
+        etag, last_modified = validators
+        last_modified = last_modified.timestamp() if last_modified else None
+        not_modified = not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            # Le client est à jour : aucun gabarit n'est rendu
+            return not_modified
+
+    timeout = page_cache_timeout()
+    if not timeout or _should_bypass(request):
+        response = render()
+        if validators is not None and response.status_code == 200:
+            _set_validators(response, etag, last_modified)
+        elif never_cache:
+            add_never_cache_headers(response)
+        return response
+
+    raw_key = "|".join([page_cache_path(request), profile_tag(profile), *_tag_versions(tags)])
+    key = "page:" + hashlib.md5(raw_key.encode()).hexdigest()
+    entry = cache.get(key)
+
+    if entry is None:
+        response = render()
+        if response.status_code != 200 or response.streaming:
+            if never_cache:
+                add_never_cache_headers(response)
+            return response
+        if hasattr(response, "render"):
+            response.render()
+
+        if validators is None:
+            last_modified = get_last_modified()
+            etag = content_etag(raw_key, last_modified)
+            last_modified = last_modified.timestamp() if last_modified else None
+        content = response.content.decode(response.charset)
+        match = CSRF_INPUT_RE.search(content)
+        if match:
+            content = content.replace(match.group(1), CSRF_PLACEHOLDER)
+        entry = {
+            "content": content,
+            "content_type": response["Content-Type"],
+            "etag": etag,
+            "last_modified": last_modified,
+            "uses_csrf": bool(match),
+        }
+        cache.set(key, entry, timeout=timeout)
+        _set_validators(response, entry["etag"], entry["last_modified"])
+        return response
+
+    not_modified = not_modified_response(request, entry["etag"], entry["last_modified"])
+    if not_modified is not None:
+        return not_modified
+
+    content = entry["content"]
+    if entry["uses_csrf"]:
+        # Jeton propre à chaque visiteur ; CsrfViewMiddleware posera le cookie
+        content = content.replace(CSRF_PLACEHOLDER, get_token(request))
+    response = HttpResponse(content, content_type=entry["content_type"])
+    _set_validators(response, entry["etag"], entry["last_modified"])
+    return response
+
+
+def cache_public_page(*models):
+    """
+    Décorateur pour les vues fonctionnelles des pages d'accueil de profil.
+
+    La page dépend du profil courant et de tous les contenus des `models`.
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            profile = get_profile_or_404(request)
+            return cached_public_page(
+                request,
+                profile,
+                [profile_tag(profile), *(type_tag(model) for model in models)],
+                lambda: view_func(request, *args, **kwargs),
+                lambda: latest_update(profile, *models),
+            )
+        return _wrapped_view
+    return decorator
+
+
+class PublicPageCacheMixin:
+    """
+    Mixin pour les vues génériques de contenu : cache de page optionnel et,
+    quand il est désactivé, en-têtes `never_cache` comme auparavant.
+
+    Les sous-classes définissent `get_page_cache_tags(profile)` et
+    `get_last_modified(profile)`, et éventuellement `get_validators(profile)`
+    pour répondre aux requêtes conditionnelles avant tout rendu.
+    """
+
+    # Groupes de configuration du profil chargés pour la page (None = tous)
+    profile_config_groups = None
+
+    def get_page_cache_tags(self, profile):
+        return [profile_tag(profile), type_tag(self.model)]
+
+    def get_last_modified(self, profile):
+        return latest_update(profile, self.model)
+
+    def get_validators(self, profile):
+        return None
+
+    def dispatch(self, request, *args, **kwargs):
+        profile = get_profile_or_404(request, self.profile_config_groups)
+        return cached_public_page(
+            request,
+            profile,
+            self.get_page_cache_tags(profile),
+            lambda: super(PublicPageCacheMixin, self).dispatch(request, *args, **kwargs),
+            lambda: self.get_last_modified(profile),
+            never_cache=True,
+            validators=self.get_validators(profile),
+        )
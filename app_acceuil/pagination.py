@@ -0,0 +1,128 @@
+"""
+Pagination par curseur (« keyset ») des listes de contenus publiables.
+
+La pagination par numéro de page (`paginate_by` de ListView) compte les
+éléments (`COUNT(*)`) puis saute les pages précédentes (`OFFSET`) : le coût
+croît avec le nombre d'articles. Ici, chaque page est lue à partir du dernier
+élément affiché, selon l'ordre `(published_at, id)` décroissant :
+
+    WHERE published_at <= :date AND (published_at < :date OR id < :id)
+    ORDER BY published_at DESC, id DESC LIMIT :taille + 1
+
+L'élément supplémentaire indique s'il existe une page suivante ; aucune
+requête de comptage n'est faite. Les jetons `?cursor=` sont opaques pour le
+client (base64 de la direction, de la date et de l'identifiant).
+
+Activation par vue : `pagination_mode = 'cursor'` (voir `base_views.py`).
+"""
+
+import base64
+import binascii
+from datetime import datetime
+
+from django.db.models import Q
+from django.http import Http404
+from django.utils.translation import gettext as _
+
+NEXT = 'n'
+PREVIOUS = 'p'
+
+
+def encode_cursor(direction, item):
+    """Jeton opaque pointant après (`NEXT`) ou avant (`PREVIOUS`) un élément."""
+    raw = f"{direction}|{item.published_at.isoformat()}|{item.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """
+    Décode un jeton produit par `encode_cursor`.
+
+    Returns:
+        tuple: `(direction, published_at, pk)`.
+
+    Raises:
+        ValueError: Si le jeton est invalide.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)).decode()
+        direction, published_at, pk = raw.split('|')
+        if direction not in (NEXT, PREVIOUS):
+            raise ValueError(direction)
+        return direction, datetime.fromisoformat(published_at), int(pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError(f"Curseur invalide : {token!r}") from exc
+
+
+class CursorPage:
+    """
+    Page d'une pagination par curseur, compatible avec l'usage de `page_obj`
+    dans les gabarits (`has_next`, `has_previous`, `has_other_pages`).
+    """
+
+    def __init__(self, object_list, has_next, has_previous):
+        self.object_list = object_list
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    @property
+    def next_cursor(self):
+        return encode_cursor(NEXT, self.object_list[-1]) if self._has_next else None
+
+    @property
+    def previous_cursor(self):
+        return encode_cursor(PREVIOUS, self.object_list[0]) if self._has_previous else None
+
+
+def paginate_by_cursor(queryset, token, per_page):
+    """
+    Lit une page de `queryset` à partir d'un jeton de curseur.
+
+    Args:
+        queryset: Contenus publiables (ordre imposé : `published_at`, `id` décroissants).
+        token (str or None): Jeton `?cursor=` ; None pour la première page.
+        per_page (int): Nombre d'éléments par page.
+
+    Returns:
+        CursorPage: La page demandée.
+
+    Raises:
+        Http404: Si le jeton est invalide.
+    """
+    if not token:
+        items = list(queryset.order_by('-published_at', '-pk')[:per_page + 1])
+        return CursorPage(items[:per_page], len(items) > per_page, False)
+
+    try:
+        direction, published_at, pk = decode_cursor(token)
+    except ValueError as exc:
+        raise Http404(_("Page invalide : %(message)s") % {'message': exc})
+
+    if direction == NEXT:
+        items = list(
+            queryset.filter(Q(published_at__lt=published_at) | Q(pk__lt=pk), published_at__lte=published_at)
+            .order_by('-published_at', '-pk')[:per_page + 1]
+        )
+        return CursorPage(items[:per_page], len(items) > per_page, True)
+
+    # Page précédente : lecture dans l'ordre croissant depuis le premier élément affiché
+    items = list(
+        queryset.filter(Q(published_at__gt=published_at) | Q(pk__gt=pk), published_at__gte=published_at)
+        .order_by('published_at', 'pk')[:per_page + 1]
+    )
+    return CursorPage(items[:per_page][::-1], True, len(items) > per_page)
@@ -0,0 +1,58 @@
+"""
+Cache inter-processus des profils hydratés (SiteProfile + contenus préchargés).
+
+Les profils ne changent que lorsqu'un administrateur enregistre un profil ou
+un contenu : on stocke donc le graphe complet (sections, items, projets,
+articles, services) dans le cache Django sous une clé versionnée. Les signaux
+de `signals.py` incrémentent la version, ce qui invalide toutes les entrées
+d'un coup sans avoir à les énumérer.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+VERSION_KEY = "site_profile:version"
+
+# Sentinelle pour distinguer « absent du cache » d'un profil inexistant (None)
+_MISSING = object()
+
+
+def get_cache_version():
+    """Retourne la version courante des entrées de profil."""
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = 1
+        cache.add(VERSION_KEY, version, timeout=None)
+    return version
+
+
+def bump_cache_version():
+    """Invalide tous les profils en cache en incrémentant la version."""
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        # Clé absente (cache vidé ou jamais initialisé)
+        cache.set(VERSION_KEY, 2, timeout=None)
+
+
+def get_or_load_profile(name, loader):
+    """
+    Retourne le profil mis en cache sous `name`, ou le charge avec `loader`.
+
+    Args:
+        name (str): Identifiant de l'entrée (ex: 'default', 'slug:yama-sakho').
+        loader (callable): Fonction sans argument qui retourne le profil ou None.
+
+    Returns:
+        SiteProfile or None: Le profil avec ses relations préchargées.
+    """
+    timeout = getattr(settings, "SITE_PROFILE_CACHE_TIMEOUT", 60 * 60 * 24)
+    if not timeout:
+        return loader()
+
+    key = f"site_profile:v{get_cache_version()}:{name}"
+    profile = cache.get(key, _MISSING)
+    if profile is _MISSING:
+        profile = loader()
+        cache.set(key, profile, timeout=timeout)
+    return profile
@@ -0,0 +1,94 @@
+"""
+Cache des cartes de sections dynamiques de la page d'accueil.
+
+Chaque section active (Formation, Compétences, Stack, ...) est rendue une
+seule fois avec `app_acceuil/section_fragment.html`, puis son HTML est
+stocké sous une clé formée de `Section.pk` et de la date de modification la
+plus récente de la section et de ses éléments. Enregistrer une section ou
+un élément change donc la clé : l'ancienne entrée n'est plus jamais lue et
+expire d'elle-même (la suppression d'un élément touche `Section.updated_at`,
+voir `signals.py`).
+
+La clé porte aussi une version (`fragment_version()`) : l'empreinte du
+gabarit et `SECTION_FRAGMENT_VERSION`. Un déploiement qui modifie le gabarit
+ne sert donc pas l'ancien HTML depuis le cache partagé ; pour un changement
+hors gabarit (tags de `templatetags/utils.py`), augmenter le réglage.
+
+La page d'accueil assemble ces fragments : avec un cache chaud, afficher
+15 sections et 100 éléments revient à une lecture `get_many`.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.template.loader import get_template, render_to_string
+from django.utils.safestring import mark_safe
+
+KEY_PREFIX = "section_fragment:"
+TEMPLATE_NAME = "app_acceuil/section_fragment.html"
+
+
+def section_fragment_timeout():
+    """Durée de vie des fragments en cache (0 = rendu à chaque requête)."""
+    return getattr(settings, "SECTION_FRAGMENT_TIMEOUT", 0)
+
+
+def fragment_version():
+    """
+    Version des fragments : `SECTION_FRAGMENT_VERSION` et empreinte du gabarit.
+
+    L'empreinte est mémorisée sur le gabarit compilé : avec le chargeur en
+    cache, elle n'est calculée qu'une fois par processus.
+    """
+    template = get_template(TEMPLATE_NAME).template
+    fingerprint = getattr(template, "fragment_fingerprint", None)
+    if fingerprint is None:
+        fingerprint = template.fragment_fingerprint = hashlib.md5(template.source.encode()).hexdigest()[:12]
+    return f"{getattr(settings, 'SECTION_FRAGMENT_VERSION', '')}.{fingerprint}"
+
+
+def section_fragment_key(section, version=None):
+    """Clé du fragment : version, section et modification la plus récente de ses éléments."""
+    stamps = [item.updated_at for item in section.items.all()]
+    stamps.append(section.updated_at)
+    return f"{KEY_PREFIX}{version or fragment_version()}:{section.pk}:{max(stamps).timestamp()}"
+
+
+def render_section(section):
+    """HTML de la carte d'une section (sans cache)."""
+    return render_to_string(TEMPLATE_NAME, {'section': section})
+
+
+def render_section_fragments(profile):
+    """
+    Cartes HTML des sections actives du profil, dans l'ordre d'affichage.
+
+    Les sections et éléments doivent être préchargés (profil issu de
+    `get_default_profile()` ou `get_by_slug_with_content()`) : les clés se
+    calculent alors sans requête SQL, et seules les sections absentes du
+    cache sont rendues.
+
+    Returns:
+        list[SafeString]: Un fragment par section active (vide sans profil).
+    """
+    if profile is None:
+        return []
+    sections = [section for section in profile.sections.all() if section.is_active]
+    timeout = section_fragment_timeout()
+    if timeout <= 0:
+        return [mark_safe(render_section(section)) for section in sections]
+
+    version = fragment_version()
+    keys = [section_fragment_key(section, version) for section in sections]
+    cached = cache.get_many(keys)
+    missing = {}
+    fragments = []
+    for key, section in zip(keys, sections):
+        html = cached.get(key)
+        if html is None:
+            html = missing[key] = render_section(section)
+        fragments.append(mark_safe(html))
+    if missing:
+        cache.set_many(missing, timeout)
+    return fragments
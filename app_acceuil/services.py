@@ -5,18 +5,81 @@ This module centralizes the logic for retrieving featured content, determining
 default profiles, and building context data for views.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+from django.db.models import Case, Exists, IntegerField, OuterRef, Value, When
 from app_projet.models import Project
 from app_blog.models import BlogPost
 from app_service.models import Service
 from .models import SiteProfile
+from .section_cache import render_section_fragments
 
 
 class ProfileService:
     """Service for handling profile-related business logic."""
 
+    # Priority of each row in the single-query fallback (lower wins)
+    FEATURED, PUBLISHED, GLOBAL = 0, 1, 2
+
+    @staticmethod
+    def resolve_featured(site_profile: Optional[SiteProfile], featured_attr: str,
+                         published_attr: str, model, limit: int = 3) -> List:
+        """
+        Resolve the content shown on a profile homepage for one content type.
+
+        Resolution order: all featured items, else the first `limit` published
+        items, else the first `limit` items overall. When the profile was loaded
+        with `get_published_with_content()` both relations are read from the
+        prefetch cache; otherwise a single annotated query ranks every item.
+
+        Args:
+            site_profile: The SiteProfile instance or None.
+            featured_attr: Name of the featured M2M field (ex: 'featured_projects').
+            published_attr: Name of the published M2M field (ex: 'published_projects').
+            model: The content model, used for the global fallback.
+            limit: Maximum number of items to return for the fallbacks.
+
+        Returns:
+            Evaluated list of model instances.
+        """
+        if site_profile is None:
+            return list(model.objects.all()[:limit])
+
+        prefetched = getattr(site_profile, '_prefetched_objects_cache', {})
+        if featured_attr in prefetched and published_attr in prefetched:
+            featured = list(getattr(site_profile, featured_attr).all())
+            if featured:
+                return featured
+            published = list(getattr(site_profile, published_attr).all()[:limit])
+            if published:
+                return published
+            return list(model.objects.all()[:limit])
+
+        def linked(attr):
+            field = SiteProfile._meta.get_field(attr)
+            return Exists(field.remote_field.through.objects.filter(**{
+                field.m2m_field_name(): site_profile.pk,
+                field.m2m_reverse_field_name(): OuterRef('pk'),
+            }))
+
+        ranked = model.objects.annotate(priority=Case(
+            When(linked(featured_attr), then=Value(ProfileService.FEATURED)),
+            When(linked(published_attr), then=Value(ProfileService.PUBLISHED)),
+            default=Value(ProfileService.GLOBAL),
+            output_field=IntegerField(),
+        )).order_by('priority', *model._meta.ordering)
+
+        # One query, consumed only as far as needed: featured rows come first
+        items = []
+        for item in ranked.iterator():
+            if not items:
+                priority = item.priority
+            elif item.priority != priority or (priority != ProfileService.FEATURED and len(items) >= limit):
+                break
+            items.append(item)
+        return items
+
     @staticmethod
-    def get_featured_projects(site_profile: Optional[SiteProfile], limit: int = 3):
+    def get_featured_projects(site_profile: Optional[SiteProfile], limit: int = 3) -> List[Project]:
         """
         Get featured projects for a given profile.
 
@@ -25,18 +88,14 @@ class ProfileService:
             limit: Maximum number of projects to return if using fallback.
 
         Returns:
-            QuerySet of Project instances.
+            List of Project instances.
         """
-        if site_profile and site_profile.featured_projects.exists():
-            return site_profile.featured_projects.all()
-        elif site_profile and site_profile.published_projects.exists():
-            return site_profile.published_projects.all()[:limit]
-        else:
-            # Fallback: retourner tous les projets (limités)
-            return Project.objects.all()[:limit]
+        return ProfileService.resolve_featured(
+            site_profile, 'featured_projects', 'published_projects', Project, limit
+        )
 
     @staticmethod
-    def get_featured_articles(site_profile: Optional[SiteProfile], limit: int = 3):
+    def get_featured_articles(site_profile: Optional[SiteProfile], limit: int = 3) -> List[BlogPost]:
         """
         Get featured blog articles for a given profile.
 
@@ -45,18 +104,14 @@ class ProfileService:
             limit: Maximum number of articles to return if using fallback.
 
         Returns:
-            QuerySet of BlogPost instances.
+            List of BlogPost instances.
         """
-        if site_profile and site_profile.featured_articles.exists():
-            return site_profile.featured_articles.all()
-        elif site_profile and site_profile.published_articles.exists():
-            return site_profile.published_articles.all()[:limit]
-        else:
-            # Fallback: retourner tous les articles (limités)
-            return BlogPost.objects.all()[:limit]
+        return ProfileService.resolve_featured(
+            site_profile, 'featured_articles', 'published_articles', BlogPost, limit
+        )
 
     @staticmethod
-    def get_featured_services(site_profile: Optional[SiteProfile], limit: int = 3):
+    def get_featured_services(site_profile: Optional[SiteProfile], limit: int = 3) -> List[Service]:
         """
         Get featured services for a given profile.
 
@@ -65,15 +120,11 @@ class ProfileService:
             limit: Maximum number of services to return if using fallback.
 
         Returns:
-            QuerySet of Service instances.
+            List of Service instances.
         """
-        if site_profile and site_profile.featured_services.exists():
-            return site_profile.featured_services.all()
-        elif site_profile and site_profile.published_services.exists():
-            return site_profile.published_services.all()[:limit]
-        else:
-            # Fallback: retourner tous les services (limités)
-            return Service.objects.all()[:limit]
+        return ProfileService.resolve_featured(
+            site_profile, 'featured_services', 'published_services', Service, limit
+        )
 
     @staticmethod
     def build_profile_context(site_profile: Optional[SiteProfile]) -> Dict[str, Any]:
@@ -84,11 +135,13 @@ class ProfileService:
             site_profile: The SiteProfile instance or None.
 
         Returns:
-            Dictionary with 'projets', 'articles', 'services', and 'site_profile' keys.
+            Dictionary with 'projets', 'articles', 'services', 'site_profile'
+            and 'section_fragments' (cached HTML cards of the active sections) keys.
         """
         return {
             'projets': ProfileService.get_featured_projects(site_profile),
             'articles': ProfileService.get_featured_articles(site_profile),
             'services': ProfileService.get_featured_services(site_profile),
+            'section_fragments': render_section_fragments(site_profile),
             'site_profile': site_profile,
         }
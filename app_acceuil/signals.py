@@ -0,0 +1,145 @@
+"""
+Invalidation des caches liés aux profils.
+
+Toute modification d'un profil, de ses sections ou d'un contenu publiable
+(projet, article, service) incrémente la version du cache des profils et
+les étiquettes du cache de pages concernées (voir `page_cache.py`).
+Quand le slug change, l'étiquette de l'ancien slug est aussi incrémentée :
+la page servie à l'ancienne adresse ne reste pas en cache.
+Les récepteurs sont connectés dans `AppAcceuilConfig.ready()`.
+"""
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.utils import timezone
+
+from .page_cache import bump_page_tags, item_tag, profile_tag, type_tag
+from .profile_cache import bump_cache_version
+
+
+def _touch_profiles(profile_ids):
+    """Met à jour `updated_at` des profils et invalide leurs pages."""
+    from .models import SiteProfile
+
+    profiles = SiteProfile.objects.filter(pk__in=[pk for pk in profile_ids if pk])
+    profiles.update(updated_at=timezone.now())
+    bump_page_tags(*(profile_tag(profile) for profile in profiles.only('slug')))
+
+
+def remember_previous_slug(sender, instance, **kwargs):
+    """Récepteur de `pre_save` : note le slug enregistré avant la modification."""
+    if kwargs.get('raw') or not instance.pk:
+        instance._previous_slug = None
+        return
+    instance._previous_slug = sender._default_manager.filter(pk=instance.pk).values_list('slug', flat=True).first()
+
+
+def _renamed(instance):
+    """Ancien slug si l'enregistrement l'a changé, sinon None."""
+    previous = getattr(instance, '_previous_slug', None)
+    instance._previous_slug = None
+    return previous if previous and previous != instance.slug else None
+
+
+def invalidate_profile_pages(sender, instance, **kwargs):
+    """Un profil enregistré ou supprimé : ses pages sont périmées."""
+    if kwargs.get('raw'):
+        # Chargement de fixtures : rien n'est encore en cache
+        return
+    tags = [profile_tag(instance)]
+    previous = _renamed(instance)
+    if previous:
+        tags.append(f"profile:{previous}")
+    bump_page_tags(*tags)
+    bump_cache_version()
+
+
+def invalidate_section_pages(sender, instance, **kwargs):
+    """Section, élément, formation ou expérience : pages du profil parent et fragment de la section."""
+    if kwargs.get('raw'):
+        return
+    if hasattr(instance, 'section_id'):
+        from .models import Section
+
+        section = Section.objects.filter(pk=instance.section_id)
+        # Nouvelle clé pour le fragment en cache de la section (voir section_cache.py),
+        # y compris quand l'élément est supprimé
+        section.update(updated_at=timezone.now())
+        profile_ids = section.values_list('profile_id', flat=True)
+    else:
+        profile_ids = [instance.profile_id]
+    _touch_profiles(list(profile_ids))
+    bump_cache_version()
+
+
+def invalidate_content_pages(sender, instance, **kwargs):
+    """Projet, article ou service : listes du type et page de détail."""
+    if kwargs.get('raw'):
+        return
+    tags = [type_tag(sender), item_tag(sender, instance.slug)]
+    previous = _renamed(instance)
+    if previous:
+        tags.append(item_tag(sender, previous))
+    bump_page_tags(*tags)
+    bump_cache_version()
+
+
+def _linked_profile_ids(through, content):
+    """Profils liés à un contenu par une table d'association (publiés ou mis en avant)."""
+    from .models import SiteProfile
+
+    fields = [field for field in through._meta.get_fields() if field.many_to_one]
+    source = next(field.name for field in fields if field.related_model is content._meta.concrete_model)
+    target = next(field.attname for field in fields if field.related_model is SiteProfile)
+    return list(through.objects.filter(**{source: content}).values_list(target, flat=True))
+
+
+def invalidate_profile_cache_on_m2m(sender, instance, action, reverse, pk_set, **kwargs):
+    """Invalide les caches après un ajout/retrait de contenu sur un profil."""
+    if reverse and action == 'pre_clear':
+        # contenu.profiles.clear() : après coup, plus aucun lien ne désigne les profils
+        instance._cleared_profile_ids = _linked_profile_ids(sender, instance)
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        profile_ids = [instance.pk]
+    elif action == 'post_clear':
+        profile_ids = getattr(instance, '_cleared_profile_ids', [])
+        instance._cleared_profile_ids = []
+    else:
+        # contenu.profiles.add(profil) : pk_set contient les profils
+        profile_ids = pk_set or []
+    _touch_profiles(list(profile_ids))
+    bump_cache_version()
+
+
+def connect_signals():
+    """Connecte les récepteurs d'invalidation aux modèles concernés."""
+    from app_blog.models import BlogPost
+    from app_projet.models import Project
+    from app_service.models import Service
+    from .models import Education, Experience, Section, SectionItem, SiteProfile
+
+    receivers = [(SiteProfile, invalidate_profile_pages)]
+    receivers += [(model, invalidate_section_pages) for model in (Section, SectionItem, Education, Experience)]
+    receivers += [(model, invalidate_content_pages) for model in (Project, BlogPost, Service)]
+    for model, receiver in receivers:
+        label = model._meta.label_lower
+        post_save.connect(receiver, sender=model, dispatch_uid=f"profile_cache_save_{label}")
+        post_delete.connect(receiver, sender=model, dispatch_uid=f"profile_cache_delete_{label}")
+
+    # Pages servies sous un slug : l'ancien slug est noté avant l'enregistrement
+    for model in (SiteProfile, Project, BlogPost, Service):
+        pre_save.connect(remember_previous_slug, sender=model, dispatch_uid=f"page_cache_slug_{model._meta.label_lower}")
+
+    for field_name in (
+        'published_projects', 'featured_projects',
+        'published_articles', 'featured_articles',
+        'published_services', 'featured_services',
+    ):
+        through = getattr(SiteProfile, field_name).through
+        m2m_changed.connect(
+            invalidate_profile_cache_on_m2m,
+            sender=through,
+            dispatch_uid=f"profile_cache_m2m_{field_name}",
+        )
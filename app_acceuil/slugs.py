@@ -0,0 +1,56 @@
+"""
+Allocation de slugs uniques sans sonder la base suffixe par suffixe.
+
+Au lieu d'une boucle `while filter(slug=...).exists()` (une requête par
+collision), on lit en une seule requête tous les slugs existants qui
+commencent par les bases demandées, puis on choisit en mémoire le premier
+suffixe libre (`base`, `base-1`, `base-2`, ...). La même lecture sert à
+allouer les slugs d'un lot entier avant un `bulk_create`.
+"""
+
+from django.db.models import Q
+
+
+def allocate_slugs(model, base_slugs, exclude_pk=None, reserved=()):
+    """
+    Retourne un slug unique pour chaque base, dans l'ordre, en une requête.
+
+    Args:
+        model: Le modèle dont le champ `slug` doit rester unique.
+        base_slugs (list[str]): Slugs souhaités (déjà passés par `slugify`).
+        exclude_pk: Clé primaire à ignorer (l'objet en cours de modification).
+        reserved (iterable[str]): Slugs déjà pris hors base (ex: fixés à la main
+            dans le même lot).
+
+    Returns:
+        list[str]: Slugs libres, distincts entre eux et des slugs existants.
+    """
+    bases = set(base_slugs)
+    if not bases:
+        return []
+
+    prefixes = Q()
+    for base in bases:
+        prefixes |= Q(slug=base) | Q(slug__startswith=f"{base}-")
+    existing = model._default_manager.filter(prefixes)
+    if exclude_pk is not None:
+        existing = existing.exclude(pk=exclude_pk)
+    taken = set(existing.values_list('slug', flat=True)) | set(reserved)
+
+    slugs = []
+    next_counter = {}
+    for base in base_slugs:
+        slug = base
+        counter = next_counter.get(base, 1)
+        while slug in taken:
+            slug = f"{base}-{counter}"
+            counter += 1
+        next_counter[base] = counter
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
+
+
+def unique_slug(model, base_slug, exclude_pk=None):
+    """Premier slug libre pour `base_slug` (une seule requête)."""
+    return allocate_slugs(model, [base_slug], exclude_pk=exclude_pk)[0]
@@ -0,0 +1,143 @@
+"""
+Pool de connexions SMTP authentifiées, partagé par le processus worker.
+
+Ouvrir une session Gmail coûte une poignée de main TLS et un AUTH : le pool
+garde les connexions ouvertes entre deux passages de `send_queued_emails`,
+une pile de connexions inactives par adresse expéditrice (email du profil).
+
+- Une connexion inactive depuis plus de `keepalive_seconds` est vérifiée
+  par un NOOP avant d'être réutilisée ; au-delà de `max_idle_seconds` elle
+  est fermée (Gmail coupe de toute façon les sessions inactives).
+- Un envoi interrompu par une déconnexion est retenté une fois sur une
+  session rouverte.
+- Au plus `max_connections` connexions sont utilisées en même temps par
+  adresse ; les appelants suivants attendent qu'une connexion se libère.
+"""
+
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+# Erreurs indiquant une session SMTP inutilisable (à rouvrir)
+DISCONNECT_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+class SMTPConnectionPool:
+    """Connexions email réutilisables, indexées par adresse expéditrice."""
+
+    def __init__(self, max_connections=2, keepalive_seconds=30, max_idle_seconds=240, acquire_timeout=60):
+        self.max_connections = max_connections
+        self.keepalive_seconds = keepalive_seconds
+        self.max_idle_seconds = max_idle_seconds
+        self.acquire_timeout = acquire_timeout
+        self._lock = threading.Lock()
+        self._idle = {}
+        self._slots = {}
+
+    def _slot(self, key):
+        with self._lock:
+            if key not in self._slots:
+                self._slots[key] = threading.BoundedSemaphore(self.max_connections)
+            return self._slots[key]
+
+    @staticmethod
+    def _close(connection):
+        """Ferme une connexion sans échouer si la session est déjà morte."""
+        try:
+            connection.close()
+        except (smtplib.SMTPException, OSError):
+            pass
+
+    @staticmethod
+    def _is_open(connection):
+        # Les backends sans session (locmem, console) sont toujours utilisables
+        return getattr(connection, "connection", True) is not None
+
+    @staticmethod
+    def _is_alive(connection):
+        """Vérifie une session SMTP inactive avec un NOOP."""
+        smtp = getattr(connection, "connection", None)
+        if smtp is None:
+            return SMTPConnectionPool._is_open(connection)
+        try:
+            return smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _checkout(self, key, profile):
+        from .mail_queue import get_profile_connection
+
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                idle = self._idle.get(key, [])
+                if not idle:
+                    break
+                connection, last_used = idle.pop()
+            idle_for = now - last_used
+            same_credentials = getattr(connection, "password", profile.gmail_app_password) == profile.gmail_app_password
+            if same_credentials and idle_for <= self.max_idle_seconds:
+                if idle_for <= self.keepalive_seconds or self._is_alive(connection):
+                    return connection
+            self._close(connection)
+
+        connection = get_profile_connection(profile)
+        connection.open()
+        return connection
+
+    def _checkin(self, key, connection):
+        if not self._is_open(connection):
+            return
+        with self._lock:
+            self._idle.setdefault(key, []).append((connection, time.monotonic()))
+
+    @contextmanager
+    def connection(self, profile):
+        """
+        Prête une connexion ouverte pour l'adresse du profil.
+
+        Raises:
+            TimeoutError: Si aucune connexion ne se libère dans `acquire_timeout`.
+            Exception: Les erreurs d'ouverture de session (réseau, authentification).
+        """
+        key = profile.email
+        slot = self._slot(key)
+        if not slot.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError(f"Aucune connexion SMTP disponible pour {key}")
+        try:
+            connection = self._checkout(key, profile)
+            try:
+                yield connection
+            except BaseException:
+                self._close(connection)
+                raise
+            self._checkin(key, connection)
+        finally:
+            slot.release()
+
+    def send(self, connection, message):
+        """Envoie `message`, en rouvrant la session une fois si elle a été coupée."""
+        message.connection = connection
+        try:
+            return connection.send_messages([message])
+        except DISCONNECT_ERRORS:
+            self._close(connection)
+            connection.open()
+            return connection.send_messages([message])
+
+    def close_all(self):
+        """Ferme toutes les connexions inactives (arrêt du worker)."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection, _ in connections:
+                self._close(connection)
+
+
+smtp_pool = SMTPConnectionPool(
+    max_connections=getattr(settings, "CONTACT_SMTP_POOL_SIZE", 2),
+    keepalive_seconds=getattr(settings, "CONTACT_SMTP_KEEPALIVE_SECONDS", 30),
+)
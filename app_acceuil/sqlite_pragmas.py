@@ -0,0 +1,57 @@
+"""
+Réglages PRAGMA appliqués à chaque nouvelle connexion SQLite.
+
+Quand plusieurs workers gunicorn partagent `db.sqlite3`, un enregistrement
+dans l'admin (`SiteProfile.save()` enchaîne plusieurs UPDATE) bloquait les
+lecteurs avec le journal par défaut. Le récepteur `apply_sqlite_pragmas`
+(connecté sur `connection_created` dans `AppAcceuilConfig.ready()`) passe la
+base en WAL et règle le cache, le mmap et l'attente sur verrou d'après
+`settings.SQLITE_PRAGMAS`. Les autres moteurs (PostgreSQL) sont ignorés.
+
+Le mode WAL est écrit dans l'en-tête du fichier : il n'est appliqué que si
+`SQLITE_WAL` est vrai : toujours en production (prod.py), en développement
+seulement quand `DATABASE_URL` désigne la base. Sans cela, la moindre
+commande `manage.py` modifierait le `db.sqlite3` versionné du dépôt.
+
+Mesure : `python manage.py loadtest_sqlite`.
+"""
+
+from django.conf import settings
+
+# Ordre d'application : l'attente sur verrou d'abord, pour que le passage en
+# WAL patiente si un autre processus écrit déjà.
+DEFAULT_PRAGMAS = {
+    'busy_timeout': 20000,          # millisecondes
+    'journal_mode': 'WAL',          # lecteurs non bloqués par un écrivain
+    'synchronous': 'NORMAL',        # sûr en WAL, un fsync par checkpoint
+    'cache_size': -20000,           # négatif = KiB (≈ 20 Mo par connexion)
+    'mmap_size': 128 * 1024 * 1024,  # lecture des pages par mmap
+}
+
+
+def sqlite_pragmas(wal=None):
+    """
+    PRAGMA configurés (`SQLITE_PRAGMAS`), complétés par les valeurs par défaut.
+
+    Args:
+        wal (bool): Passage en WAL ; par défaut `settings.SQLITE_WAL`. Sans
+            WAL, `journal_mode` est retiré et le fichier garde son journal.
+    """
+    pragmas = {**DEFAULT_PRAGMAS, **getattr(settings, 'SQLITE_PRAGMAS', {})}
+    if not (getattr(settings, 'SQLITE_WAL', True) if wal is None else wal):
+        pragmas.pop('journal_mode', None)
+    return pragmas
+
+
+def pragma_statements(pragmas):
+    """Instructions `PRAGMA nom=valeur` dans l'ordre du dictionnaire."""
+    return [f"PRAGMA {name}={value}" for name, value in pragmas.items()]
+
+
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """Récepteur de `connection_created` : règle une connexion SQLite."""
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for statement in pragma_statements(sqlite_pragmas()):
+            cursor.execute(statement)
@@ -0,0 +1,56 @@
+/*
+ * Page d'accueil : grille « masonry » du profil (hauteur des cartes en
+ * rangées de grille) et boutons œil des détails de formation/expérience.
+ */
+function layoutProfileGrid() {
+    var grid = document.querySelector('.profile-layout');
+    if (!grid) { return; }
+
+    var styles = window.getComputedStyle(grid);
+    var gap = parseFloat(styles.gap || styles.gridRowGap || 0) || 0;
+    var baseRowHeight = parseFloat(styles.getPropertyValue('--profile-grid-row-height')) || 12;
+
+    grid.querySelectorAll('.profile-sidebar, .profile-card').forEach(function (item) {
+        item.style.gridRowEnd = 'span ' + Math.ceil((item.getBoundingClientRect().height + gap) / (baseRowHeight + gap));
+    });
+}
+
+// Toggle details for education items + refresh masonry layout
+document.addEventListener('DOMContentLoaded', function () {
+    layoutProfileGrid();
+
+    document.querySelectorAll('.btn-eye').forEach(function(btn){
+        btn.addEventListener('click', function(){
+            var target = btn.getAttribute('data-target');
+            if(!target) { return; }
+            var el = document.querySelector(target);
+            if(!el) { return; }
+            var hidden = (getComputedStyle(el).display === 'none');
+            el.style.display = hidden ? 'block' : 'none';
+            btn.setAttribute('aria-expanded', hidden ? 'true' : 'false');
+            // Only the eye toggles: active when details are visible
+            if(hidden){
+                btn.classList.add('active');
+            } else {
+                btn.classList.remove('active');
+            }
+
+            requestAnimationFrame(layoutProfileGrid);
+        });
+    });
+
+    window.addEventListener('load', layoutProfileGrid);
+    window.addEventListener('resize', function(){
+        requestAnimationFrame(layoutProfileGrid);
+    });
+
+    var grid = document.querySelector('.profile-layout');
+    if (grid && 'ResizeObserver' in window) {
+        var resizeObserver = new ResizeObserver(function () {
+            layoutProfileGrid();
+        });
+        grid.querySelectorAll('.profile-sidebar, .profile-card').forEach(function (item) {
+            resizeObserver.observe(item);
+        });
+    }
+});
@@ -0,0 +1,38 @@
+/*
+ * Formulaire de contact (includes/section_contact.html) : compteur de
+ * caractères du message et état « envoi en cours » du bouton.
+ */
+document.addEventListener('DOMContentLoaded', function() {
+    const messageField = document.getElementById('message');
+    const charCount = document.getElementById('charCount');
+    const form = document.getElementById('contactForm');
+    const submitBtn = document.getElementById('submitBtn');
+    const btnText = document.getElementById('btnText');
+    const btnSpinner = document.getElementById('btnSpinner');
+    
+    if (messageField && charCount) {
+        messageField.addEventListener('input', function() {
+            const length = this.value.length;
+            charCount.textContent = `${length} / 1000`;
+            
+            if (length > 1000) {
+                charCount.style.color = '#e53e3e';
+                this.style.borderColor = '#e53e3e';
+            } else {
+                charCount.style.color = '#64748b';
+            }
+        });
+        
+        messageField.setAttribute('maxlength', '1000');
+    }
+    
+    // Animation d'envoi
+    if (form && submitBtn) {
+        form.addEventListener('submit', function() {
+            submitBtn.disabled = true;
+            btnText.style.display = 'none';
+            btnSpinner.style.display = 'inline-block';
+            submitBtn.style.opacity = '0.7';
+        });
+    }
+});
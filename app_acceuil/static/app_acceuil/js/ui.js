@@ -0,0 +1,67 @@
+/*
+ * Comportements Bootstrap utilisés par les gabarits, sans bootstrap.bundle.js :
+ * - data-bs-toggle="collapse" (menu de la navbar sur mobile) ;
+ * - data-bs-dismiss="alert" (fermeture des messages).
+ * Mêmes classes que Bootstrap (collapse, collapsing, show, collapsed, fade),
+ * donc mêmes transitions CSS. Chargé avec `defer` depuis base.html.
+ */
+(function () {
+    'use strict';
+
+    var COLLAPSE_MS = 350;
+    var FADE_MS = 150;
+
+    function finish(element, delay, callback) {
+        clearTimeout(element._uiTimer);
+        element._uiTimer = setTimeout(callback, delay);
+    }
+
+    function toggleCollapse(button, target) {
+        var opening = !target.classList.contains('show');
+        button.classList.toggle('collapsed', !opening);
+        button.setAttribute('aria-expanded', opening ? 'true' : 'false');
+
+        if (opening) {
+            target.classList.remove('collapse');
+            target.classList.add('collapsing');
+            target.style.height = '0px';
+            target.style.height = target.scrollHeight + 'px';
+        } else {
+            target.style.height = target.getBoundingClientRect().height + 'px';
+            target.offsetHeight; // reflow : la transition part de la hauteur actuelle
+            target.classList.add('collapsing');
+            target.classList.remove('collapse', 'show');
+            target.style.height = '';
+        }
+        finish(target, COLLAPSE_MS, function () {
+            target.classList.remove('collapsing');
+            target.classList.add('collapse');
+            target.classList.toggle('show', opening);
+            target.style.height = '';
+        });
+    }
+
+    function dismissAlert(alert) {
+        alert.classList.remove('show');
+        finish(alert, alert.classList.contains('fade') ? FADE_MS : 0, function () {
+            alert.remove();
+        });
+    }
+
+    document.addEventListener('click', function (event) {
+        var toggle = event.target.closest('[data-bs-toggle="collapse"]');
+        if (toggle) {
+            var target = document.querySelector(toggle.getAttribute('data-bs-target') || toggle.getAttribute('href'));
+            if (target) {
+                event.preventDefault();
+                toggleCollapse(toggle, target);
+            }
+            return;
+        }
+        var dismiss = event.target.closest('[data-bs-dismiss="alert"]');
+        var alert = dismiss && dismiss.closest('.alert');
+        if (alert) {
+            dismissAlert(alert);
+        }
+    });
+})();
@@ -0,0 +1,59 @@
+"""
+Précompilation des gabarits au démarrage d'un processus.
+
+Avec le chargeur en cache (`TEMPLATE_CACHE`, voir settings.py), un gabarit
+n'est lu et compilé qu'à sa première utilisation dans chaque processus.
+`precompile_templates()` les compile tous d'avance : `wsgi.py` l'appelle au
+démarrage de chaque worker pour que la première requête ne paie pas la
+compilation, et `python manage.py precompile_templates` s'en sert au
+déploiement pour échouer tôt sur une erreur de syntaxe.
+"""
+
+from pathlib import Path
+
+from django.template import TemplateSyntaxError, engines
+from django.template.backends.django import DjangoTemplates
+
+TEMPLATE_SUFFIXES = ('.html', '.txt', '.xml')
+
+
+def template_names(engine):
+    """Noms de tous les gabarits visibles par les chargeurs du moteur, sans doublons."""
+    names = []
+    seen = set()
+    for loader in engine.template_loaders:
+        # Le chargeur en cache délègue aux chargeurs qu'il enveloppe
+        for inner in getattr(loader, 'loaders', [loader]):
+            for directory in inner.get_dirs():
+                root = Path(directory)
+                if not root.is_dir():
+                    continue
+                for path in sorted(root.rglob('*')):
+                    name = path.relative_to(root).as_posix()
+                    if path.suffix in TEMPLATE_SUFFIXES and path.is_file() and name not in seen:
+                        seen.add(name)
+                        names.append(name)
+    return names
+
+
+def precompile_templates():
+    """
+    Compile tous les gabarits des moteurs Django configurés.
+
+    Returns:
+        tuple[int, dict]: Nombre de gabarits compilés et erreurs par nom de
+        gabarit (les gabarits en erreur sont ignorés, pas mis en cache).
+    """
+    compiled = 0
+    errors = {}
+    for backend in engines.all():
+        if not isinstance(backend, DjangoTemplates):
+            continue
+        for name in template_names(backend.engine):
+            try:
+                backend.engine.get_template(name)
+            except TemplateSyntaxError as exc:
+                errors[name] = exc
+            else:
+                compiled += 1
+    return compiled, errors
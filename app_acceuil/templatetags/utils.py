@@ -1,7 +1,17 @@
 from django import template
+from django.contrib.staticfiles import finders
+from django.forms.utils import flatatt
+from django.templatetags.static import static
+from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 from django.utils.text import slugify
+from functools import lru_cache
+from pathlib import Path
 import re
 
+from app_acceuil.display_flags import shows as profile_shows
+from app_acceuil.images import has_derivatives, is_responsive, srcset, stored_metadata
+
 register = template.Library()
 
 
@@ -80,3 +90,74 @@ def profile_profession_slug(profile):
     if not profile or not profile.profession:
         return "profil"
     return slugify(profile.profession)
+
+
+@register.filter(name='shows')
+def shows(profile, spec):
+    """
+    Indique si une métadonnée est affichée, d'après les masques du profil.
+    Ex: {% if site_profile|shows:"blog.author.detail" %}
+    Ex: site_profile|shows:"blog.*.detail" -> au moins une métadonnée
+    """
+    if not profile:
+        return False
+    return profile_shows(profile, spec)
+
+
+
+@register.simple_tag
+def responsive_image(image, sizes="100vw", **attrs):
+    """
+    Balise <img> avec `srcset` vers les déclinaisons WebP de l'image (voir images.py).
+    Ex: {% responsive_image item.main_image sizes="(max-width: 768px) 100vw, 350px" alt=item.title class="img-fluid" %}
+    Chargement différé par défaut (loading="eager" pour une image au-dessus de la ligne de flottaison).
+    `width`/`height` et la couleur d'attente viennent des colonnes enregistrées avec l'image,
+    sans ouvrir le fichier. Une image sans déclinaisons écrites (`<champ>_responsive`)
+    est rendue avec son seul `src`.
+    """
+    if not image:
+        return ""
+    attrs = {'loading': 'lazy', 'decoding': 'async', **attrs}
+    if is_responsive(image):
+        width, height, color = stored_metadata(image)
+        if color:
+            attrs['style'] = f"background-color: {color}; {attrs.get('style', '')}".strip()
+        if width and height:
+            attrs = {'width': width, 'height': height, **attrs}
+        if has_derivatives(image):
+            attrs = {'srcset': srcset(image), 'sizes': sizes, **attrs}
+    return format_html('<img src="{}"{}>', image.url, flatatt(attrs))
+
+
+@lru_cache(maxsize=None)
+def read_static(path):
+    """Contenu d'un fichier statique, lu une fois par processus."""
+    found = finders.find(path)
+    if not found:
+        raise template.TemplateSyntaxError(f"Fichier statique introuvable : {path}")
+    return Path(found).read_text(encoding='utf-8')
+
+
+@register.simple_tag
+def inline_static(path):
+    """
+    Contenu d'un fichier statique de confiance, inséré tel quel dans la page.
+    Ex: <style>{% inline_static 'app_acceuil/bundle/critical.css' %}</style>
+    Réservé aux fichiers générés (critical.css) : pas d'échappement.
+    """
+    return mark_safe(read_static(path))
+
+
+@register.simple_tag
+def deferred_stylesheet(path):
+    """
+    Feuille de style chargée sans bloquer le rendu (preload puis bascule en stylesheet).
+    Ex: {% deferred_stylesheet 'app_acceuil/css/acceuil.css' %}
+    À accompagner du CSS critique de la page ; <noscript> garde le chargement classique.
+    """
+    url = static(path)
+    return format_html(
+        '<link rel="preload" href="{}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+        '<noscript><link rel="stylesheet" href="{}"></noscript>',
+        url, url,
+    )
@@ -0,0 +1,182 @@
+"""
+Budgets de requêtes SQL et de temps de rendu pour les routes publiques.
+
+Utilisé par les tests unitaires de chaque app et par `test_integration` :
+
+    class ProjetBudgetTest(QueryBudgetMixin, TestCase):
+        def setUp(self):
+            self.seed_budget_dataset()
+
+        def test_list(self):
+            self.assertRouteWithinBudget('projet_list')
+
+Les caches (profils et pages) sont désactivés pendant la mesure : on compte
+le travail réel d'une requête « froide ». Toute modification de gabarit ou
+de vue qui ajoute des requêtes (N+1 sur `sections.all`, `.exists()` répétés,
+etc.) fait échouer la CI tant que le budget n'est pas revu explicitement.
+"""
+
+import re
+import time
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+from django.utils.text import slugify
+
+from app_acceuil.models import Education, Experience, Section, SectionItem, SiteProfile
+from app_blog.models import BlogPost
+from app_projet.models import Project
+from app_service.models import Service
+
+# Routes publiques soumises à un budget
+PUBLIC_ROUTE_RE = re.compile(r'^(acceuil|profile_home|profile_\w+|\w+_list|\w+_detail|recherche|recherche_api)$')
+
+# Nombre maximal de requêtes SQL par route, caches désactivés. Un budget ne
+# s'augmente qu'en connaissance de cause.
+QUERY_BUDGETS = {
+    # 1 profil + 8 préchargements (sections, éléments, 6 relations de contenu)
+    'acceuil': 9,
+    'profile_home': 9,
+    'projet_list': 9,
+    'service_list': 9,
+    'profile_projet_list': 9,
+    'profile_service_list': 9,
+    # + la page lue par curseur (pagination_mode = 'cursor', sans COUNT)
+    'blogue_list': 10,
+    'profile_blogue_list': 10,
+    # + validateur conditionnel (updated_at) + l'élément affiché
+    'projet_detail': 11,
+    'blogue_detail': 11,
+    'service_detail': 11,
+    'profile_projet_detail': 11,
+    'profile_blogue_detail': 11,
+    'profile_service_detail': 11,
+    # profil + préchargements + la recherche plein texte (si ?q=)
+    'recherche': 10,
+    'recherche_api': 10,
+    'profile_recherche': 10,
+    'profile_recherche_api': 10,
+}
+
+# Temps de rendu maximal (secondes) d'une page, volontairement large pour la CI
+MAX_RENDER_SECONDS = 1.0
+
+# Taille du jeu de données : assez grand pour révéler un N+1
+SEED_ITEMS = 6
+SEED_SECTIONS = 4
+
+
+def public_route_names(patterns=None):
+    """Noms des routes publiques (hors espaces de noms comme `admin:`)."""
+    names = set()
+    for pattern in patterns if patterns is not None else get_resolver().url_patterns:
+        if isinstance(pattern, URLResolver):
+            if not pattern.namespace:
+                names |= public_route_names(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern) and pattern.name and PUBLIC_ROUTE_RE.match(pattern.name):
+            names.add(pattern.name)
+    return names
+
+
+class QueryBudgetMixin:
+    """Mixin de TestCase : jeu de données de référence et assertions de budget."""
+
+    max_render_seconds = MAX_RENDER_SECONDS
+
+    def seed_budget_dataset(self):
+        """Crée un profil par défaut et un profil secondaire avec contenus et sections."""
+        cache.clear()
+        self.default_profile = SiteProfile.objects.create(
+            first_name="Youssoupha",
+            last_name="Marega",
+            profession="Data Scientist",
+            is_published=True,
+            is_default=True
+        )
+        self.profile = SiteProfile.objects.create(
+            first_name="Yama",
+            last_name="Sakho",
+            profession="Data Analyst",
+            is_published=True,
+            is_default=False
+        )
+        contents = {}
+        for model, suffix in ((Project, "projects"), (BlogPost, "articles"), (Service, "services")):
+            contents[suffix] = [
+                model.objects.create(
+                    title=f"{model.__name__} {i}",
+                    resume=f"Résumé {i}",
+                    content=f"<p>Contenu {i}</p>",
+                    author_name="Yama Sakho",
+                    author_email="yama@example.com",
+                    author_profession="Data Analyst"
+                )
+                for i in range(SEED_ITEMS)
+            ]
+        self.projects, self.articles, self.services = contents['projects'], contents['articles'], contents['services']
+
+        for profile in (self.default_profile, self.profile):
+            for suffix, items in contents.items():
+                getattr(profile, f"published_{suffix}").add(*items)
+                getattr(profile, f"featured_{suffix}").add(*items[:3])
+            for order in range(SEED_SECTIONS):
+                section = Section.objects.create(
+                    profile=profile,
+                    section_type='competences',
+                    title=f"Section {order}",
+                    order=order
+                )
+                for item_order in range(SEED_ITEMS):
+                    SectionItem.objects.create(
+                        section=section,
+                        title=f"Élément {item_order}",
+                        order=item_order
+                    )
+            for order in range(3):
+                Education.objects.create(profile=profile, title=f"Formation {order}", order=order)
+                Experience.objects.create(profile=profile, title=f"Expérience {order}", order=order)
+
+    def route_url(self, name):
+        """Construit l'URL d'une route publique à partir du jeu de données."""
+        kwargs = self.profile_url_kwargs() if name.startswith('profile_') else {}
+        if name.endswith('_detail'):
+            content = {'projet': self.projects, 'blogue': self.articles, 'service': self.services}
+            kind = name.replace('profile_', '').replace('_detail', '')
+            kwargs['slug'] = content[kind][0].slug
+        return reverse(name, kwargs=kwargs)
+
+    def profile_url_kwargs(self):
+        """Paramètres `nom` et `profession` du profil secondaire."""
+        return {
+            'nom': slugify(f"{self.profile.first_name}-{self.profile.last_name}"),
+            'profession': slugify(self.profile.profession),
+        }
+
+    def assertWithinBudget(self, url, max_queries, max_seconds=None):
+        """Vérifie le statut 200, le nombre de requêtes SQL et le temps de rendu d'une URL."""
+        max_seconds = self.max_render_seconds if max_seconds is None else max_seconds
+        cache.clear()
+        with override_settings(SITE_PROFILE_CACHE_TIMEOUT=0, PAGE_CACHE_TIMEOUT=0):
+            with CaptureQueriesContext(connection) as ctx:
+                start = time.perf_counter()
+                response = self.client.get(url)
+                elapsed = time.perf_counter() - start
+        self.assertEqual(response.status_code, 200, url)
+        queries = [query['sql'] for query in ctx.captured_queries]
+        self.assertLessEqual(
+            len(queries), max_queries,
+            f"{url} : {len(queries)} requêtes SQL pour un budget de {max_queries}\n" + "\n".join(queries)
+        )
+        self.assertLessEqual(
+            elapsed, max_seconds,
+            f"{url} : rendu en {elapsed:.3f}s pour un budget de {max_seconds}s"
+        )
+        return response
+
+    def assertRouteWithinBudget(self, name):
+        """Vérifie une route nommée contre son budget de `QUERY_BUDGETS`."""
+        self.assertIn(name, QUERY_BUDGETS, f"Aucun budget de requêtes défini pour la route '{name}'")
+        return self.assertWithinBudget(self.route_url(name), QUERY_BUDGETS[name])
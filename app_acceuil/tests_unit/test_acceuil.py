@@ -3,18 +3,64 @@ Tests pour l'application app_acceuil.
 
 Couvre:
 - Modèles: SiteProfile, PublishableContent (via Project pour tests)
-- Template tags: profile_nom_slug, profile_profession_slug
+- Template tags: profile_nom_slug, profile_profession_slug, shows
+- Masques d'affichage des métadonnées (display_flags, admin)
 - Context processors
+- Groupes de configuration du profil chargés à la demande
 - Vues: accueil
+- Cartes de sections de l'accueil en cache (section_cache)
+- Précompilation des gabarits (template_warmup, precompile_templates)
+- PRAGMA SQLite à la connexion et test de charge (sqlite_pragmas, loadtest_sqlite)
+- Index utilisés par les requêtes de l'accueil et des listes (EXPLAIN QUERY PLAN)
+- Déclinaisons WebP responsives et métadonnées des images (images, responsive_image, build_responsive_images, backfill_image_metadata)
+- File d'envoi du formulaire de contact (OutgoingEmail, send_queued_emails, pool SMTP)
 """
 
-from django.test import TestCase, Client
+import re
+import shutil
+import socket
+import socketserver
+import threading
+import tempfile
+import time
+from datetime import timedelta
+from io import BytesIO, StringIO
+from pathlib import Path
+from unittest import mock, skipUnless
+
+from django.conf import settings
+from django.core import mail
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management import call_command
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.db.utils import ConnectionHandler
+from django.test import TestCase, TransactionTestCase, Client, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from django.template import Context, Template
-from app_acceuil.models import SiteProfile
+from django.template import Context, Template, engines
+from django.utils import timezone
+from app_acceuil.mail_queue import deliver_due_emails, deliver_without_worker, enqueue_contact_emails, retry_delay
+from app_acceuil.admin import SiteProfileForm
+from app_acceuil.bundle import build_critical_css, compact, icon_codepoints, purge_css
+from app_acceuil.images import RESPONSIVE_WIDTHS, derivative_name
+from app_acceuil.context_processors import site_profile
+from app_acceuil.display_flags import ALL_FLAGS, FLAGS, flag_bit
+from app_acceuil.models import CONFIG_GROUPS, CORE_FIELDS, Education, Experience, OutgoingEmail, Section, SectionItem, SiteProfile
+from app_acceuil import section_cache
+from app_acceuil.page_cache import page_cache_path
+from app_acceuil.template_warmup import precompile_templates, template_names
+from app_acceuil.sqlite_pragmas import apply_sqlite_pragmas, sqlite_pragmas
 from app_projet.models import Project
+from project_site.database import database_config
+from PIL import Image
 from app_blog.models import BlogPost
 from app_service.models import Service
+from app_acceuil.services import ProfileService
+from app_acceuil.smtp_pool import SMTPConnectionPool, smtp_pool
+from app_acceuil.tests_unit.query_budget import QueryBudgetMixin
 
 
 class SiteProfileModelTest(TestCase):
@@ -77,6 +123,17 @@ class SiteProfileModelTest(TestCase):
         # is_published=True donne l'emoji 📢
         expected = f"📢 {self.profile.first_name} {self.profile.last_name}"
         self.assertEqual(str(self.profile), expected)
+    
+    def test_slug_collision_allocated_with_single_query(self):
+        """Deux profils homonymes reçoivent des slugs distincts, trouvés en une requête."""
+        twin = SiteProfile(first_name=self.profile.first_name, last_name=self.profile.last_name, profession=self.profile.profession)
+        twin.save()
+        self.assertEqual(twin.slug, f"{self.profile.slug}-1")
+        # Réenregistrer ne change pas le slug (le profil lui-même est exclu)
+        with CaptureQueriesContext(connection) as ctx:
+            twin.save()
+        self.assertEqual(twin.slug, f"{self.profile.slug}-1")
+        self.assertEqual(len([q for q in ctx.captured_queries if 'LIKE' in q['sql']]), 1)
 
 
 class PublishableContentTest(TestCase):
@@ -313,3 +370,1219 @@ class ContextProcessorTest(TestCase):
         self.assertIn('site_profile', response.context)
         self.assertIsNotNone(response.context['site_profile'])
 
+    
+    def _count_profile_queries(self, url):
+        """Compter les requêtes SQL qui chargent une ligne SiteProfile."""
+        import re
+        
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        pattern = re.compile(r'FROM "app_acceuil_siteprofile"(\s|$)')
+        return len([q for q in ctx.captured_queries if pattern.search(q['sql'])])
+    
+    def test_single_profile_query_on_home(self):
+        """Le profil est résolu une seule fois (processors + vue)."""
+        cache.clear()
+        self.assertEqual(self._count_profile_queries(reverse('acceuil')), 1)
+    
+    def test_single_profile_query_on_list_pages(self):
+        """Les pages de liste ne résolvent le profil qu'une seule fois."""
+        for name in ('projet_list', 'blogue_list', 'service_list'):
+            with self.subTest(name=name):
+                cache.clear()
+                self.assertEqual(self._count_profile_queries(reverse(name)), 1)
+    
+    def test_single_profile_query_on_profile_list_page(self):
+        """Même comportement pour un profil spécifique dans le chemin."""
+        cache.clear()
+        url = reverse('profile_blogue_list', kwargs={'nom': 'yama-sakho', 'profession': 'data-analyst'})
+        self.assertEqual(self._count_profile_queries(url), 1)
+    
+    def test_unknown_profile_returns_404(self):
+        """Un profil inexistant dans le chemin donne toujours une 404."""
+        url = reverse('profile_blogue_list', kwargs={'nom': 'inconnu', 'profession': 'personne'})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 404)
+    
+    def test_menu_precomputed_on_save(self):
+        """Le menu de la navbar est stocké sur le profil à l'enregistrement."""
+        self.assertEqual(self.profile.navbar_menu[0], {"name": "acceuil", "label": "Accueil", "url": "/"})
+        self.assertEqual([item["label"] for item in self.profile.navbar_menu], ["Accueil", "Projets", "Blogue", "Services"])
+    
+    def test_menu_served_without_rebuild(self):
+        """Le context processor renvoie le menu stocké sans le recalculer."""
+        with mock.patch('app_acceuil.context_processors.build_navbar_menu') as build:
+            response = self.client.get(reverse('acceuil'))
+        build.assert_not_called()
+        self.assertEqual(response.context['menu_items'], self.profile.navbar_menu)
+    
+    def test_menu_recomputed_only_when_navbar_fields_change(self):
+        """Seuls les libellés, ordres et noms déclenchent un recalcul."""
+        profile = SiteProfile.objects.get(pk=self.profile.pk)
+        with mock.patch('app_acceuil.models.build_navbar_menu') as build:
+            profile.location = "Dakar"
+            profile.save()
+        build.assert_not_called()
+        profile.blog_navbar_label = "Articles"
+        profile.blog_display_order = 0
+        profile.save()
+        profile.refresh_from_db()
+        self.assertEqual(profile.navbar_menu[1]["label"], "Articles")
+    
+    def test_menu_updated_when_default_moves(self):
+        """Le profil qui perd le statut par défaut passe aux URLs /profil/."""
+        SiteProfile.objects.create(first_name="Awa", last_name="Diop", profession="Designer", is_default=True)
+        self.profile.refresh_from_db()
+        self.assertFalse(self.profile.is_default)
+        self.assertEqual(self.profile.navbar_menu[0]["url"], "/profil/nom=yama-sakho&profession=data-analyst/")
+
+
+class ProfileCacheTest(TestCase):
+    """Tests du cache versionné des profils hydratés."""
+    
+    def setUp(self):
+        """Créer un profil par défaut avec du contenu et vider le cache."""
+        cache.clear()
+        self.client = Client()
+        self.profile = SiteProfile.objects.create(
+            first_name="Yama",
+            last_name="Sakho",
+            profession="Data Analyst",
+            is_published=True,
+            is_default=True
+        )
+        self.project = Project.objects.create(
+            title="Project 1",
+            resume="Resume 1",
+            content="Content 1",
+        )
+        self.profile.published_projects.add(self.project)
+        self.profile.featured_projects.add(self.project)
+        self.article = BlogPost.objects.create(title="Article 1", resume="Resume", content="Content")
+        self.profile.featured_articles.add(self.article)
+        self.service = Service.objects.create(title="Service 1", resume="Resume", content="Content")
+        self.profile.featured_services.add(self.service)
+    
+    def test_warm_homepage_issues_no_query(self):
+        """Une page d'accueil « chaude » ne coûte aucune requête SQL."""
+        self.client.get(reverse('acceuil'))
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('acceuil'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(ctx.captured_queries), 0, [q['sql'] for q in ctx.captured_queries])
+    
+    def test_cached_profile_keeps_prefetched_content(self):
+        """Le profil mis en cache conserve ses relations préchargées."""
+        SiteProfile.objects.get_default_profile()
+        with self.assertNumQueries(0):
+            profile = SiteProfile.objects.get_default_profile()
+            self.assertEqual(list(profile.featured_projects.all()), [self.project])
+    
+    def test_profile_save_invalidates_cache(self):
+        """Enregistrer le profil invalide l'entrée en cache."""
+        SiteProfile.objects.get_default_profile()
+        self.profile.blog_page_title = "Nouveau titre"
+        self.profile.save()
+        self.assertEqual(SiteProfile.objects.get_default_profile().blog_page_title, "Nouveau titre")
+    
+    def test_m2m_change_invalidates_cache(self):
+        """Ajouter un contenu mis en avant invalide l'entrée en cache."""
+        SiteProfile.objects.get_default_profile()
+        other = Project.objects.create(title="Project 2", resume="Resume 2", content="Content 2")
+        self.profile.featured_projects.add(other)
+        profile = SiteProfile.objects.get_default_profile()
+        self.assertIn(other, list(profile.featured_projects.all()))
+    
+    def test_content_save_invalidates_cache(self):
+        """Modifier un contenu préchargé invalide l'entrée en cache."""
+        SiteProfile.objects.get_default_profile()
+        self.project.title = "Titre modifié"
+        self.project.save()
+        profile = SiteProfile.objects.get_default_profile()
+        self.assertEqual(profile.featured_projects.all()[0].title, "Titre modifié")
+    
+    def test_unknown_slug_raises_does_not_exist(self):
+        """Un slug inconnu lève toujours DoesNotExist, même depuis le cache."""
+        for _ in range(2):
+            with self.assertRaises(SiteProfile.DoesNotExist):
+                SiteProfile.objects.get_by_slug_with_content("inconnu-personne")
+
+
+@override_settings(PAGE_CACHE_TIMEOUT=60)
+class PageCacheTest(TestCase):
+    """Tests du cache de pages complètes et de son invalidation."""
+    
+    def setUp(self):
+        """Créer un profil par défaut avec un projet publié et vider le cache."""
+        cache.clear()
+        self.client = Client()
+        self.profile = SiteProfile.objects.create(
+            first_name="Yama",
+            last_name="Sakho",
+            profession="Data Analyst",
+            is_published=True,
+            is_default=True
+        )
+        self.project = Project.objects.create(title="Project 1", resume="Resume 1", content="Content 1")
+        self.profile.published_projects.add(self.project)
+    
+    def test_warm_page_served_without_query(self):
+        """Une page déjà en cache est servie sans aucune requête SQL."""
+        url = reverse('projet_list')
+        first = self.client.get(url)
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first.content, second.content)
+    
+    def test_unknown_query_params_share_entry(self):
+        """Les paramètres que les vues ne lisent pas ne créent pas de nouvelle entrée."""
+        url = reverse('projet_list')
+        first = self.client.get(url, {'utm_source': "newsletter"})
+        with self.assertNumQueries(0):
+            second = self.client.get(url, {'x': "2", 'utm_campaign': "été"})
+        self.assertEqual(first.content, second.content)
+        # La pagination reste distincte : la page 2 n'existe pas
+        self.assertEqual(self.client.get(url, {'page': "2", 'utm_source': "newsletter"}).status_code, 404)
+        request = RequestFactory().get(url, {'utm_source': "a", 'q': "data", 'cursor': "abc"})
+        self.assertEqual(page_cache_path(request), f"{url}?cursor=abc&q=data")
+    
+    def test_validators_and_not_modified(self):
+        """La réponse porte ETag/Last-Modified et If-None-Match donne un 304."""
+        response = self.client.get(reverse('projet_detail', kwargs={'slug': self.project.slug}))
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+        not_modified = self.client.get(
+            reverse('projet_detail', kwargs={'slug': self.project.slug}),
+            HTTP_IF_NONE_MATCH=response['ETag'],
+        )
+        self.assertEqual(not_modified.status_code, 304)
+    
+    def test_profile_save_invalidates_pages(self):
+        """Modifier le profil dans l'admin régénère ses pages."""
+        self.client.get(reverse('acceuil'))
+        self.profile.location = "Dakar, Sénégal"
+        self.profile.save()
+        response = self.client.get(reverse('acceuil'))
+        self.assertContains(response, "Dakar, Sénégal")
+    
+    def test_content_save_invalidates_detail(self):
+        """Modifier un projet régénère sa page de détail."""
+        url = reverse('projet_detail', kwargs={'slug': self.project.slug})
+        self.client.get(url)
+        self.project.content = "Contenu modifié"
+        self.project.save()
+        self.assertContains(self.client.get(url), "Contenu modifié")
+    
+    def test_reverse_clear_invalidates_profile_pages(self):
+        """Retirer un projet de tous ses profils (projet.profiles.clear()) régénère leurs listes."""
+        # Un autre projet publié : la liste ne retombe pas sur tous les projets
+        self.profile.published_projects.add(Project.objects.create(title="Project 2", resume="Resume 2", content="Content 2"))
+        url = reverse('projet_list')
+        self.assertContains(self.client.get(url), "Project 1")
+        self.project.profiles.clear()
+        self.assertNotContains(self.client.get(url), "Project 1")
+    
+    def test_slug_rename_invalidates_old_path(self):
+        """Après un changement de slug, l'ancienne adresse n'est plus servie depuis le cache."""
+        old_url = reverse('projet_detail', kwargs={'slug': self.project.slug})
+        self.assertEqual(self.client.get(old_url).status_code, 200)
+        self.project.slug = "project-renomme"
+        self.project.save()
+        self.assertEqual(self.client.get(old_url).status_code, 404)
+    
+    def test_csrf_token_not_shared_between_visitors(self):
+        """Le jeton CSRF du formulaire de contact est propre à chaque visiteur."""
+        first = Client().get(reverse('acceuil'))
+        second = Client().get(reverse('acceuil'))
+        self.assertNotIn(b"__PAGE_CACHE_CSRF_TOKEN__", second.content)
+        self.assertIn('csrftoken', second.cookies)
+        self.assertNotEqual(first.cookies['csrftoken'].value, second.cookies['csrftoken'].value)
+    
+    def test_session_cookie_bypasses_cache(self):
+        """Les visiteurs avec une session (administrateurs) ne sont pas servis depuis le cache."""
+        url = reverse('projet_list')
+        self.client.get(url)
+        self.client.cookies['sessionid'] = 'abc'
+        response = self.client.get(url)
+        self.assertNotIn('ETag', response)
+        self.assertIn('no-store', response['Cache-Control'])
+
+
+class ProfileServiceTest(TestCase):
+    """Tests de la résolution des contenus mis en avant."""
+    
+    def setUp(self):
+        """Créer un profil et des contenus aux statuts variés."""
+        cache.clear()
+        self.profile = SiteProfile.objects.create(
+            first_name="Yama",
+            last_name="Sakho",
+            profession="Data Analyst",
+            is_published=True,
+            is_default=True
+        )
+        self.projects = [
+            Project.objects.create(title=f"Project {i}", resume="Resume", content="Content")
+            for i in range(5)
+        ]
+        self.articles = [
+            BlogPost.objects.create(title=f"Article {i}", resume="Resume", content="Content")
+            for i in range(5)
+        ]
+        self.services = [
+            Service.objects.create(title=f"Service {i}", resume="Resume", content="Content")
+            for i in range(5)
+        ]
+        # Projets : mis en avant ; articles : publiés seulement ; services : aucun lien
+        self.profile.featured_projects.add(*self.projects[:4])
+        self.profile.published_projects.add(*self.projects)
+        self.profile.published_articles.add(*self.articles[1:])
+    
+    def test_resolution_order(self):
+        """Mis en avant (tous), sinon publiés (limités), sinon tous les contenus (limités)."""
+        context = ProfileService.build_profile_context(self.profile)
+        self.assertEqual(len(context['projets']), 4)
+        self.assertEqual(context['articles'], list(self.profile.published_articles.all()[:3]))
+        self.assertEqual(context['services'], list(Service.objects.all()[:3]))
+    
+    def test_returns_evaluated_lists(self):
+        """Les gabarits reçoivent des listes déjà évaluées."""
+        context = ProfileService.build_profile_context(self.profile)
+        for key in ('projets', 'articles', 'services'):
+            self.assertIsInstance(context[key], list)
+    
+    def test_one_query_per_type_without_prefetch(self):
+        """Sans préchargement, une seule requête par type de contenu (plus les sections)."""
+        profile = SiteProfile.objects.get(pk=self.profile.pk)
+        with self.assertNumQueries(4):
+            ProfileService.build_profile_context(profile)
+    
+    def test_prefetched_profile_only_queries_global_fallback(self):
+        """Avec préchargement, seul le repli global (services) interroge la base."""
+        profile = SiteProfile.objects.get_published_with_content().get(pk=self.profile.pk)
+        with self.assertNumQueries(1):
+            context = ProfileService.build_profile_context(profile)
+        self.assertEqual(
+            context, ProfileService.build_profile_context(SiteProfile.objects.get(pk=self.profile.pk))
+        )
+    
+    def test_no_profile_falls_back_to_all_content(self):
+        """Sans profil, les premiers contenus de chaque type sont retournés."""
+        context = ProfileService.build_profile_context(None)
+        self.assertEqual(context['projets'], list(Project.objects.all()[:3]))
+
+
+class AccueilQueryBudgetTest(QueryBudgetMixin, TestCase):
+    """Budgets de requêtes SQL et de temps de rendu des pages d'accueil."""
+    
+    def setUp(self):
+        """Créer le jeu de données de référence."""
+        self.seed_budget_dataset()
+    
+    def test_acceuil_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'acceuil'."""
+        self.assertRouteWithinBudget('acceuil')
+    
+    def test_profile_home_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'profile_home'."""
+        self.assertRouteWithinBudget('profile_home')
+
+
+class FailingEmailBackend(BaseEmailBackend):
+    """Backend de test simulant un serveur SMTP indisponible."""
+    
+    def send_messages(self, email_messages):
+        raise ConnectionRefusedError("SMTP indisponible")
+
+
+@override_settings(CONTACT_EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend', CONTACT_EMAIL_WORKER=True)
+class ContactMailQueueTest(TestCase):
+    """Tests de la file d'envoi du formulaire de contact."""
+    
+    def setUp(self):
+        """Créer un profil avec des identifiants Gmail."""
+        # Le pool du processus ne doit pas garder de session d'un autre test
+        smtp_pool.close_all()
+        self.addCleanup(smtp_pool.close_all)
+        self.profile = SiteProfile.objects.create(
+            first_name="Yama",
+            last_name="Sakho",
+            profession="Data Analyst",
+            email="yama@example.com",
+            gmail_app_password="secret",
+            is_published=True,
+            is_default=True
+        )
+        self.form = {
+            'name': "Awa Diop",
+            'email': "awa@example.com",
+            'subject': "Collaboration",
+            'message': "Bonjour !",
+        }
+    
+    def test_view_only_enqueues(self):
+        """Avec un worker, la vue enregistre les deux emails sans rien envoyer."""
+        response = self.client.post(reverse('contact'), self.form)
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(len(mail.outbox), 0)
+        recipients = sorted(email.recipients[0] for email in OutgoingEmail.objects.all())
+        self.assertEqual(recipients, ["awa@example.com", "yama@example.com"])
+    
+    @override_settings(CONTACT_EMAIL_WORKER=False)
+    def test_view_defers_delivery_without_worker(self):
+        """Sans worker configuré, rien n'est envoyé pendant la requête : l'envoi attend la validation."""
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client.post(reverse('contact'), self.form)
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(len(callbacks), 1)
+    
+    def test_delivery_limited_to_pks(self):
+        """Avec `pks`, seuls ces emails sont réservés et envoyés, pas le reste de la file."""
+        self.client.post(reverse('contact'), self.form)
+        owner, confirmation = OutgoingEmail.objects.order_by('pk')
+        self.assertEqual(deliver_due_emails(pks=[confirmation.pk]), (1, 0))
+        self.assertEqual(mail.outbox[0].to, ["awa@example.com"])
+        owner.refresh_from_db()
+        self.assertEqual(owner.status, OutgoingEmail.STATUS_PENDING)
+    
+    def test_confirmation_disabled(self):
+        """Sans confirmation activée, seule la notification est mise en file."""
+        self.profile.enable_confirmation_email = False
+        self.profile.save()
+        self.client.post(reverse('contact'), self.form)
+        self.assertEqual(OutgoingEmail.objects.count(), 1)
+    
+    def test_header_injection_rejected(self):
+        """Un objet contenant un retour à la ligne n'est pas mis en file."""
+        self.client.post(reverse('contact'), dict(self.form, subject="Objet\nBcc: spam@example.com"))
+        self.assertEqual(OutgoingEmail.objects.count(), 0)
+    
+    def test_worker_delivers_queued_emails(self):
+        """Le worker envoie les emails dus et les marque comme envoyés."""
+        self.client.post(reverse('contact'), self.form)
+        self.assertEqual(deliver_due_emails(), (2, 0))
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(mail.outbox[0].from_email, "yama@example.com")
+        self.assertFalse(OutgoingEmail.objects.exclude(status=OutgoingEmail.STATUS_SENT).exists())
+        self.assertEqual(deliver_due_emails(), (0, 0))
+    
+    @override_settings(
+        CONTACT_EMAIL_BACKEND='app_acceuil.tests_unit.test_acceuil.FailingEmailBackend',
+        CONTACT_EMAIL_MAX_ATTEMPTS=2,
+    )
+    def test_worker_retries_with_backoff(self):
+        """Un échec repousse la tentative suivante, puis l'email passe en échec définitif."""
+        self.profile.enable_confirmation_email = False
+        self.profile.save()
+        self.client.post(reverse('contact'), self.form)
+        now = timezone.now()
+        self.assertEqual(deliver_due_emails(now=now), (0, 1))
+        email = OutgoingEmail.objects.get()
+        self.assertEqual(email.status, OutgoingEmail.STATUS_PENDING)
+        self.assertEqual(email.next_attempt_at, now + retry_delay(1))
+        self.assertIn("SMTP indisponible", email.last_error)
+        # Pas encore dû : le worker l'ignore
+        self.assertEqual(deliver_due_emails(now=now), (0, 0))
+        self.assertEqual(deliver_due_emails(now=email.next_attempt_at), (0, 1))
+        self.assertEqual(OutgoingEmail.objects.get().status, OutgoingEmail.STATUS_FAILED)
+    
+    def test_management_command_once(self):
+        """La commande `send_queued_emails --once` vide la file puis s'arrête."""
+        self.client.post(reverse('contact'), self.form)
+        out = StringIO()
+        call_command('send_queued_emails', '--once', stdout=out)
+        self.assertIn("2 email(s) envoyé(s)", out.getvalue())
+        self.assertEqual(len(mail.outbox), 2)
+
+
+@override_settings(CONTACT_EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend', CONTACT_EMAIL_WORKER=False)
+class ContactInlineDeliveryTest(TransactionTestCase):
+    """Envoi sans worker : thread démarré après la validation, limité aux emails de la requête."""
+    
+    def setUp(self):
+        smtp_pool.close_all()
+        self.addCleanup(smtp_pool.close_all)
+        self.profile = SiteProfile.objects.create(
+            first_name="Yama", last_name="Sakho", email="yama@example.com", gmail_app_password="secret",
+            is_published=True, is_default=True,
+        )
+    
+    def test_sends_only_the_new_emails_in_background(self):
+        """Les emails de la requête partent dans un thread ; un réessai dû d'un autre message attend la commande."""
+        retry = OutgoingEmail.objects.create(
+            profile=self.profile, subject="Ancien", body="B", from_email="yama@example.com",
+            recipients=["old@example.com"], attempts=1, next_attempt_at=timezone.now() - timedelta(minutes=1),
+        )
+        emails = enqueue_contact_emails(self.profile, "Awa Diop", "awa@example.com", "", "", "Collaboration", "Bonjour !")
+        thread = deliver_without_worker(emails)
+        thread.join(timeout=10)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), ["awa@example.com", "yama@example.com"])
+        retry.refresh_from_db()
+        self.assertEqual(retry.status, OutgoingEmail.STATUS_PENDING)
+    
+    @override_settings(CONTACT_EMAIL_WORKER=True)
+    def test_worker_configured(self):
+        """Avec un worker, aucun thread n'est lancé."""
+        emails = enqueue_contact_emails(self.profile, "Awa Diop", "awa@example.com", "", "", "Collaboration", "Bonjour !")
+        self.assertIsNone(deliver_without_worker(emails))
+
+
+class LocalSMTPServer(socketserver.ThreadingTCPServer):
+    """Serveur SMTP local minimal (remplace Gmail), qui compte sessions et commandes."""
+    
+    allow_reuse_address = True
+    daemon_threads = True
+    
+    def __init__(self):
+        self.sessions = []
+        self.messages = []
+        self.commands = []
+        super().__init__(('127.0.0.1', 0), LocalSMTPHandler)
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+    
+    def drop_sessions(self):
+        """Coupe toutes les sessions ouvertes, comme un serveur qui expire les connexions."""
+        for sock in self.sessions:
+            sock.shutdown(socket.SHUT_RDWR)
+    
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class LocalSMTPHandler(socketserver.StreamRequestHandler):
+    
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+    
+    def handle(self):
+        self.server.sessions.append(self.request)
+        self.reply("220 localhost ESMTP")
+        while True:
+            line = self.rfile.readline().decode().rstrip("\r\n")
+            if not line:
+                return
+            verb = line.split(" ", 1)[0].upper()
+            self.server.commands.append(verb)
+            if verb == "EHLO":
+                self.reply("250-localhost")
+                self.reply("250 AUTH PLAIN")
+            elif verb == "AUTH":
+                self.reply("235 Authentication successful")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = []
+                while (chunk := self.rfile.readline()) not in (b".\r\n", b""):
+                    data.append(chunk)
+                self.server.messages.append(b"".join(data))
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+class SMTPConnectionPoolTest(TestCase):
+    """Tests du pool de sessions SMTP contre un serveur SMTP local."""
+    
+    def setUp(self):
+        """Démarrer le serveur local et créer un profil qui l'utilise."""
+        self.server = LocalSMTPServer()
+        self.addCleanup(self.server.stop)
+        settings_override = override_settings(
+            CONTACT_EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend',
+            CONTACT_EMAIL_HOST='127.0.0.1',
+            CONTACT_EMAIL_PORT=self.server.server_address[1],
+            CONTACT_EMAIL_USE_TLS=False,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.pool = SMTPConnectionPool(max_connections=1, acquire_timeout=0.2)
+        self.addCleanup(self.pool.close_all)
+        self.profile = SiteProfile.objects.create(
+            first_name="Yama",
+            last_name="Sakho",
+            profession="Data Analyst",
+            email="yama@example.com",
+            gmail_app_password="secret",
+            is_published=True,
+            is_default=True
+        )
+    
+    def enqueue(self):
+        enqueue_contact_emails(self.profile, "Awa Diop", "awa@example.com", "", "", "Collaboration", "Bonjour !")
+    
+    def test_notification_and_confirmation_share_one_session(self):
+        """Les deux emails d'une soumission passent par une seule session authentifiée."""
+        self.enqueue()
+        self.assertEqual(deliver_due_emails(pool=self.pool), (2, 0))
+        self.assertEqual(len(self.server.messages), 2)
+        self.assertEqual(self.server.commands.count("AUTH"), 1)
+    
+    def test_session_reused_across_passes(self):
+        """Une rafale de soumissions réutilise la session ouverte, vérifiée par NOOP."""
+        self.pool.keepalive_seconds = 0
+        for _ in range(3):
+            self.enqueue()
+            self.assertEqual(deliver_due_emails(pool=self.pool), (2, 0))
+        self.assertEqual(len(self.server.sessions), 1)
+        self.assertEqual(self.server.commands.count("NOOP"), 2)
+    
+    def test_reconnects_after_server_disconnect(self):
+        """Une session coupée par le serveur est rouverte de façon transparente."""
+        self.enqueue()
+        deliver_due_emails(pool=self.pool)
+        self.server.drop_sessions()
+        self.enqueue()
+        self.assertEqual(deliver_due_emails(pool=self.pool), (2, 0))
+        self.assertEqual(len(self.server.sessions), 2)
+        self.assertEqual(len(self.server.messages), 4)
+    
+    def test_concurrency_is_capped(self):
+        """Au-delà de `max_connections` sessions simultanées, l'appelant attend puis abandonne."""
+        with self.pool.connection(self.profile):
+            with self.assertRaises(TimeoutError):
+                with self.pool.connection(self.profile):
+                    pass
+
+
+class ProfileConfigGroupsTest(TestCase):
+    """Tests des groupes de configuration chargés à la demande."""
+    
+    def setUp(self):
+        """Créer un profil par défaut et vider le cache."""
+        cache.clear()
+        self.profile = SiteProfile.objects.create(
+            first_name="Yama",
+            last_name="Sakho",
+            profession="Data Analyst",
+            is_published=True,
+            is_default=True
+        )
+    
+    def test_narrow_projection_defers_config_groups(self):
+        """La projection étroite ne charge que le tronc commun (navbar, <title>)."""
+        profile = SiteProfile.objects.with_config(()).get(pk=self.profile.pk)
+        deferred = profile.get_deferred_fields()
+        for group in CONFIG_GROUPS.values():
+            self.assertTrue(set(group) <= deferred)
+        self.assertFalse(deferred.intersection(CORE_FIELDS))
+    
+    def test_deferred_group_loaded_in_one_query(self):
+        """Lire un champ différé charge tout son groupe en une seule requête."""
+        profile = SiteProfile.objects.with_config(()).get(pk=self.profile.pk)
+        with self.assertNumQueries(1):
+            profile.blog_page_title
+            profile.blog_page_intro
+            profile.blog_back_button_text
+        self.assertTrue(set(CONFIG_GROUPS['projects']) <= profile.get_deferred_fields())
+    
+    def test_list_page_loads_only_its_group(self):
+        """La liste des articles ne lit pas les colonnes des projets ni du contact."""
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse('blogue_list'))
+        self.assertEqual(response.status_code, 200)
+        profile_sql = [q['sql'] for q in ctx.captured_queries if 'FROM "app_acceuil_siteprofile"' in q['sql']]
+        self.assertEqual(len(profile_sql), 1)
+        self.assertIn('"blog_page_title"', profile_sql[0])
+        self.assertNotIn('"projects_page_intro"', profile_sql[0])
+        self.assertNotIn('"contact_intro_text"', profile_sql[0])
+    
+    def test_context_processor_alone_uses_narrow_projection(self):
+        """Sans vue qui résout le profil, les context processors se contentent du tronc commun."""
+        request = RequestFactory().get('/')
+        request.resolver_match = None
+        profile = site_profile(request)['site_profile']
+        self.assertEqual(profile, self.profile)
+        self.assertIn('blog_page_title', profile.get_deferred_fields())
+
+
+class DisplayFlagsTest(TestCase):
+    """Tests des masques d'affichage des métadonnées (un entier par type de contenu)."""
+    
+    def setUp(self):
+        """Créer un profil de test."""
+        cache.clear()
+        self.profile = SiteProfile.objects.create(
+            first_name="Yama",
+            last_name="Sakho",
+            profession="Data Analyst",
+            is_published=True,
+            blog_show_author_detail=False,
+            services_show_update_date_home=False
+        )
+    
+    def test_legacy_booleans_map_to_bits(self):
+        """Les anciens booléens lisent et écrivent un bit du masque de leur type."""
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.blog_display_flags, ALL_FLAGS & ~flag_bit('author', 'detail'))
+        self.assertEqual(self.profile.services_display_flags, ALL_FLAGS & ~flag_bit('update_date', 'home'))
+        self.assertEqual(self.profile.projects_display_flags, ALL_FLAGS)
+        self.assertFalse(self.profile.blog_show_author_detail)
+        self.assertTrue(self.profile.blog_show_author_list)
+        
+        self.profile.blog_show_author_detail = True
+        self.assertEqual(self.profile.blog_display_flags, ALL_FLAGS)
+    
+    def test_all_flags_are_distinct_bits(self):
+        """Les 12 cases de chaque type occupent des bits distincts."""
+        for field in ('projects_display_flags', 'blog_display_flags', 'services_display_flags'):
+            bits = [bit for _name, mask_field, bit in FLAGS if mask_field == field]
+            self.assertEqual(len(set(bits)), 12)
+            self.assertEqual(sum(bits), ALL_FLAGS)
+    
+    def test_shows_filter(self):
+        """Le filtre shows décode « type.metadonnee.contexte » (et * pour « au moins une »)."""
+        template = Template(
+            '{% load utils %}'
+            '{% if profile|shows:"blog.author.detail" %}A{% endif %}'
+            '{% if profile|shows:"blog.author.list" %}B{% endif %}'
+            '{% if profile|shows:"blog.*.detail" %}C{% endif %}'
+            '{% if none|shows:"blog.author.list" %}D{% endif %}'
+        )
+        self.assertEqual(template.render(Context({"profile": self.profile, "none": None})), "BC")
+        
+        for name, _field, _bit in FLAGS:
+            if name.startswith('blog_') and name.endswith('_detail'):
+                setattr(self.profile, name, False)
+        self.assertEqual(Template('{% load utils %}{% if p|shows:"blog.*.detail" %}C{% endif %}').render(Context({"p": self.profile})), "")
+    
+    def test_shows_filter_rejects_unknown_spec(self):
+        """Une option inconnue lève une erreur explicite plutôt que de masquer en silence."""
+        template = Template('{% load utils %}{{ profile|shows:"blog.avatar.detail" }}')
+        with self.assertRaises(ValueError):
+            template.render(Context({"profile": self.profile}))
+    
+    def test_admin_form_keeps_checkbox_matrix(self):
+        """Le formulaire admin garde une case par option et les reporte dans les masques."""
+        form = SiteProfileForm(instance=self.profile)
+        self.assertNotIn('blog_display_flags', form.fields)
+        self.assertFalse(form.initial['blog_show_author_detail'])
+        self.assertTrue(form.initial['blog_show_author_home'])
+        
+        data = {name: value for name, value in form.initial.items() if value is not None and not isinstance(value, list)}
+        data.update({name: True for name, _field, _bit in FLAGS})
+        data['projects_show_profession_list'] = False
+        form = SiteProfileForm(data, instance=self.profile)
+        self.assertTrue(form.is_valid(), form.errors)
+        profile = form.save()
+        profile.refresh_from_db()
+        self.assertEqual(profile.blog_display_flags, ALL_FLAGS)
+        self.assertEqual(profile.projects_display_flags, ALL_FLAGS & ~flag_bit('profession', 'list'))
+    
+    def test_display_flags_belong_to_their_config_group(self):
+        """Chaque masque est chargé avec le groupe de configuration de sa section."""
+        self.assertIn('blog_display_flags', CONFIG_GROUPS['blog'])
+        self.assertIn('projects_display_flags', CONFIG_GROUPS['projects'])
+        self.assertIn('services_display_flags', CONFIG_GROUPS['services'])
+
+
+class SectionFragmentCacheTest(TestCase):
+    """Tests du cache des cartes de sections de la page d'accueil."""
+    
+    def setUp(self):
+        """Créer un profil par défaut avec une section et deux éléments."""
+        cache.clear()
+        self.profile = SiteProfile.objects.create(
+            first_name="Yama",
+            last_name="Sakho",
+            profession="Data Analyst",
+            is_published=True,
+            is_default=True
+        )
+        self.section = Section.objects.create(profile=self.profile, section_type='competences', title="Compétences", order=1)
+        self.item = SectionItem.objects.create(section=self.section, title="Python", order=1)
+        SectionItem.objects.create(section=self.section, title="SQL", order=2)
+    
+    def render_home(self):
+        with mock.patch.object(section_cache, 'render_section', wraps=section_cache.render_section) as render:
+            response = self.client.get(reverse('acceuil'))
+        self.assertEqual(response.status_code, 200)
+        return response, render.call_count
+    
+    def test_homepage_reuses_cached_fragment(self):
+        """La deuxième visite assemble le fragment en cache sans rendre la section."""
+        response, rendered = self.render_home()
+        self.assertContains(response, "Python")
+        self.assertEqual(rendered, 1)
+        response, rendered = self.render_home()
+        self.assertContains(response, "Python")
+        self.assertEqual(rendered, 0)
+    
+    def test_item_save_renders_section_again(self):
+        """Modifier un élément change la clé du fragment de sa section."""
+        self.render_home()
+        self.item.title = "Python avancé"
+        self.item.save()
+        response, rendered = self.render_home()
+        self.assertContains(response, "Python avancé")
+        self.assertEqual(rendered, 1)
+    
+    def test_item_delete_renders_section_again(self):
+        """Supprimer un élément touche la section : le fragment est rendu à nouveau."""
+        self.render_home()
+        self.item.delete()
+        response, rendered = self.render_home()
+        self.assertNotContains(response, "Python")
+        self.assertContains(response, "SQL")
+        self.assertEqual(rendered, 1)
+    
+    def test_inactive_section_skipped(self):
+        """Une section désactivée n'est ni rendue ni affichée."""
+        self.section.is_active = False
+        self.section.save()
+        response, rendered = self.render_home()
+        self.assertNotContains(response, "Python")
+        self.assertEqual(rendered, 0)
+    
+    def test_template_change_renders_section_again(self):
+        """Un gabarit modifié (déploiement) change la clé : l'ancien HTML n'est plus servi."""
+        self.render_home()
+        templates = [{**settings.TEMPLATES[0], 'APP_DIRS': False, 'OPTIONS': {**settings.TEMPLATES[0]['OPTIONS'], 'loaders': [
+            ('django.template.loaders.locmem.Loader', {section_cache.TEMPLATE_NAME: '<div class="nouvelle-carte">{{ section.title }}</div>'}),
+            *settings.TEMPLATE_LOADERS,
+        ]}}]
+        with override_settings(TEMPLATES=templates):
+            response, rendered = self.render_home()
+        self.assertContains(response, "nouvelle-carte")
+        self.assertEqual(rendered, 1)
+    
+    def test_version_setting_renders_section_again(self):
+        """Augmenter SECTION_FRAGMENT_VERSION invalide toutes les cartes."""
+        self.render_home()
+        with override_settings(SECTION_FRAGMENT_VERSION="2"):
+            _response, rendered = self.render_home()
+        self.assertEqual(rendered, 1)
+    
+    def test_many_sections_served_from_cache(self):
+        """15 sections et 100 éléments : cache chaud, aucune requête ni rendu, quelques ms."""
+        for index in range(14):
+            section = Section.objects.create(profile=self.profile, section_type='custom', title=f"Section {index}", order=index + 2)
+            SectionItem.objects.bulk_create(
+                SectionItem(section=section, title=f"Élément {index}-{position}", details="<p>Détails</p>", order=position)
+                for position in range(7)
+            )
+        profile = SiteProfile.objects.get_published_with_content().get(pk=self.profile.pk)
+        self.assertEqual(sum(len(section.items.all()) for section in profile.sections.all()), 100)
+        
+        self.assertEqual(len(section_cache.render_section_fragments(profile)), 15)
+        with self.assertNumQueries(0), mock.patch.object(section_cache, 'render_section') as render:
+            start = time.perf_counter()
+            fragments = section_cache.render_section_fragments(profile)
+            elapsed = time.perf_counter() - start
+        render.assert_not_called()
+        self.assertEqual(len(fragments), 15)
+        self.assertIn("Élément 13-6", fragments[-1])
+        self.assertLess(elapsed, 0.05)
+
+
+class TemplateWarmupTest(TestCase):
+    """Tests de la précompilation des gabarits (chargeur en cache)."""
+    
+    def test_project_templates_are_listed(self):
+        """Les gabarits du projet et des applications sont trouvés par les chargeurs."""
+        names = template_names(engines['django'].engine)
+        for name in ('base.html', 'app_acceuil/acceuil.html', 'includes/section_blog.html', 'app_blog/detail.html'):
+            self.assertIn(name, names)
+        self.assertEqual(len(names), len(set(names)))
+    
+    def test_precompile_fills_cached_loader(self):
+        """Après précompilation, le chargeur en cache sert les gabarits sans les relire."""
+        loader = engines['django'].engine.template_loaders[0]
+        loader.reset()
+        compiled, errors = precompile_templates()
+        self.assertEqual(errors, {})
+        self.assertGreater(compiled, 0)
+        self.assertIn('app_acceuil/acceuil.html', loader.get_template_cache)
+    
+    def test_precompile_command(self):
+        """La commande de déploiement compile tous les gabarits sans erreur."""
+        out = StringIO()
+        call_command('precompile_templates', stdout=out)
+        self.assertIn("gabarit(s) compilé(s)", out.getvalue())
+
+
+class SQLitePragmasTest(TestCase):
+    """Tests des PRAGMA SQLite appliqués à chaque connexion."""
+    
+    def test_test_connection_is_tuned(self):
+        """La connexion courante a reçu busy_timeout, synchronous et cache_size."""
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA busy_timeout")
+            self.assertEqual(cursor.fetchone()[0], sqlite_pragmas()['busy_timeout'])
+            cursor.execute("PRAGMA synchronous")
+            self.assertEqual(cursor.fetchone()[0], 1)  # NORMAL
+            cursor.execute("PRAGMA cache_size")
+            self.assertEqual(cursor.fetchone()[0], sqlite_pragmas()['cache_size'])
+    
+    @override_settings(SQLITE_PRAGMAS={'cache_size': -4000})
+    def test_settings_override_defaults(self):
+        """SQLITE_PRAGMAS remplace une valeur sans perdre les autres réglages."""
+        pragmas = sqlite_pragmas(wal=True)
+        self.assertEqual(pragmas['cache_size'], -4000)
+        self.assertEqual(pragmas['journal_mode'], 'WAL')
+        self.assertEqual(list(pragmas)[0], 'busy_timeout')
+    
+    @override_settings(SQLITE_WAL=False)
+    def test_wal_is_opt_in(self):
+        """Sans SQLITE_WAL, le journal du fichier n'est pas modifié (db.sqlite3 versionné)."""
+        self.assertNotIn('journal_mode', sqlite_pragmas())
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'site.sqlite3'
+            config = ConnectionHandler().configure_settings({'default': database_config(None, default_sqlite=path)})
+            tracked = DatabaseWrapper(config['default'], alias='tracked')
+            try:
+                with tracked.cursor() as cursor:
+                    cursor.execute("PRAGMA journal_mode")
+                    self.assertEqual(cursor.fetchone()[0], 'delete')
+            finally:
+                tracked.close()
+    
+    def test_other_vendors_ignored(self):
+        """Une connexion PostgreSQL n'est pas touchée."""
+        postgres = mock.Mock(vendor='postgresql')
+        apply_sqlite_pragmas(sender=None, connection=postgres)
+        postgres.cursor.assert_not_called()
+    
+    def test_loadtest_command(self):
+        """Le test de charge compare les deux scénarios."""
+        out = StringIO()
+        call_command('loadtest_sqlite', readers=1, writers=1, duration=0.2, stdout=out)
+        self.assertIn("Avant", out.getvalue())
+        self.assertIn("Après", out.getvalue())
+
+
+@skipUnless(connection.vendor == 'sqlite', "Plans d'exécution propres à SQLite")
+class IndexUsageTest(QueryBudgetMixin, TestCase):
+    """Les requêtes chaudes passent par un index, sans tri en B-tree temporaire."""
+    
+    def setUp(self):
+        self.seed_budget_dataset()
+    
+    def explain(self, sql, params=()):
+        """Plan `EXPLAIN QUERY PLAN` d'une requête SQL, une étape par ligne."""
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            return "\n".join(row[-1] for row in cursor.fetchall())
+    
+    def homepage_plans(self):
+        """Plans des requêtes de l'accueil, caches désactivés, par table interrogée."""
+        cache.clear()
+        with override_settings(SITE_PROFILE_CACHE_TIMEOUT=0, PAGE_CACHE_TIMEOUT=0):
+            with CaptureQueriesContext(connection) as ctx:
+                self.client.get(reverse('acceuil'))
+        plans = {}
+        for query in ctx.captured_queries:
+            table = query['sql'].split(' FROM "', 1)[1].split('"', 1)[0]
+            plans.setdefault(table, []).append(self.explain(query['sql']))
+        return plans
+    
+    def test_default_profile_lookup_uses_partial_index(self):
+        """Le profil par défaut publié est trouvé par l'index partiel."""
+        plans = self.homepage_plans()
+        for plan in plans['app_acceuil_siteprofile']:
+            self.assertIn("siteprofile_default_idx", plan)
+    
+    def test_sections_use_order_indexes(self):
+        """Les sections d'un profil sont lues dans l'ordre de l'index (profil, ordre)."""
+        plans = self.homepage_plans()
+        for plan in plans['app_acceuil_section']:
+            self.assertIn("section_profile_order_idx", plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+        # Préchargement `section_id IN (...)` : recherche indexée, tri global inévitable
+        for plan in plans['app_acceuil_sectionitem']:
+            self.assertIn("SEARCH app_acceuil_sectionitem USING INDEX", plan)
+        section = Section.objects.filter(profile=self.profile).first()
+        plan = section.items.all().explain()
+        self.assertIn("sectionitem_section_order_idx", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+    
+    def test_profile_children_use_order_indexes(self):
+        """Formations et expériences d'un profil sont triées par l'index."""
+        for model in (Education, Experience):
+            plan = model.objects.filter(profile=self.profile).explain()
+            self.assertIn(f"{model._meta.model_name}_profile_order_idx", plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+    
+    def test_latest_content_uses_publication_index(self):
+        """Les derniers contenus publiés sont lus par l'index sur published_at."""
+        for model in (Project, BlogPost, Service):
+            plan = model.objects.all()[:3].explain()
+            self.assertIn(f"{model._meta.db_table}_pub_idx", plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+
+
+
+def png_upload(name, size, mode='RGB', color='navy'):
+    """Fichier PNG téléversé de la taille donnée."""
+    buffer = BytesIO()
+    Image.new(mode, size, color).save(buffer, 'PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+
+class ResponsiveImagesTest(TestCase):
+    """Tests pour les déclinaisons WebP des images téléversées."""
+    
+    def setUp(self):
+        """Médias dans un dossier temporaire."""
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+    
+    def derivative_sizes(self, fieldfile):
+        sizes = []
+        for width in RESPONSIVE_WIDTHS:
+            with fieldfile.storage.open(derivative_name(fieldfile.name, width)) as f:
+                image = Image.open(f)
+                self.assertEqual(image.format, 'WEBP')
+                sizes.append(image.size)
+        return sizes
+    
+    def test_upload_builds_derivatives(self):
+        """Tester qu'une image téléversée est déclinée aux largeurs prévues, proportions conservées."""
+        project = Project.objects.create(title="Tableau", resume="R", content="C", main_image=png_upload("tableau.png", (2000, 1000)))
+        self.assertEqual(derivative_name(project.main_image.name, 320), "projets/responsive/tableau-320w.webp")
+        self.assertEqual(self.derivative_sizes(project.main_image), [(96, 48), (320, 160), (640, 320), (1280, 640)])
+    
+    def test_small_image_is_not_upscaled(self):
+        """Tester qu'une image étroite n'est jamais agrandie (transparence conservée)."""
+        item = Education.objects.create(
+            profile=SiteProfile.objects.create(first_name="A", last_name="B"),
+            title="Maîtrise",
+            icon=png_upload("logo.png", (200, 100), mode='RGBA', color=(0, 0, 0, 0))
+        )
+        self.assertEqual(self.derivative_sizes(item.icon), [(96, 48), (200, 100), (200, 100), (200, 100)])
+        with item.icon.storage.open(derivative_name(item.icon.name, 320)) as f:
+            self.assertEqual(Image.open(f).mode, 'RGBA')
+    
+    def test_unchanged_image_is_not_rebuilt(self):
+        """Tester qu'un enregistrement sans nouveau fichier ne régénère rien."""
+        project = Project.objects.create(title="Tableau", resume="R", content="C", main_image=png_upload("tableau.png", (800, 600)))
+        with mock.patch('app_acceuil.images.build_derivatives') as build:
+            project.title = "Tableau de bord"
+            project.save()
+            Project.objects.get(pk=project.pk).save()
+        build.assert_not_called()
+    
+    def test_template_tag_srcset(self):
+        """Tester que le tag émet srcset/sizes pour un champ décliné, et un <img> simple sinon."""
+        project = Project.objects.create(title="Tableau", resume="R", content="C", main_image=png_upload("tableau.png", (800, 600)))
+        template = Template('{% load utils %}{% responsive_image image sizes="350px" alt=title class="img-fluid" %}')
+        html = template.render(Context({'image': project.main_image, 'title': 'Tableau "ventes"'}))
+        self.assertIn(f'src="{project.main_image.url}"', html)
+        self.assertIn('/media/projets/responsive/tableau-96w.webp 96w, ', html)
+        # L'original fait 800px : la déclinaison 1280w (non agrandie) est annoncée à sa largeur réelle
+        self.assertIn('/media/projets/responsive/tableau-1280w.webp 800w"', html)
+        self.assertIn('sizes="350px"', html)
+        self.assertIn('alt="Tableau &quot;ventes&quot;"', html)
+        self.assertIn('loading="lazy"', html)
+        
+        profile = SiteProfile.objects.create(first_name="A", last_name="B", favicon=png_upload("favicon.png", (32, 32)))
+        self.assertNotIn('srcset', template.render(Context({'image': profile.favicon})))
+        self.assertEqual(template.render(Context({'image': profile.profile_photo})), "")
+    
+    def test_no_srcset_without_derivatives(self):
+        """Tester qu'une image sans déclinaisons écrites (médias existants, fichier illisible) n'a pas de srcset."""
+        template = Template('{% load utils %}{% responsive_image image %}')
+        project = Project.objects.create(title="Tableau", resume="R", content="C", main_image=png_upload("tableau.png", (800, 600)))
+        Project.objects.update(main_image_responsive=False)
+        html = template.render(Context({'image': Project.objects.get(pk=project.pk).main_image}))
+        self.assertNotIn('srcset', html)
+        self.assertIn('width="800"', html)
+        
+        with self.assertLogs('app_acceuil.images', 'WARNING'):
+            broken = Project.objects.create(
+                title="Illisible", resume="R", content="C",
+                main_image=SimpleUploadedFile("illisible.png", b"pas une image", content_type='image/png'),
+            )
+        self.assertFalse(Project.objects.get(pk=broken.pk).main_image_responsive)
+        self.assertNotIn('srcset', template.render(Context({'image': broken.main_image})))
+    
+    def test_upload_fills_metadata(self):
+        """Tester que largeur, hauteur et couleur moyenne sont enregistrées avec l'image, et vidées quand elle est retirée."""
+        project = Project.objects.create(title="Tableau", resume="R", content="C", main_image=png_upload("tableau.png", (800, 600)))
+        project.refresh_from_db()
+        self.assertEqual((project.main_image_width, project.main_image_height, project.main_image_color), (800, 600, "#000080"))
+        project.main_image = None
+        project.save()
+        project.refresh_from_db()
+        self.assertEqual((project.main_image_width, project.main_image_height, project.main_image_color), (None, None, ""))
+    
+    def test_template_tag_dimensions_without_storage_io(self):
+        """Tester que width/height et la couleur d'attente sont émis sans ouvrir le fichier."""
+        Project.objects.create(title="Tableau", resume="R", content="C", main_image=png_upload("tableau.png", (800, 600)))
+        project = Project.objects.get(title="Tableau")
+        template = Template('{% load utils %}{% responsive_image image style="display: block;" %}')
+        with mock.patch('django.core.files.storage.FileSystemStorage.open', side_effect=AssertionError("accès au stockage")):
+            html = template.render(Context({'image': project.main_image}))
+        self.assertIn('width="800"', html)
+        self.assertIn('height="600"', html)
+        self.assertIn('style="background-color: #000080; display: block;"', html)
+    
+    def test_backfill_image_metadata_command(self):
+        """Tester que la commande mesure les images existantes, puis plus rien."""
+        project = Project.objects.create(title="Tableau", resume="R", content="C", main_image=png_upload("tableau.png", (300, 200)))
+        profile = SiteProfile.objects.create(first_name="A", last_name="B", profile_photo=png_upload("photo.png", (120, 160)))
+        Project.objects.update(main_image_width=None, main_image_height=None, main_image_color="")
+        SiteProfile.objects.update(profile_photo_width=None, profile_photo_height=None, profile_photo_color="")
+        
+        out = StringIO()
+        call_command('backfill_image_metadata', workers=2, stdout=out)
+        self.assertIn("2 image(s) mesurée(s)", out.getvalue())
+        project.refresh_from_db()
+        profile.refresh_from_db()
+        self.assertEqual((project.main_image_width, project.main_image_height), (300, 200))
+        self.assertEqual((profile.profile_photo_width, profile.profile_photo_height, profile.profile_photo_color), (120, 160, "#000080"))
+        
+        out = StringIO()
+        call_command('backfill_image_metadata', stdout=out)
+        self.assertIn("0 image(s) mesurée(s)", out.getvalue())
+    
+    def test_backfill_image_metadata_keeps_content_dates(self):
+        """Tester que la commande ne change pas la date de modification affichée d'un projet."""
+        project = Project.objects.create(title="Tableau", resume="R", content="C", main_image=png_upload("tableau.png", (300, 200)))
+        Project.objects.update(main_image_width=None, main_image_height=None, main_image_color="")
+        updated_at = Project.objects.get(pk=project.pk).updated_at
+        
+        call_command('backfill_image_metadata', stdout=StringIO())
+        project.refresh_from_db()
+        self.assertEqual(project.main_image_width, 300)
+        self.assertEqual(project.updated_at, updated_at)
+    
+    def test_backfill_image_metadata_rolls_section_fragments(self):
+        """Tester que la commande renouvelle la clé du fragment en cache d'une section mesurée."""
+        profile = SiteProfile.objects.create(first_name="A", last_name="B")
+        section = Section.objects.create(profile=profile, section_type='custom', title="Outils", title_image=png_upload("outils.png", (64, 48)))
+        Section.objects.update(title_image_width=None, title_image_height=None, title_image_color="")
+        section = Section.objects.get(pk=section.pk)
+        stale_key = section_cache.section_fragment_key(section)
+        
+        call_command('backfill_image_metadata', stdout=StringIO())
+        section = Section.objects.get(pk=section.pk)
+        self.assertNotEqual(section_cache.section_fragment_key(section), stale_key)
+        html = section_cache.render_section(section)
+        self.assertIn('width="64"', html)
+    
+    def test_build_responsive_images_command(self):
+        """Tester que la commande décline les images existantes une seule fois."""
+        project = Project.objects.create(title="Tableau", resume="R", content="C", main_image=png_upload("tableau.png", (800, 600)))
+        storage = project.main_image.storage
+        for width in RESPONSIVE_WIDTHS:
+            storage.delete(derivative_name(project.main_image.name, width))
+        Project.objects.update(main_image_responsive=False)
+        Project.objects.create(title="Sans image", resume="R", content="C")
+        
+        out = StringIO()
+        call_command('build_responsive_images', workers=2, stdout=out)
+        self.assertIn("1 image(s) déclinée(s)", out.getvalue())
+        self.assertTrue(storage.exists(derivative_name(project.main_image.name, 640)))
+        self.assertEqual(
+            dict(Project.objects.values_list('title', 'main_image_responsive')),
+            {"Tableau": True, "Sans image": False},
+        )
+        
+        out = StringIO()
+        call_command('build_responsive_images', stdout=out)
+        self.assertIn("0 image(s) déclinée(s)", out.getvalue())
+
+
+class StaticBundleTest(TestCase):
+    """Tests de la feuille Bootstrap/Font Awesome auto-hébergée."""
+    
+    def test_purge_keeps_used_rules(self):
+        """Seuls les sélecteurs dont toutes les classes sont utilisées restent, @media compris."""
+        css = (
+            ':root{--bs-blue:#0d6efd}body{margin:0}.btn{color:red}.card,.btn-lg{padding:0}'
+            '.btn:not(.disabled){cursor:pointer}.modal .btn{top:0}'
+            '@media (min-width:768px){.col-md-6{width:50%}.modal{display:none}}'
+        )
+        purged = purge_css(css, {'btn', 'col-md-6'})
+        self.assertIn(':root{--bs-blue:#0d6efd}body{margin:0}.btn{color:red}', purged)
+        self.assertIn('.btn:not(.disabled){cursor:pointer}', purged)
+        self.assertIn('@media (min-width:768px){.col-md-6{width:50%}}', purged)
+        self.assertNotIn('card', purged)
+        self.assertNotIn('modal', purged)
+    
+    def test_purge_drops_unreferenced_keyframes_and_fonts(self):
+        """Les animations et polices que plus aucune règle ne cite sont retirées."""
+        css = (
+            '.spinner{animation:spin 1s}@keyframes spin{to{opacity:0}}@keyframes beat{to{opacity:1}}'
+            '.fa-beat{animation:beat 1s}'
+            '@font-face{font-family:"Font Awesome 6 Free";font-weight:900;src:url(../webfonts/fa-solid-900.woff2)}'
+            '@font-face{font-family:"Font Awesome 6 Free";font-weight:400;src:url(../webfonts/fa-regular-400.woff2)}'
+            '.fa-solid{font-family:"Font Awesome 6 Free"}'
+        )
+        purged = purge_css(css, {'spinner', 'fa-solid'})
+        self.assertIn('@keyframes spin', purged)
+        self.assertNotIn('beat', purged)
+        self.assertIn('fa-solid-900', purged)
+        self.assertNotIn('fa-regular-400', purged)
+    
+    def test_icon_codepoints(self):
+        self.assertEqual(icon_codepoints('.fa-github:before{content:"\\f09b"}.a:after{content:"x"}'), {0xf09b, ord('x')})
+    
+    def test_committed_bundle_is_up_to_date(self):
+        """La feuille versionnée correspond aux gabarits actuels (sinon : manage.py build_static_bundle)."""
+        out = StringIO()
+        call_command('build_static_bundle', check=True, stdout=out)
+        self.assertIn("à jour", out.getvalue())
+    
+    def test_page_loads_no_cdn_asset(self):
+        """Les pages servent la feuille et le script locaux, sans CDN."""
+        SiteProfile.objects.create(first_name="A", last_name="B", is_published=True)
+        html = self.client.get(reverse('acceuil')).content.decode()
+        self.assertIn('app_acceuil/bundle/site.css', html)
+        self.assertIn('app_acceuil/js/ui.js', html)
+        self.assertNotIn('cdn.jsdelivr.net', html)
+        self.assertNotIn('cdnjs.cloudflare.com', html)
+    
+    def test_compact_keeps_strings(self):
+        """Les blancs autour de la ponctuation disparaissent, pas ceux des chaînes."""
+        css = ".a > .b {\n    content: ' ; ';\n    margin: 0 auto;\n}\n@media (max-width: 768px) { .c { top: 0 } }"
+        self.assertEqual(compact(css), ".a>.b{content:' ; ';margin:0 auto}@media (max-width:768px){.c{top:0}}")
+    
+    def test_critical_css_keeps_used_rules_only(self):
+        """Le CSS critique garde les règles des classes données, sans @import ni @font-face."""
+        css = build_critical_css({'profile-name'})
+        self.assertIn('.profile-name{', css)
+        self.assertNotIn('.contact-panel', css)
+        self.assertNotIn('@import', css)
+        self.assertNotIn('@font-face', css)
+    
+    def test_critical_css_rejects_relative_urls(self):
+        """Une url() relative serait résolue contre la page : la génération échoue."""
+        with tempfile.TemporaryDirectory() as directory:
+            source = Path(directory) / 'sheet.css'
+            source.write_text('.hero{background:url(../img/hero.png)}', encoding='utf-8')
+            with mock.patch('app_acceuil.bundle.CRITICAL_SOURCES', (source,)):
+                with self.assertRaises(ValueError):
+                    build_critical_css({'hero'})
+    
+    def test_home_inlines_critical_css_and_defers_sheets(self):
+        """L'accueil insère le CSS critique, charge ses feuilles sans bloquer et n'a plus de script en ligne."""
+        SiteProfile.objects.create(first_name="A", last_name="B", is_published=True)
+        html = self.client.get(reverse('acceuil')).content.decode()
+        critical = (settings.BASE_DIR / 'app_acceuil/static/app_acceuil/bundle/critical.css').read_text(encoding='utf-8')
+        self.assertIn(f"<style>{critical}</style>", html)
+        self.assertIn('<link rel="preload" href="/static/app_acceuil/css/acceuil.css" as="style"', html)
+        self.assertIn('<noscript><link rel="stylesheet" href="/static/app_acceuil/css/acceuil.css"></noscript>', html)
+        # Seule la variante <noscript> bloque le rendu
+        self.assertEqual(html.count('<link rel="stylesheet" href="/static/app_acceuil/css/styles.css">'), 1)
+        self.assertIn('app_acceuil/js/acceuil.js', html)
+        self.assertIsNone(re.search(r'<script(?![^>]*\bsrc=)[^>]*>', html))
+    
+    def test_detail_page_has_no_inline_styles_or_handlers(self):
+        """Les pages de détail n'ont plus de bloc <style>, d'attribut style= ni de onmouseover."""
+        SiteProfile.objects.create(first_name="A", last_name="B", is_published=True)
+        project = Project.objects.create(title="Projet", resume="Résumé", content="<p>Contenu</p>")
+        html = self.client.get(project.get_absolute_url()).content.decode()
+        self.assertIn('detail-title', html)
+        self.assertNotIn('<style', html)
+        self.assertNotIn('onmouseover', html)
+        self.assertNotIn(' style="', html)
@@ -0,0 +1,52 @@
+"""
+Texte brut des champs riches (CKEditor) des contenus publiables.
+
+`PublishableContent.save()` en dérive une fois pour toutes `resume_text`,
+`excerpt` et `word_count` : les cartes des listes et de l'accueil affichent
+l'extrait déjà calculé au lieu du HTML complet du résumé, et
+`BlogPost.read_time` se déduit du nombre de mots.
+
+Une seule expression régulière retire les balises (et le contenu des
+`<script>`/`<style>`), puis les entités sont décodées : bien plus rapide que
+l'analyseur HTML de `striptags` sur de longs articles.
+"""
+
+import math
+import re
+from html import unescape
+
+TAG_RE = re.compile(r'<(script|style)\b.*?</\1\s*>|<[^>]*>', re.S | re.I)
+
+EXCERPT_WORDS = 30
+EXCERPT_MAX_CHARS = 300
+WORDS_PER_MINUTE = 200
+
+
+def html_to_text(html):
+    """Texte brut d'un contenu HTML : balises remplacées par un espace, entités décodées, blancs réduits."""
+    return ' '.join(unescape(TAG_RE.sub(' ', html or '')).split())
+
+
+def count_words(text):
+    return len(text.split())
+
+
+def make_excerpt(text, words=EXCERPT_WORDS, max_chars=EXCERPT_MAX_CHARS):
+    """
+    Début du texte : au plus `words` mots et `max_chars` caractères, « … » si coupé.
+
+    Args:
+        text (str): Texte brut (voir `html_to_text`).
+    """
+    kept = text.split()
+    excerpt = ' '.join(kept[:words])
+    truncated = len(kept) > words
+    if len(excerpt) > max_chars - 1:
+        excerpt = excerpt[:max_chars - 1].rsplit(' ', 1)[0]
+        truncated = True
+    return f"{excerpt}…" if truncated else excerpt
+
+
+def reading_minutes(word_count, words_per_minute=WORDS_PER_MINUTE):
+    """Temps de lecture en minutes (au moins 1)."""
+    return max(1, math.ceil(word_count / words_per_minute))
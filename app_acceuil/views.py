@@ -1,13 +1,21 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.urls import reverse
 from django.conf import settings
-from django.core.mail import send_mail, BadHeaderError, get_connection
+from django.core.mail import BadHeaderError
 from django.contrib import messages
 
+from app_blog.models import BlogPost
+from app_projet.models import Project
+from app_service.models import Service
+
+from .mail_queue import deliver_without_worker, enqueue_contact_emails
+from .middleware import get_profile_or_404, get_site_profile
 from .models import SiteProfile
+from .page_cache import cache_public_page
 from .services import ProfileService
 
 
+@cache_public_page(Project, BlogPost, Service)
 def acceuil(request):
     """
     Vue pour le profil par défaut à la racine /.
@@ -21,11 +29,12 @@ def acceuil(request):
     Returns:
         HttpResponse avec le rendu du template acceuil.html.
     """
-    site_profile = SiteProfile.objects.get_default_profile()
+    site_profile = get_site_profile(request)
     context = ProfileService.build_profile_context(site_profile)
     return render(request, 'app_acceuil/acceuil.html', context)
 
 
+@cache_public_page(Project, BlogPost, Service)
 def profile_home(request, nom=None, profession=None):
     """
     Vue pour un profil spécifique avec paramètres dans le chemin.
@@ -48,11 +57,8 @@ def profile_home(request, nom=None, profession=None):
         # Si pas de paramètres, rediriger vers la racine
         return redirect('acceuil')
     
-    # Charger le profil spécifique par son slug avec le manager optimisé
-    site_profile = get_object_or_404(
-        SiteProfile.objects.get_published_with_content(),
-        slug=profile_slug
-    )
+    # Profil résolu une seule fois pour la requête (partagé avec les context processors)
+    site_profile = get_profile_or_404(request)
     
     # Construire le contexte avec le service
     context = ProfileService.build_profile_context(site_profile)
@@ -71,7 +77,8 @@ def contact(request):
     """
     Gère les soumissions du formulaire de contact.
     
-    Envoie deux emails :
+    Met en file (voir `mail_queue.py`) deux emails, envoyés en arrière-plan
+    par la commande `send_queued_emails` :
     1. Notification au propriétaire du profil (Gmail configuré)
     2. Email de confirmation à l'expéditeur (si activé)
     
@@ -93,7 +100,7 @@ def contact(request):
         message_body = request.POST.get('message', '').strip()
 
         # Récupérer le profil pour les messages personnalisés
-        profile = SiteProfile.objects.first()
+        profile = SiteProfile.objects.with_config(('contact',)).first()
         
         # Vérifier que le profil a les identifiants Gmail configurés
         if not profile or not profile.email or not profile.gmail_app_password:
@@ -101,96 +108,20 @@ def contact(request):
             messages.error(request, error_msg)
             return redirect(request.META.get('HTTP_REFERER', reverse('acceuil')))
 
-        recipient = profile.email
-
-        # Configurer la connexion email avec les identifiants de la base de données
-        email_connection = get_connection(
-            backend='django.core.mail.backends.smtp.EmailBackend',
-            host='smtp.gmail.com',
-            port=587,
-            username=profile.email,
-            password=profile.gmail_app_password,
-            use_tls=True,
-            fail_silently=False
-        )
-
-        # === EMAIL 1 : Notification au propriétaire ===
-        owner_subject = f"{subject} - Message de {name}"
-        owner_message = f"""
-Nouveau message reçu depuis le formulaire de contact
-
-DE: {name}
-EMAIL: {sender_email}
-{f'ENTREPRISE: {company}' if company else ''}
-{f'PROFESSION: {profession}' if profession else ''}
-
-OBJET: {subject}
-
-MESSAGE:
-{message_body}
-
----
-Ce message a été envoyé via le formulaire de contact de votre site web.
-Pour répondre, utilisez l'adresse: {sender_email}
-        """
-
         try:
-            # Envoyer l'email au propriétaire
-            send_mail(
-                owner_subject,
-                owner_message.strip(),
-                profile.email,     # From: email du propriétaire
-                [recipient],       # To: email du propriétaire
-                connection=email_connection,
-                fail_silently=False
-            )
-            
-            # === EMAIL 2 : Confirmation à l'expéditeur ===
-            if profile and profile.enable_confirmation_email:
-                confirmation_subject = f"Confirmation de réception - {subject}"
-                confirmation_message = f"""
-Bonjour {name},
-
-Merci de m'avoir contacté. J'ai bien reçu votre message concernant "{subject}".
-
-Je vous répondrai dans les plus brefs délais à l'adresse {sender_email}.
-
-Voici un récapitulatif de votre message :
-{'-' * 50}
-{message_body}
-{'-' * 50}
-
-Cordialement,
-{profile.first_name + ' ' + profile.last_name if profile.first_name else 'L\'équipe'}
-
----
-Ceci est un email automatique, merci de ne pas y répondre.
-                """
-                
-                send_mail(
-                    confirmation_subject,
-                    confirmation_message.strip(),
-                    profile.email,    # From: email du propriétaire
-                    [sender_email],   # To: email de l'expéditeur
-                    connection=email_connection,
-                    fail_silently=True  # Ne pas bloquer si ça échoue
-                )
+            # Aucune connexion SMTP ici : worker, ou thread lancé après la réponse
+            emails = enqueue_contact_emails(profile, name, sender_email, company, profession, subject, message_body)
+            deliver_without_worker(emails)
             
             # Message de succès
-            success_msg = profile.contact_success_message if profile and profile.contact_success_message else "Merci ! Votre message a été envoyé avec succès."
+            success_msg = profile.contact_success_message if profile.contact_success_message else "Merci ! Votre message a été envoyé avec succès."
             messages.success(request, success_msg)
             
         except BadHeaderError:
-            error_msg = profile.contact_error_message if profile and profile.contact_error_message else "En-tête invalide détecté. Le message n'a pas été envoyé."
+            error_msg = profile.contact_error_message if profile.contact_error_message else "En-tête invalide détecté. Le message n'a pas été envoyé."
             messages.error(request, error_msg)
-        except Exception as exc:
-            error_msg = profile.contact_error_message if profile and profile.contact_error_message else f"Une erreur s'est produite lors de l'envoi du message."
-            messages.error(request, error_msg)
-            # Log l'erreur pour le debug
-            print(f"Erreur envoi email: {exc}")
 
         return redirect(request.META.get('HTTP_REFERER', reverse('acceuil')))
 
     # Si GET, rediriger vers la page d'accueil
     return redirect(reverse('acceuil'))
-
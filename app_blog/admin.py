@@ -18,7 +18,7 @@ class BlogPostAdmin(admin.ModelAdmin):
             'fields': ('content', 'main_image')
         }),
         ('Métadonnées', {
-            'fields': ('tags', 'read_time')
+            'fields': ('tags', 'read_time', 'word_count')
         }),
         ('Auteur', {
             'fields': ('author_name', 'author_email', 'author_profession')
@@ -36,7 +36,7 @@ class BlogPostAdmin(admin.ModelAdmin):
         return self.prepopulated_fields  # Création, prepopulated actif
     
     def get_readonly_fields(self, request, obj=None):
-        """Slug readonly en édition, dates toujours readonly."""
+        """Slug readonly en édition, dates et champs calculés toujours readonly."""
         if obj:  # En édition - slug devient readonly
-            return ('slug', 'created_at', 'updated_at', 'published_at')
-        return ('created_at', 'updated_at', 'published_at')  # Création - slug éditable via prepopulated
+            return ('slug', 'created_at', 'updated_at', 'published_at', 'read_time', 'word_count')
+        return ('created_at', 'updated_at', 'published_at', 'read_time', 'word_count')  # Création - slug éditable via prepopulated
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.6 on 2026-10-18 10:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_blog', '0010_blogpost_app_blog_blogpost_pub_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='blogpost',
+            name='app_blog_blogpost_pub_idx',
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['-published_at', '-id'], name='app_blog_blogpost_pub_idx'),
+        ),
+    ]
@@ -2,6 +2,8 @@ from django.db import models
 from django.urls import reverse
 from ckeditor_uploader.fields import RichTextUploadingField
 from app_acceuil.base_models import PublishableContent, PublishableContentManager
+from app_acceuil.images import add_metadata_fields
+from app_acceuil.text import reading_minutes
 
 
 class BlogPost(PublishableContent):
@@ -28,11 +30,19 @@ class BlogPost(PublishableContent):
         verbose_name="Tags (séparés par des virgules)"
     )
     read_time = models.IntegerField(
-        default=5, 
+        default=1,
+        editable=False,
         verbose_name="Temps de lecture (minutes)"
     )
     
     objects = PublishableContentManager()
+    
+    TEXT_FIELDS = PublishableContent.TEXT_FIELDS + ('read_time',)
+    
+    def update_text_fields(self):
+        """Ajoute le temps de lecture, déduit du nombre de mots."""
+        super().update_text_fields()
+        self.read_time = reading_minutes(self.word_count)
 
     def get_absolute_url(self):
         """Retourne l'URL de la page de détail de l'article."""
@@ -42,3 +52,6 @@ class BlogPost(PublishableContent):
         verbose_name = "Article de blog"
         verbose_name_plural = "Articles de blog"
         # Hérite ordering = ['-created_at'] de PublishableContent
+
+
+add_metadata_fields(BlogPost)
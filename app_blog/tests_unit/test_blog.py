@@ -4,13 +4,19 @@ Tests pour l'application app_blog.
 Couvre:
 - Modèle: BlogPost
 - Vues: blogue_list, blogue_detail, profile_blogue_list, profile_blogue_detail
+- Pagination par curseur de la liste des articles
 - URLs: racine et profil
 """
 
+from django.db import connection
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from app_blog.models import BlogPost
 from app_acceuil.models import SiteProfile
+from app_acceuil.pagination import decode_cursor
+from app_acceuil.tests_unit.query_budget import QueryBudgetMixin
 
 
 class BlogPostModelTest(TestCase):
@@ -25,8 +31,7 @@ class BlogPostModelTest(TestCase):
             author_name="Yama Sakho",
             author_email="yama@example.com",
             author_profession="Data Analyst",
-            tags="machine learning, python, AI",
-            read_time=10
+            tags="machine learning, python, AI"
         )
     
     def test_blogpost_creation(self):
@@ -34,7 +39,7 @@ class BlogPostModelTest(TestCase):
         self.assertEqual(self.article.title, "Introduction au Machine Learning")
         self.assertEqual(self.article.author_name, "Yama Sakho")
         self.assertEqual(self.article.tags, "machine learning, python, AI")
-        self.assertEqual(self.article.read_time, 10)
+        self.assertEqual(self.article.read_time, 1)
     
     def test_blogpost_slug_generation(self):
         """Tester la génération du slug."""
@@ -51,7 +56,7 @@ class BlogPostModelTest(TestCase):
         self.assertEqual(str(self.article), "Introduction au Machine Learning")
     
     def test_blogpost_default_read_time(self):
-        """Tester la valeur par défaut du temps de lecture."""
+        """Tester le temps de lecture minimal d'un article court."""
         article = BlogPost.objects.create(
             title="Quick Post",
             resume="Resume",
@@ -60,7 +65,59 @@ class BlogPostModelTest(TestCase):
             author_email="test@example.com",
             author_profession="Writer"
         )
-        self.assertEqual(article.read_time, 5)  # Valeur par défaut
+        self.assertEqual(article.read_time, 1)  # Au moins une minute
+    
+    def test_blogpost_slug_collisions(self):
+        """Tester que les titres identiques reçoivent des suffixes croissants."""
+        slugs = [
+            BlogPost.objects.create(title="Weekly update", resume="R", content="C").slug
+            for _ in range(3)
+        ]
+        self.assertEqual(slugs, ["weekly-update", "weekly-update-1", "weekly-update-2"])
+    
+    def test_blogpost_slug_allocated_with_single_query(self):
+        """Tester qu'une collision ne coûte qu'une requête de recherche, quel que soit le nombre de doublons."""
+        BlogPost.objects.bulk_create([BlogPost(title="Weekly update", resume="R", content="C") for _ in range(20)])
+        # 1 recherche du slug + 1 INSERT + 1 document de recherche (app_recherche)
+        with self.assertNumQueries(3):
+            article = BlogPost.objects.create(title="Weekly update", resume="R", content="C")
+        self.assertEqual(article.slug, "weekly-update-20")
+    
+    def test_blogpost_bulk_create_allocates_slugs(self):
+        """Tester que bulk_create génère des slugs uniques pour tout le lot."""
+        articles = [BlogPost(title="Weekly update", resume="R", content="C") for _ in range(40)]
+        articles.append(BlogPost(title="Weekly update", slug="weekly-update-3", resume="R", content="C"))
+        with self.assertNumQueries(2):
+            BlogPost.objects.bulk_create(articles)
+        slugs = list(BlogPost.objects.filter(title="Weekly update").values_list('slug', flat=True))
+        self.assertEqual(len(set(slugs)), 41)
+    
+    def test_blogpost_text_fields(self):
+        """Tester le texte brut, l'extrait, le nombre de mots et le temps de lecture calculés à l'enregistrement."""
+        article = BlogPost.objects.create(
+            title="Long format",
+            resume="<p>Un <strong>résumé</strong>&nbsp;" + "mot " * 40 + "</p>",
+            content="<p>" + "texte " * 400 + "</p>"
+        )
+        self.assertTrue(article.resume_text.startswith("Un résumé mot"))
+        self.assertEqual(article.word_count, 442)
+        self.assertEqual(article.read_time, 3)
+        self.assertTrue(article.excerpt.endswith("…"))
+        self.assertEqual(len(article.excerpt.split()), 30)
+        self.assertNotIn("<", article.excerpt)
+    
+    def test_blogpost_text_fields_follow_update_fields(self):
+        """Tester qu'un save(update_fields=['resume']) enregistre aussi les champs dérivés."""
+        self.article.resume = "<p>Nouveau résumé</p>"
+        self.article.save(update_fields=['resume'])
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.excerpt, "Nouveau résumé")
+        self.assertEqual(self.article.word_count, 6)
+    
+    def test_blogpost_bulk_create_fills_text_fields(self):
+        """Tester que bulk_create calcule aussi les champs texte."""
+        BlogPost.objects.bulk_create([BlogPost(title="Import", resume="<b>Deux mots</b>", content="C")])
+        self.assertEqual(BlogPost.objects.values_list('excerpt', 'word_count').get(title="Import"), ("Deux mots", 3))
 
 
 class BlogListViewTest(TestCase):
@@ -155,6 +212,52 @@ class BlogDetailViewTest(TestCase):
             reverse('blogue_detail', kwargs={'slug': 'slug-inexistant'})
         )
         self.assertEqual(response.status_code, 404)
+    
+    def test_detail_view_metadata_follows_display_flags(self):
+        """Tester que les métadonnées suivent les cases du masque blog."""
+        profile = SiteProfile.objects.create(
+            first_name="Yama",
+            last_name="Sakho",
+            is_published=True,
+            is_default=True
+        )
+        url = reverse('blogue_detail', kwargs={'slug': self.article.slug})
+        self.assertContains(self.client.get(url), 'mailto:test@example.com')
+        
+        profile.blog_show_author_detail = False
+        profile.save()
+        response = self.client.get(url)
+        self.assertNotContains(response, 'mailto:test@example.com')
+        self.assertContains(response, 'meta-date')
+    
+    def test_detail_view_sets_validators(self):
+        """Tester que la page de détail porte ETag et Last-Modified."""
+        response = self.client.get(
+            reverse('blogue_detail', kwargs={'slug': self.article.slug})
+        )
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+    
+    def test_detail_view_not_modified(self):
+        """Tester qu'un client à jour reçoit un 304 avec une seule requête."""
+        url = reverse('blogue_detail', kwargs={'slug': self.article.slug})
+        response = self.client.get(url)
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b'')
+        since = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(since.status_code, 304)
+    
+    def test_detail_view_modified_after_save(self):
+        """Tester qu'une modification de l'élément change le validateur."""
+        url = reverse('blogue_detail', kwargs={'slug': self.article.slug})
+        etag = self.client.get(url)['ETag']
+        self.article.title = "Titre modifié"
+        self.article.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
 
 
 class ProfileBlogViewsTest(TestCase):
@@ -294,3 +397,113 @@ class BlogURLTest(TestCase):
             '/profil/nom=yama-sakho&profession=data-analyst/blog/test-article/'
         )
 
+
+class BlogQueryBudgetTest(QueryBudgetMixin, TestCase):
+    """Budgets de requêtes SQL et de temps de rendu des pages du blog."""
+    
+    def setUp(self):
+        """Créer le jeu de données de référence."""
+        self.seed_budget_dataset()
+    
+    def test_blogue_list_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'blogue_list'."""
+        self.assertRouteWithinBudget('blogue_list')
+    
+    def test_blogue_detail_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'blogue_detail'."""
+        self.assertRouteWithinBudget('blogue_detail')
+    
+    def test_profile_blogue_list_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'profile_blogue_list'."""
+        self.assertRouteWithinBudget('profile_blogue_list')
+    
+    def test_profile_blogue_detail_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'profile_blogue_detail'."""
+        self.assertRouteWithinBudget('profile_blogue_detail')
+
+
+class BlogCursorPaginationTest(TestCase):
+    """Tests pour la pagination par curseur de la liste des articles."""
+    
+    def setUp(self):
+        """Créer 20 articles, dont 5 publiés au même instant."""
+        self.articles = [
+            BlogPost.objects.create(title=f"Article {i}", resume=f"Resume {i}", content=f"Content {i}")
+            for i in range(20)
+        ]
+        same_instant = timezone.now()
+        BlogPost.objects.filter(pk__in=[article.pk for article in self.articles[5:10]]).update(published_at=same_instant)
+        self.expected = list(BlogPost.objects.order_by('-published_at', '-pk').values_list('pk', flat=True))
+    
+    def walk(self, url):
+        """Suit les curseurs « suivant » depuis la première page ; retourne les pages."""
+        pages = []
+        cursor = None
+        while True:
+            response = self.client.get(url, {'cursor': cursor} if cursor else {})
+            self.assertEqual(response.status_code, 200)
+            page = response.context['page_obj']
+            pages.append([article.pk for article in response.context['articles']])
+            cursor = page.next_cursor
+            if cursor is None:
+                return pages
+    
+    def test_pages_cover_every_article_once(self):
+        """Les pages successives couvrent tous les articles dans l'ordre, sans doublon."""
+        pages = self.walk(reverse('blogue_list'))
+        self.assertEqual([len(page) for page in pages], [9, 9, 2])
+        self.assertEqual([pk for page in pages for pk in page], self.expected)
+    
+    def test_previous_cursor_returns_previous_page(self):
+        """Le curseur « précédent » de la page 2 ramène la page 1."""
+        first = self.client.get(reverse('blogue_list')).context['page_obj']
+        self.assertFalse(first.has_previous())
+        second = self.client.get(reverse('blogue_list'), {'cursor': first.next_cursor}).context['page_obj']
+        self.assertTrue(second.has_previous())
+        back = self.client.get(reverse('blogue_list'), {'cursor': second.previous_cursor}).context['page_obj']
+        self.assertEqual([a.pk for a in back], [a.pk for a in first])
+        self.assertFalse(back.has_previous())
+        self.assertTrue(back.has_next())
+    
+    def test_no_count_query_and_index_scan(self):
+        """Une page ne compte pas les articles et suit l'index (published_at, id)."""
+        first = self.client.get(reverse('blogue_list')).context['page_obj']
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(reverse('blogue_list'), {'cursor': first.next_cursor})
+        queries = [query['sql'] for query in ctx.captured_queries]
+        self.assertFalse([sql for sql in queries if 'COUNT(' in sql])
+        self.assertFalse([sql for sql in queries if 'OFFSET' in sql])
+        if connection.vendor == 'sqlite':
+            page_sql = next(sql for sql in queries if sql.startswith('SELECT "app_blog_blogpost"'))
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN QUERY PLAN {page_sql}")
+                plan = "\n".join(row[-1] for row in cursor.fetchall())
+            self.assertIn("app_blog_blogpost_pub_idx", plan)
+            self.assertNotIn("TEMP B-TREE", plan)
+    
+    def test_cursor_is_opaque_and_links_rendered(self):
+        """Les liens de pagination portent un jeton opaque décodable."""
+        response = self.client.get(reverse('blogue_list'))
+        cursor = response.context['page_obj'].next_cursor
+        self.assertContains(response, f'?cursor={cursor}')
+        self.assertNotIn('|', cursor)
+        direction, published_at, pk = decode_cursor(cursor)
+        self.assertEqual(pk, response.context['articles'][-1].pk)
+    
+    def test_invalid_cursor_returns_404(self):
+        """Un jeton invalide renvoie une 404, comme un numéro de page invalide."""
+        response = self.client.get(reverse('blogue_list'), {'cursor': 'pas-un-curseur'})
+        self.assertEqual(response.status_code, 404)
+    
+    def test_profile_list_paginates_profile_articles(self):
+        """La liste d'un profil ne pagine que les articles publiés par ce profil."""
+        profile = SiteProfile.objects.create(
+            first_name="Yama",
+            last_name="Sakho",
+            profession="Data Analyst",
+            is_published=True
+        )
+        profile.published_articles.add(*self.articles[:12])
+        own = [pk for pk in self.expected if pk in {article.pk for article in self.articles[:12]}]
+        pages = self.walk(reverse('profile_blogue_list', kwargs={'nom': 'yama-sakho', 'profession': 'data-analyst'}))
+        self.assertEqual([pk for page in pages for pk in page], own)
@@ -15,7 +15,10 @@ class BlogListView(ProfileBasedListView):
     model = BlogPost
     template_name = 'app_blog/list.html'
     context_object_name = 'articles'
+    profile_config_groups = ('blog',)
     profile_featured_attr = 'published_articles'
+    # Le blog grossit : pages lues par curseur, sans COUNT(*) ni OFFSET
+    pagination_mode = 'cursor'
 
 
 class BlogDetailView(ProfileBasedDetailView):
@@ -24,6 +27,7 @@ class BlogDetailView(ProfileBasedDetailView):
     model = BlogPost
     template_name = 'app_blog/detail.html'
     context_object_name = 'article'
+    profile_config_groups = ('blog',)
 
 
 # Vues fonctionnelles pour compatibilité avec les URLs existantes
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_projet', '0007_alter_project_resume'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-published_at'], name='app_projet_project_pub_idx'),
+        ),
+    ]
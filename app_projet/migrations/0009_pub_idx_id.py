@@ -0,0 +1,21 @@
+# Generated by Django 5.1.6 on 2026-10-18 10:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_projet', '0008_project_app_projet_project_pub_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='project',
+            name='app_projet_project_pub_idx',
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-published_at', '-id'], name='app_projet_project_pub_idx'),
+        ),
+    ]
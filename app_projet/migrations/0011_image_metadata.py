@@ -0,0 +1,28 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_projet', '0010_text_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='main_image_color',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Image principale : couleur moyenne'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='main_image_height',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image principale : hauteur'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='main_image_width',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Image principale : largeur'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_projet', '0011_image_metadata'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='main_image_responsive',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Image principale : déclinaisons WebP'),
+        ),
+    ]
@@ -2,6 +2,7 @@ from django.db import models
 from django.urls import reverse
 from ckeditor_uploader.fields import RichTextUploadingField
 from app_acceuil.base_models import PublishableContent, PublishableContentManager
+from app_acceuil.images import add_metadata_fields
 
 
 class Project(PublishableContent):
@@ -35,3 +36,6 @@ class Project(PublishableContent):
         verbose_name = "Projet"
         verbose_name_plural = "Projets"
         # Hérite ordering = ['-created_at'] de PublishableContent
+
+
+add_metadata_fields(Project)
@@ -11,6 +11,7 @@ from django.test import TestCase, Client
 from django.urls import reverse
 from app_projet.models import Project
 from app_acceuil.models import SiteProfile
+from app_acceuil.tests_unit.query_budget import QueryBudgetMixin
 
 
 class ProjectModelTest(TestCase):
@@ -158,6 +159,35 @@ class ProjectDetailViewTest(TestCase):
             reverse('projet_detail', kwargs={'slug': 'slug-inexistant'})
         )
         self.assertEqual(response.status_code, 404)
+    
+    def test_detail_view_sets_validators(self):
+        """Tester que la page de détail porte ETag et Last-Modified."""
+        response = self.client.get(
+            reverse('projet_detail', kwargs={'slug': self.project.slug})
+        )
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+    
+    def test_detail_view_not_modified(self):
+        """Tester qu'un client à jour reçoit un 304 avec une seule requête."""
+        url = reverse('projet_detail', kwargs={'slug': self.project.slug})
+        response = self.client.get(url)
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b'')
+        since = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(since.status_code, 304)
+    
+    def test_detail_view_modified_after_save(self):
+        """Tester qu'une modification de l'élément change le validateur."""
+        url = reverse('projet_detail', kwargs={'slug': self.project.slug})
+        etag = self.client.get(url)['ETag']
+        self.project.title = "Titre modifié"
+        self.project.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
 
 
 class ProfileProjectViewsTest(TestCase):
@@ -308,3 +338,26 @@ class ProjectURLTest(TestCase):
             '/profil/nom=yama-sakho&profession=data-analyst/projets/test-project/'
         )
 
+
+class ProjectQueryBudgetTest(QueryBudgetMixin, TestCase):
+    """Budgets de requêtes SQL et de temps de rendu des pages de projets."""
+    
+    def setUp(self):
+        """Créer le jeu de données de référence."""
+        self.seed_budget_dataset()
+    
+    def test_projet_list_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'projet_list'."""
+        self.assertRouteWithinBudget('projet_list')
+    
+    def test_projet_detail_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'projet_detail'."""
+        self.assertRouteWithinBudget('projet_detail')
+    
+    def test_profile_projet_list_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'profile_projet_list'."""
+        self.assertRouteWithinBudget('profile_projet_list')
+    
+    def test_profile_projet_detail_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'profile_projet_detail'."""
+        self.assertRouteWithinBudget('profile_projet_detail')
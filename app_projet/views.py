@@ -15,6 +15,7 @@ class ProjectListView(ProfileBasedListView):
     model = Project
     template_name = 'app_projet/list.html'
     context_object_name = 'projets'
+    profile_config_groups = ('projects',)
     profile_featured_attr = 'published_projects'
 
 
@@ -24,6 +25,7 @@ class ProjectDetailView(ProfileBasedDetailView):
     model = Project
     template_name = 'app_projet/detail.html'
     context_object_name = 'projet'
+    profile_config_groups = ('projects',)
 
 
 # Vues fonctionnelles pour compatibilité avec les URLs existantes
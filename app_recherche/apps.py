@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class AppRechercheConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "app_recherche"
+
+    def ready(self):
+        from .indexing import connect_signals
+
+        connect_signals()
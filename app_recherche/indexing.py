@@ -0,0 +1,97 @@
+"""
+Indexation incrémentale des contenus publiables.
+
+Chaque enregistrement d'un article, projet ou service met à jour sa ligne
+`SearchDocument` (`post_save`) ; une suppression la retire (`post_delete`).
+La base répercute le changement dans son index inversé (déclencheurs FTS5
+sur SQLite, colonne générée tsvector sur PostgreSQL) : seul le document
+modifié est réindexé.
+
+Les écritures qui contournent les signaux (`bulk_create`, `update()`, import
+SQL) se rattrapent avec `python manage.py rebuild_search_index`.
+"""
+
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+from app_acceuil.text import html_to_text
+
+# Type de document -> (modèle, relation « publiés » de SiteProfile, préfixe des routes)
+INDEXED_MODELS = {
+    'blog': ('app_blog.BlogPost', 'published_articles', 'blogue'),
+    'projet': ('app_projet.Project', 'published_projects', 'projet'),
+    'service': ('app_service.Service', 'published_services', 'service'),
+}
+
+
+def indexed_model(kind):
+    return apps.get_model(INDEXED_MODELS[kind][0])
+
+
+def kind_for(model):
+    """Type de document d'un modèle indexé (ou None)."""
+    for kind, (label, _relation, _route) in INDEXED_MODELS.items():
+        if model._meta.label == label:
+            return kind
+    return None
+
+
+def document_fields(instance):
+    """Colonnes de `SearchDocument` pour un contenu publiable."""
+    return {
+        'slug': instance.slug,
+        'title': instance.title,
+        'tags': getattr(instance, 'tags', ''),
+        'body': f"{html_to_text(instance.resume)} {html_to_text(instance.content)}".strip(),
+        'published_at': instance.published_at,
+    }
+
+
+def index_instance(sender, instance, **kwargs):
+    """Récepteur de `post_save` : crée ou met à jour le document du contenu (une requête)."""
+    from .models import SearchDocument
+
+    fields = document_fields(instance)
+    # INSERT ... ON CONFLICT DO UPDATE : les déclencheurs d'UPDATE réindexent le document
+    SearchDocument.objects.bulk_create(
+        [SearchDocument(kind=kind_for(sender), object_id=instance.pk, **fields)],
+        update_conflicts=True,
+        unique_fields=['kind', 'object_id'],
+        update_fields=list(fields),
+    )
+
+
+def remove_instance(sender, instance, **kwargs):
+    """Récepteur de `post_delete` : retire le document du contenu."""
+    from .models import SearchDocument
+
+    SearchDocument.objects.filter(kind=kind_for(sender), object_id=instance.pk).delete()
+
+
+def rebuild_index(batch_size=500):
+    """
+    Reconstruit tous les documents à partir des contenus.
+
+    Returns:
+        int: Nombre de documents indexés.
+    """
+    from .models import SearchDocument
+
+    SearchDocument.objects.all().delete()
+    count = 0
+    for kind in INDEXED_MODELS:
+        documents = [
+            SearchDocument(kind=kind, object_id=instance.pk, **document_fields(instance))
+            for instance in indexed_model(kind).objects.iterator(chunk_size=batch_size)
+        ]
+        SearchDocument.objects.bulk_create(documents, batch_size=batch_size)
+        count += len(documents)
+    return count
+
+
+def connect_signals():
+    """Connecte l'indexation aux modèles indexés."""
+    for kind in INDEXED_MODELS:
+        model = indexed_model(kind)
+        post_save.connect(index_instance, sender=model, dispatch_uid=f"app_recherche_index_{kind}")
+        post_delete.connect(remove_instance, sender=model, dispatch_uid=f"app_recherche_remove_{kind}")
@@ -0,0 +1,91 @@
+"""
+Mesure la durée d'une recherche plein texte sur un corpus synthétique.
+
+Usage:
+    python manage.py benchmark_search
+    python manage.py benchmark_search --documents 10000 --queries 200
+
+Crée `--documents` documents (vocabulaire aléatoire, texte d'un article
+moyen), supprimés à la fin, puis compare pour les mêmes saisies :
+- l'index (`search()`, FTS5 ou tsvector selon la base) ;
+- un balayage `icontains` sur le titre et le texte, sans index.
+"""
+
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from app_recherche.models import SearchDocument
+from app_recherche.search import query_words, search
+
+VOCABULARY_SIZE = 5000
+WORDS_PER_DOCUMENT = 400
+SYNTHETIC_ID_BASE = 10 ** 12
+
+
+def synthetic_documents(count, vocabulary, rng):
+    now = timezone.now()
+    for index in range(count):
+        yield SearchDocument(
+            kind=('blog', 'projet', 'service')[index % 3],
+            object_id=SYNTHETIC_ID_BASE + index,  # pas de collision avec les vrais contenus
+            slug=f"document-{index}",
+            title=" ".join(rng.choices(vocabulary, k=6)),
+            tags=", ".join(rng.choices(vocabulary, k=3)),
+            body=" ".join(rng.choices(vocabulary, k=WORDS_PER_DOCUMENT)),
+            published_at=now,
+        )
+
+
+def timings(function, queries):
+    """Durées (ms) de `function(query)` pour chaque saisie."""
+    durations = []
+    for query in queries:
+        start = time.perf_counter()
+        function(query)
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def scan(query):
+    """Recherche sans index : chaque mot en `icontains` sur le titre ou le texte."""
+    condition = Q()
+    for word in query_words(query):
+        condition &= Q(title__icontains=word) | Q(body__icontains=word)
+    return list(SearchDocument.objects.filter(condition).values_list('slug', flat=True)[:20])
+
+
+class Command(BaseCommand):
+    help = "Compare la recherche indexée à un balayage icontains sur un corpus synthétique."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--documents', type=int, default=10000, help="Taille du corpus.")
+        parser.add_argument('--queries', type=int, default=100, help="Recherches mesurées.")
+
+    def handle(self, *args, **options):
+        rng = random.Random(0)
+        vocabulary = [f"mot{index}" for index in range(VOCABULARY_SIZE)]
+        queries = [
+            " ".join(rng.choices(vocabulary, k=rng.randint(1, 2))) for _ in range(options['queries'])
+        ]
+        start = time.perf_counter()
+        # Corpus validé (FTS5 fusionne ses données en attente à la validation)
+        with transaction.atomic():
+            SearchDocument.objects.bulk_create(
+                synthetic_documents(options['documents'], vocabulary, rng), batch_size=500
+            )
+        self.stdout.write(f"{options['documents']} documents indexés en {time.perf_counter() - start:.1f} s")
+        try:
+            for label, function in (("Index plein texte", search), ("Balayage icontains", scan)):
+                durations = timings(function, queries)
+                p95 = sorted(durations)[int(len(durations) * 0.95) - 1]
+                self.stdout.write(
+                    f"{label:<20} moyenne {statistics.mean(durations):7.2f} ms   p95 {p95:7.2f} ms"
+                )
+        finally:
+            SearchDocument.objects.filter(object_id__gte=SYNTHETIC_ID_BASE).delete()
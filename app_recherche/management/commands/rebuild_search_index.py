@@ -0,0 +1,28 @@
+"""
+Reconstruit l'index de recherche à partir de tous les contenus.
+
+Usage:
+    python manage.py rebuild_search_index
+
+L'index se tient à jour seul à chaque enregistrement (voir `indexing.py`) ;
+cette commande rattrape les écritures qui contournent les signaux
+(`bulk_create`, `update()`, import SQL).
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from app_recherche.indexing import rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Reconstruit les documents de recherche des articles, projets et services."
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        with transaction.atomic():
+            count = rebuild_index()
+        elapsed = (time.perf_counter() - start) * 1000
+        self.stdout.write(f"{count} document(s) indexé(s) en {elapsed:.0f} ms.")
@@ -0,0 +1,122 @@
+# Generated by Django 5.1.6 on 2026-10-18 11:20
+
+from django.db import migrations, models
+
+SQLITE_INDEX = [
+    """
+    CREATE VIRTUAL TABLE app_recherche_fts USING fts5(
+        title, tags, body,
+        content='app_recherche_searchdocument', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    # Classement `rank` : bm25 pondéré (titre > tags > texte)
+    "INSERT INTO app_recherche_fts (app_recherche_fts, rank) VALUES ('rank', 'bm25(10.0, 5.0, 1.0)')",
+    """
+    CREATE TRIGGER app_recherche_fts_insert AFTER INSERT ON app_recherche_searchdocument BEGIN
+        INSERT INTO app_recherche_fts (rowid, title, tags, body) VALUES (new.id, new.title, new.tags, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER app_recherche_fts_delete AFTER DELETE ON app_recherche_searchdocument BEGIN
+        INSERT INTO app_recherche_fts (app_recherche_fts, rowid, title, tags, body)
+        VALUES ('delete', old.id, old.title, old.tags, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER app_recherche_fts_update AFTER UPDATE ON app_recherche_searchdocument BEGIN
+        INSERT INTO app_recherche_fts (app_recherche_fts, rowid, title, tags, body)
+        VALUES ('delete', old.id, old.title, old.tags, old.body);
+        INSERT INTO app_recherche_fts (rowid, title, tags, body) VALUES (new.id, new.title, new.tags, new.body);
+    END
+    """,
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS app_recherche_fts_update",
+    "DROP TRIGGER IF EXISTS app_recherche_fts_delete",
+    "DROP TRIGGER IF EXISTS app_recherche_fts_insert",
+    "DROP TABLE IF EXISTS app_recherche_fts",
+]
+
+POSTGRES_INDEX = [
+    """
+    ALTER TABLE app_recherche_searchdocument ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('french'::regconfig, coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('french'::regconfig, coalesce(tags, '')), 'B') ||
+        setweight(to_tsvector('french'::regconfig, coalesce(body, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX app_recherche_searchdocument_vector_idx ON app_recherche_searchdocument USING GIN (search_vector)",
+]
+
+POSTGRES_DROP = [
+    "DROP INDEX IF EXISTS app_recherche_searchdocument_vector_idx",
+    "ALTER TABLE app_recherche_searchdocument DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def run_statements(statements):
+    """Exécute les instructions du moteur courant (les autres moteurs sont ignorés)."""
+    def run(apps, schema_editor):
+        for statement in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+def index_existing_content(apps, schema_editor):
+    """Indexe les contenus déjà en base (les déclencheurs alimentent l'index inversé)."""
+    from app_recherche.indexing import INDEXED_MODELS, document_fields
+
+    SearchDocument = apps.get_model("app_recherche", "SearchDocument")
+    for kind, (label, _relation, _route) in INDEXED_MODELS.items():
+        SearchDocument.objects.bulk_create(
+            SearchDocument(kind=kind, object_id=instance.pk, **document_fields(instance))
+            for instance in apps.get_model(label).objects.all()
+        )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("app_blog", "0011_pub_idx_id"),
+        ("app_projet", "0009_pub_idx_id"),
+        ("app_service", "0008_pub_idx_id"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("blog", "Article"), ("projet", "Projet"), ("service", "Service")],
+                        max_length=20,
+                        verbose_name="Type",
+                    ),
+                ),
+                ("object_id", models.PositiveBigIntegerField(verbose_name="Identifiant du contenu")),
+                ("slug", models.SlugField(max_length=200, verbose_name="Slug")),
+                ("title", models.CharField(max_length=200, verbose_name="Titre")),
+                ("tags", models.CharField(blank=True, max_length=200, verbose_name="Tags")),
+                ("body", models.TextField(blank=True, verbose_name="Texte (résumé et contenu)")),
+                ("published_at", models.DateTimeField(verbose_name="Date de publication")),
+            ],
+            options={
+                "verbose_name": "Document indexé",
+                "verbose_name_plural": "Documents indexés",
+                "constraints": [
+                    models.UniqueConstraint(fields=("kind", "object_id"), name="searchdocument_unique_item"),
+                ],
+            },
+        ),
+        migrations.RunPython(
+            run_statements({"sqlite": SQLITE_INDEX, "postgresql": POSTGRES_INDEX}),
+            run_statements({"sqlite": SQLITE_DROP, "postgresql": POSTGRES_DROP}),
+        ),
+        migrations.RunPython(index_existing_content, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class SearchDocument(models.Model):
+    """
+    Texte indexé d'un contenu publiable (article, projet ou service).
+
+    Une ligne par contenu, tenue à jour à chaque enregistrement (voir
+    `indexing.py`). L'index inversé est construit par la base elle-même :
+    - SQLite : table virtuelle FTS5 `app_recherche_fts` synchronisée par
+      déclencheurs ;
+    - PostgreSQL : colonne générée `search_vector` (tsvector) indexée en GIN.
+    Les deux sont créés par la migration 0001, hors du modèle.
+    """
+
+    KIND_CHOICES = [
+        ('blog', _("Article")),
+        ('projet', _("Projet")),
+        ('service', _("Service")),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, verbose_name=_("Type"))
+    object_id = models.PositiveBigIntegerField(verbose_name=_("Identifiant du contenu"))
+    slug = models.SlugField(max_length=200, verbose_name=_("Slug"))
+    title = models.CharField(max_length=200, verbose_name=_("Titre"))
+    tags = models.CharField(max_length=200, blank=True, verbose_name=_("Tags"))
+    body = models.TextField(blank=True, verbose_name=_("Texte (résumé et contenu)"))
+    published_at = models.DateTimeField(verbose_name=_("Date de publication"))
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "object_id"], name="searchdocument_unique_item"),
+        ]
+        verbose_name = _("Document indexé")
+        verbose_name_plural = _("Documents indexés")
+
+    def __str__(self) -> str:
+        return f"{self.get_kind_display()} : {self.title}"
@@ -0,0 +1,128 @@
+"""
+Requêtes plein texte sur `SearchDocument`, classées et surlignées.
+
+- SQLite : `MATCH` sur la table FTS5, classement `bm25` (titre > tags >
+  texte), `highlight()` pour le titre et `snippet()` pour l'extrait.
+- PostgreSQL : `@@` sur `search_vector` (index GIN), classement
+  `ts_rank_cd()`, `ts_headline()` pour le titre et l'extrait.
+
+La saisie du visiteur est réduite à ses mots (aucun opérateur FTS n'est
+interprété) ; tous les mots doivent figurer dans le document, le dernier
+en préfixe (« scien » trouve « science »). Les résultats sont limités aux
+contenus publiés par le profil demandé.
+"""
+
+import re
+
+from django.db import connection
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from .indexing import INDEXED_MODELS
+
+WORD_RE = re.compile(r'\w+')
+MAX_WORDS = 8
+# Délimiteurs de surlignage (zone à usage privé), remplacés par <mark> après échappement
+START, STOP = '\ue000', '\ue001'
+
+# `rank` = bm25 pondéré (titre > tags > texte), configuré par la migration 0001
+SQLITE_SEARCH = f"""
+    SELECT d.kind, d.slug, d.title,
+           highlight(app_recherche_fts, 0, '{START}', '{STOP}'),
+           snippet(app_recherche_fts, 2, '{START}', '{STOP}', '…', 24),
+           app_recherche_fts.rank
+    FROM app_recherche_fts
+    JOIN app_recherche_searchdocument d ON d.id = app_recherche_fts.rowid
+    WHERE app_recherche_fts MATCH %s{{scope}}
+    ORDER BY app_recherche_fts.rank
+    LIMIT %s
+"""
+
+POSTGRES_SEARCH = f"""
+    SELECT d.kind, d.slug, d.title,
+           ts_headline('french', d.title, q, 'HighlightAll=true, StartSel={START}, StopSel={STOP}'),
+           ts_headline('french', d.body, q, 'MaxWords=35, MinWords=15, StartSel={START}, StopSel={STOP}'),
+           -ts_rank_cd(d.search_vector, q) AS score
+    FROM app_recherche_searchdocument d, to_tsquery('french', %s) q
+    WHERE d.search_vector @@ q{{scope}}
+    ORDER BY score
+    LIMIT %s
+"""
+
+
+def query_words(text):
+    """Mots de la saisie (au plus `MAX_WORDS`), en minuscules."""
+    return [word.lower() for word in WORD_RE.findall(text or '')][:MAX_WORDS]
+
+
+def match_expression(words, vendor):
+    """Expression de recherche du moteur : tous les mots, le dernier en préfixe."""
+    if vendor == 'postgresql':
+        return ' & '.join(words[:-1] + [f"{words[-1]}:*"])
+    return ' '.join([f'"{word}"' for word in words[:-1]] + [f'"{words[-1]}"*'])
+
+
+def profile_scope(profile):
+    """
+    Condition SQL limitant les documents aux contenus publiés par `profile`.
+
+    Returns:
+        tuple[str, list]: Fragment `AND (...)` et ses paramètres ; vide sans profil.
+    """
+    if profile is None:
+        return '', []
+    quote = connection.ops.quote_name
+    clauses = []
+    params = []
+    for kind, (_label, relation, _route) in INDEXED_MODELS.items():
+        field = profile._meta.get_field(relation)
+        clauses.append(
+            f"(d.kind = %s AND d.object_id IN (SELECT {quote(field.m2m_reverse_name())} "
+            f"FROM {quote(field.m2m_db_table())} WHERE {quote(field.m2m_column_name())} = %s))"
+        )
+        params += [kind, profile.pk]
+    return f" AND ({' OR '.join(clauses)})", params
+
+
+def highlighted(text):
+    """Texte échappé, passages trouvés entourés de <mark>."""
+    return mark_safe(escape(text).replace(START, '<mark>').replace(STOP, '</mark>'))
+
+
+def search(text, profile=None, limit=20):
+    """
+    Recherche plein texte dans les contenus publiés d'un profil.
+
+    Args:
+        text (str): Saisie du visiteur.
+        profile (SiteProfile or None): Profil dont les contenus publiés sont
+            cherchés ; None cherche dans tous les contenus.
+        limit (int): Nombre maximal de résultats.
+
+    Returns:
+        list[dict]: Résultats du plus pertinent au moins pertinent, avec
+        `kind`, `slug`, `title`, `title_html`, `snippet_html` et `score`.
+    """
+    words = query_words(text)
+    if not words:
+        return []
+    scope, scope_params = profile_scope(profile)
+    sql = POSTGRES_SEARCH if connection.vendor == 'postgresql' else SQLITE_SEARCH
+    with connection.cursor() as cursor:
+        cursor.execute(
+            sql.format(scope=scope),
+            [match_expression(words, connection.vendor), *scope_params, limit],
+        )
+        rows = cursor.fetchall()
+    return [
+        {
+            'kind': kind,
+            'slug': slug,
+            'title': title,
+            'title_html': highlighted(title_marked),
+            'snippet_html': highlighted(snippet),
+            # Plus grand = plus pertinent, quel que soit le moteur
+            'score': -score,
+        }
+        for kind, slug, title, title_marked, snippet, score in rows
+    ]
@@ -0,0 +1,209 @@
+"""
+Tests pour l'application app_recherche.
+
+Couvre:
+- Indexation incrémentale: SearchDocument tenu à jour à l'enregistrement et à la suppression
+- Recherche: classement, préfixe, accents, surlignage, saisie hostile, périmètre du profil
+- Vues: recherche, recherche_api, profile_recherche
+- Commandes: rebuild_search_index, benchmark_search
+"""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.html import escape
+from app_acceuil.models import SiteProfile
+from app_acceuil.tests_unit.query_budget import QUERY_BUDGETS, QueryBudgetMixin
+from app_blog.models import BlogPost
+from app_projet.models import Project
+from app_service.models import Service
+from app_recherche.models import SearchDocument
+from app_recherche.search import search
+
+
+class IndexingTest(TestCase):
+    """Tests pour la mise à jour des documents de recherche."""
+    
+    def test_save_indexes_plain_text(self):
+        """Un article enregistré est indexé avec son texte sans balises."""
+        article = BlogPost.objects.create(
+            title="Pandas en pratique",
+            resume="<p>Nettoyer des <strong>données</strong></p>",
+            content="<p>Fusionner&nbsp;des tables</p><script>alert(1)</script>",
+            tags="python, data"
+        )
+        document = SearchDocument.objects.get(kind='blog', object_id=article.pk)
+        self.assertEqual(document.body, "Nettoyer des données Fusionner des tables")
+        self.assertEqual(document.tags, "python, data")
+        self.assertEqual(document.slug, article.slug)
+    
+    def test_update_reindexes_document(self):
+        """Une modification remplace les termes indexés."""
+        project = Project.objects.create(title="Tableau de bord", resume="Ventes", content="Power BI")
+        project.content = "Streamlit"
+        project.save()
+        self.assertEqual(SearchDocument.objects.filter(kind='projet').count(), 1)
+        self.assertEqual(search("streamlit")[0]['slug'], project.slug)
+        self.assertEqual(search("power"), [])
+    
+    def test_delete_removes_document(self):
+        """Un service supprimé disparaît des résultats."""
+        service = Service.objects.create(title="Audit", resume="Audit de données", content="Qualité")
+        service.delete()
+        self.assertFalse(SearchDocument.objects.exists())
+        self.assertEqual(search("audit"), [])
+
+
+class SearchTest(TestCase):
+    """Tests pour la requête plein texte."""
+    
+    def setUp(self):
+        """Créer des contenus des trois types."""
+        self.in_title = BlogPost.objects.create(
+            title="Apprentissage automatique", resume="Introduction", content="Les bases"
+        )
+        self.in_body = BlogPost.objects.create(
+            title="Notes de lecture", resume="Un chapitre", content="<p>L'apprentissage automatique appliqué</p>"
+        )
+        self.project = Project.objects.create(
+            title="Prévision des ventes", resume="Séries temporelles", content="<p>Développement d'un modèle</p>"
+        )
+    
+    def test_title_match_ranked_first(self):
+        """Un mot du titre pèse plus qu'un mot du texte."""
+        results = search("apprentissage automatique")
+        self.assertEqual([r['slug'] for r in results], [self.in_title.slug, self.in_body.slug])
+        self.assertGreater(results[0]['score'], results[1]['score'])
+    
+    def test_last_word_is_a_prefix(self):
+        """Le dernier mot saisi trouve les mots qui le prolongent."""
+        self.assertEqual(search("prévi")[0]['slug'], self.project.slug)
+    
+    def test_accents_are_ignored(self):
+        """« developpement » trouve « Développement »."""
+        self.assertEqual(search("developpement")[0]['slug'], self.project.slug)
+    
+    def test_highlighting_is_escaped(self):
+        """Les passages trouvés sont entourés de <mark>, le reste est échappé."""
+        BlogPost.objects.create(title="Balises <b>", resume="x", content="<p>a &lt;script&gt; kaggle</p>")
+        result = search("kaggle")[0]
+        self.assertIn("<mark>kaggle</mark>", result['snippet_html'])
+        self.assertIn("&lt;script&gt;", result['snippet_html'])
+        self.assertEqual(result['title_html'], "Balises &lt;b&gt;")
+    
+    def test_operators_in_input_are_ignored(self):
+        """La syntaxe FTS saisie par le visiteur n'est pas interprétée."""
+        for text in ('"', 'NEAR(ventes', 'ventes OR -', 'title:ventes', '*'):
+            search(text)
+        self.assertEqual(search('"ventes" (')[0]['slug'], self.project.slug)
+        self.assertEqual(search("   "), [])
+    
+    def test_profile_scope(self):
+        """Seuls les contenus publiés par le profil sont trouvés."""
+        profile = SiteProfile.objects.create(first_name="Yama", last_name="Sakho", is_published=True)
+        profile.published_articles.add(self.in_body)
+        self.assertEqual([r['slug'] for r in search("automatique", profile)], [self.in_body.slug])
+        self.assertEqual(search("ventes", profile), [])
+
+
+class SearchViewsTest(TestCase):
+    """Tests pour la page de recherche et le point d'accès JSON."""
+    
+    def setUp(self):
+        """Créer un profil secondaire et ses articles."""
+        self.profile = SiteProfile.objects.create(
+            first_name="Yama",
+            last_name="Sakho",
+            profession="Data Analyst",
+            is_published=True,
+            is_default=False
+        )
+        self.article = BlogPost.objects.create(title="Visualisation", resume="Matplotlib", content="Seaborn")
+        self.other = BlogPost.objects.create(title="Visualisation avancée", resume="Plotly", content="Dash")
+        self.profile.published_articles.add(self.article)
+    
+    def test_root_page(self):
+        """La page racine trouve tous les contenus (pas de profil par défaut)."""
+        response = self.client.get(reverse('recherche'), {'q': 'visualisation'})
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'app_recherche/results.html')
+        self.assertEqual(len(response.context['results']), 2)
+        self.assertContains(response, "<mark>Visualisation</mark>")
+        self.assertContains(response, reverse('blogue_detail', kwargs={'slug': self.article.slug}))
+    
+    def test_empty_query(self):
+        """Sans saisie, la page affiche le formulaire seul."""
+        response = self.client.get(reverse('recherche'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['results'], [])
+    
+    def test_profile_page_links_to_profile_routes(self):
+        """Sous un profil : ses contenus seulement, liens vers ses pages."""
+        kwargs = {'nom': 'yama-sakho', 'profession': 'data-analyst'}
+        response = self.client.get(reverse('profile_recherche', kwargs=kwargs), {'q': 'visualisation'})
+        self.assertEqual([r['slug'] for r in response.context['results']], [self.article.slug])
+        self.assertContains(response, escape(reverse('profile_blogue_detail', kwargs={**kwargs, 'slug': self.article.slug})))
+    
+    def test_json_endpoint(self):
+        """Le point d'accès JSON renvoie résultats, surlignage et durée."""
+        response = self.client.get(reverse('recherche_api'), {'q': 'plotly', 'limit': '5'})
+        self.assertEqual(response['Content-Type'], 'application/json')
+        data = response.json()
+        self.assertEqual(data['query'], 'plotly')
+        self.assertEqual(data['count'], 1)
+        self.assertIn('took_ms', data)
+        result = data['results'][0]
+        self.assertEqual(result['kind'], 'blog')
+        self.assertEqual(result['url'], reverse('blogue_detail', kwargs={'slug': self.other.slug}))
+        self.assertIn("<mark>Plotly</mark>", result['snippet_html'])
+    
+    def test_unknown_profile_returns_404(self):
+        """Un profil inconnu dans le chemin renvoie une 404."""
+        url = reverse('profile_recherche_api', kwargs={'nom': 'inconnu', 'profession': 'x'})
+        self.assertEqual(self.client.get(url, {'q': 'a'}).status_code, 404)
+
+
+class SearchCommandsTest(TestCase):
+    """Tests pour les commandes de gestion de l'index."""
+    
+    def test_rebuild_search_index(self):
+        """La reconstruction rattrape les contenus créés sans signaux."""
+        BlogPost.objects.bulk_create([BlogPost(title=f"Lot {i}", resume="r", content="importé") for i in range(3)])
+        self.assertEqual(search("importé"), [])
+        out = StringIO()
+        call_command('rebuild_search_index', stdout=out)
+        self.assertIn("3 document(s)", out.getvalue())
+        self.assertEqual(len(search("importé")), 3)
+    
+    def test_benchmark_search(self):
+        """Le banc d'essai compare l'index au balayage et nettoie son corpus."""
+        out = StringIO()
+        call_command('benchmark_search', documents=200, queries=5, stdout=out)
+        self.assertIn("Index plein texte", out.getvalue())
+        self.assertFalse(SearchDocument.objects.exists())
+
+
+class SearchQueryBudgetTest(QueryBudgetMixin, TestCase):
+    """Budgets de requêtes SQL et de temps de rendu de la recherche."""
+    
+    def setUp(self):
+        """Créer le jeu de données de référence."""
+        self.seed_budget_dataset()
+    
+    def test_recherche_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'recherche'."""
+        self.assertWithinBudget(self.route_url('recherche') + '?q=contenu', QUERY_BUDGETS['recherche'])
+    
+    def test_recherche_api_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'recherche_api'."""
+        self.assertWithinBudget(self.route_url('recherche_api') + '?q=contenu', QUERY_BUDGETS['recherche_api'])
+    
+    def test_profile_recherche_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'profile_recherche'."""
+        self.assertWithinBudget(self.route_url('profile_recherche') + '?q=contenu', QUERY_BUDGETS['profile_recherche'])
+    
+    def test_profile_recherche_api_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'profile_recherche_api'."""
+        self.assertRouteWithinBudget('profile_recherche_api')
@@ -0,0 +1,8 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    # URLs pour le profil par défaut
+    path('', views.recherche, name='recherche'),
+    path('api/', views.recherche_api, name='recherche_api'),
+]
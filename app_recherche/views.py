@@ -0,0 +1,81 @@
+"""
+Vues de recherche plein texte : page `/recherche/?q=` et point d'accès JSON
+`/recherche/api/?q=`, à la racine (profil par défaut) ou sous un profil.
+"""
+
+import time
+
+from django.http import JsonResponse
+from django.shortcuts import render
+from django.urls import reverse
+from django.views.decorators.cache import never_cache
+
+from app_acceuil.middleware import get_profile_or_404
+from app_acceuil.templatetags.utils import profile_nom_slug, profile_profession_slug
+
+from .indexing import INDEXED_MODELS
+from .search import search
+
+RESULTS_PER_PAGE = 20
+MAX_API_RESULTS = 50
+
+
+def result_url(result, profile):
+    """URL de détail d'un résultat, sous le profil comme dans les listes."""
+    route = INDEXED_MODELS[result['kind']][2]
+    if profile and profile.first_name and profile.last_name and profile.profession:
+        return reverse(f'profile_{route}_detail', kwargs={
+            'nom': profile_nom_slug(profile),
+            'profession': profile_profession_slug(profile),
+            'slug': result['slug'],
+        })
+    return reverse(f'{route}_detail', kwargs={'slug': result['slug']})
+
+
+def run_search(request, limit):
+    """Résout le profil, exécute la recherche et mesure sa durée."""
+    profile = get_profile_or_404(request, ())
+    query = request.GET.get('q', '').strip()
+    start = time.perf_counter()
+    results = search(query, profile, limit)
+    took_ms = (time.perf_counter() - start) * 1000
+    for result in results:
+        result['url'] = result_url(result, profile)
+    return query, results, took_ms
+
+
+@never_cache
+def recherche(request, nom=None, profession=None):
+    """Page de résultats de recherche dans les contenus publiés du profil."""
+    query, results, took_ms = run_search(request, RESULTS_PER_PAGE)
+    return render(request, 'app_recherche/results.html', {
+        'query': query,
+        'results': results,
+        'took_ms': took_ms,
+    })
+
+
+@never_cache
+def recherche_api(request, nom=None, profession=None):
+    """Résultats en JSON (`?q=`, `?limit=` jusqu'à 50) avec extraits surlignés."""
+    try:
+        limit = min(max(int(request.GET.get('limit', RESULTS_PER_PAGE)), 1), MAX_API_RESULTS)
+    except ValueError:
+        limit = RESULTS_PER_PAGE
+    query, results, took_ms = run_search(request, limit)
+    return JsonResponse({
+        'query': query,
+        'count': len(results),
+        'took_ms': round(took_ms, 2),
+        'results': [
+            {
+                'kind': result['kind'],
+                'title': result['title'],
+                'title_html': str(result['title_html']),
+                'snippet_html': str(result['snippet_html']),
+                'url': result['url'],
+                'score': result['score'],
+            }
+            for result in results
+        ],
+    })
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_service', '0006_alter_service_content'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['-published_at'], name='app_service_service_pub_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.6 on 2026-10-18 11:52
+
+from django.db import migrations, models
+
+from app_acceuil.text import count_words, html_to_text, make_excerpt
+
+
+def fill_text_fields(apps, schema_editor):
+    """Calcule texte brut, extrait et nombre de mots des services existants."""
+    Service = apps.get_model('app_service', 'Service')
+    items = list(Service.objects.all())
+    for item in items:
+        item.resume_text = html_to_text(item.resume)
+        item.excerpt = make_excerpt(item.resume_text)
+        item.word_count = count_words(item.resume_text) + count_words(html_to_text(item.content))
+    Service.objects.bulk_update(items, ['resume_text', 'excerpt', 'word_count'], batch_size=200)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app_service', '0008_pub_idx_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='service',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=300, verbose_name='Extrait'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='resume_text',
+            field=models.TextField(blank=True, editable=False, verbose_name='Résumé (texte brut)'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Nombre de mots'),
+        ),
+        migrations.RunPython(fill_text_fields, migrations.RunPython.noop),
+    ]
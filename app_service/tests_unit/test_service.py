@@ -12,6 +12,7 @@ from django.urls import reverse
 from decimal import Decimal
 from app_service.models import Service
 from app_acceuil.models import SiteProfile
+from app_acceuil.tests_unit.query_budget import QueryBudgetMixin
 
 
 class ServiceModelTest(TestCase):
@@ -160,6 +161,35 @@ class ServiceDetailViewTest(TestCase):
             reverse('service_detail', kwargs={'slug': 'slug-inexistant'})
         )
         self.assertEqual(response.status_code, 404)
+    
+    def test_detail_view_sets_validators(self):
+        """Tester que la page de détail porte ETag et Last-Modified."""
+        response = self.client.get(
+            reverse('service_detail', kwargs={'slug': self.service.slug})
+        )
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+    
+    def test_detail_view_not_modified(self):
+        """Tester qu'un client à jour reçoit un 304 avec une seule requête."""
+        url = reverse('service_detail', kwargs={'slug': self.service.slug})
+        response = self.client.get(url)
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b'')
+        since = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(since.status_code, 304)
+    
+    def test_detail_view_modified_after_save(self):
+        """Tester qu'une modification de l'élément change le validateur."""
+        url = reverse('service_detail', kwargs={'slug': self.service.slug})
+        etag = self.client.get(url)['ETag']
+        self.service.title = "Titre modifié"
+        self.service.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
 
 
 class ProfileServiceViewsTest(TestCase):
@@ -299,3 +329,26 @@ class ServiceURLTest(TestCase):
             '/profil/nom=yama-sakho&profession=data-analyst/services/test-service/'
         )
 
+
+class ServiceQueryBudgetTest(QueryBudgetMixin, TestCase):
+    """Budgets de requêtes SQL et de temps de rendu des pages de services."""
+    
+    def setUp(self):
+        """Créer le jeu de données de référence."""
+        self.seed_budget_dataset()
+    
+    def test_service_list_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'service_list'."""
+        self.assertRouteWithinBudget('service_list')
+    
+    def test_service_detail_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'service_detail'."""
+        self.assertRouteWithinBudget('service_detail')
+    
+    def test_profile_service_list_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'profile_service_list'."""
+        self.assertRouteWithinBudget('profile_service_list')
+    
+    def test_profile_service_detail_within_budget(self):
+        """Tester le budget de requêtes et de temps de rendu de 'profile_service_detail'."""
+        self.assertRouteWithinBudget('profile_service_detail')
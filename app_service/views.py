@@ -15,6 +15,7 @@ class ServiceListView(ProfileBasedListView):
     model = Service
     template_name = 'app_service/list.html'
     context_object_name = 'services'
+    profile_config_groups = ('services',)
     profile_featured_attr = 'published_services'
 
 
@@ -24,6 +25,7 @@ class ServiceDetailView(ProfileBasedDetailView):
     model = Service
     template_name = 'app_service/detail.html'
     context_object_name = 'service'
+    profile_config_groups = ('services',)
 
 
 # Vues fonctionnelles pour compatibilité avec les URLs existantes
@@ -126,7 +126,6 @@ articles_data = [
         'content': "<h2>Introduction</h2><p>Dans cet article, nous explorons comment utiliser les modèles abstraits Django pour créer une architecture DRY.</p><h2>Avantages</h2><ul><li>Réduction du code</li><li>Meilleure maintenabilité</li><li>Tests partagés</li></ul>",
         'featured': True,
         'tags': "django, python, refactoring, architecture",
-        'read_time': 8,
     },
     {
         'title': "Guide complet de Django Class-Based Views",
@@ -134,7 +133,6 @@ articles_data = [
         'content': "<h2>Pourquoi les CBV ?</h2><p>Les Class-Based Views offrent une meilleure réutilisation du code.</p>",
         'featured': True,
         'tags': "django, cbv, python",
-        'read_time': 12,
     },
 ]
 
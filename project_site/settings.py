@@ -1,201 +0,0 @@
-"""
-Django settings for project_site project.
-
-Generated by 'django-admin startproject' using Django 5.1.6.
-
-For more information on this file, see
-https://docs.djangoproject.com/en/5.1/topics/settings/
-
-For the full list of settings and their values, see
-https://docs.djangoproject.com/en/5.1/ref/settings/
-"""
-
-import os
-from pathlib import Path
-import cloudinary
-
-# Build paths inside the project like this: BASE_DIR / 'subdir'.
-BASE_DIR = Path(__file__).resolve().parent.parent
-
-
-# Quick-start development settings - unsuitable for production
-# See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
-
-# SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = "django-insecure-$gd7$7o(&v&i9fld#-cfqlu!1vqvk-eq23q56=12l$s#2_oxjq"
-
-# SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
-
-ALLOWED_HOSTS = [
-    'localhost',
-    '127.0.0.1',
-    '.herokuapp.com',  # Autorise tous les sous-domaines herokuapp.com
-    'www.youssouphamarega.com',
-    'youssouphamarega.com',
-]
-
-# CSRF trusted origins for Heroku
-CSRF_TRUSTED_ORIGINS = [
-    'https://*.herokuapp.com',
-    'https://youssouphamarega.com',
-    'https://www.youssouphamarega.com',
-]
-
-
-# Application definition
-
-INSTALLED_APPS = [
-    "django.contrib.admin",
-    "django.contrib.auth",
-    "django.contrib.contenttypes",
-    "django.contrib.sessions",
-    "django.contrib.messages",
-    "django.contrib.staticfiles",
-    "cloudinary_storage",
-    "cloudinary",
-    "app_acceuil", # Application acceuil
-    "app_blog", # Application blog
-    "app_projet", # Application projet
-    "app_service", # Application service
-    "app_chat", # Application chat
-    'ckeditor',
-    'ckeditor_uploader',
-]
-
-CKEDITOR_UPLOAD_PATH = "uploads/"
-
-CKEDITOR_CONFIGS = {
-    'default': {
-        'toolbar': [
-            ['Format', 'Bold', 'Italic', 'Underline', '-', 'RemoveFormat'],
-            ['FontSize', 'TextColor', 'BGColor'],
-            ['NumberedList', 'BulletedList', '-', 'Outdent', 'Indent'],
-            ['JustifyLeft', 'JustifyCenter', 'JustifyRight', 'JustifyBlock'],
-            ['Link', 'Unlink', 'Anchor'],
-            ['Image', 'Table', 'HorizontalRule', 'SpecialChar'],
-            ['Source'],
-        ],
-        'height': 300,
-        'width': '100%',
-        'removePlugins': 'stylesheetparser',
-        'allowedContent': True,
-    },
-}
-
-CKEDITOR_IMAGE_BACKEND = "pillow"
-X_FRAME_OPTIONS = 'SAMEORIGIN'
-
-MIDDLEWARE = [
-    "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
-    "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
-    "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    'whitenoise.middleware.WhiteNoiseMiddleware',  #  nouveau ajout
-]
-
-ROOT_URLCONF = "project_site.urls"
-
-TEMPLATES = [
-    {
-        "BACKEND": "django.template.backends.django.DjangoTemplates",
-        "DIRS": [BASE_DIR / "templates"],
-        "APP_DIRS": True,
-        "OPTIONS": {
-            "context_processors": [
-                "django.template.context_processors.debug",
-                "django.template.context_processors.request",
-                "django.contrib.auth.context_processors.auth",
-                "django.contrib.messages.context_processors.messages",
-                'app_acceuil.context_processors.menu_items',
-                'app_acceuil.context_processors.site_profile',
-            ],
-            # Désactiver le cache des templates pour le développement
-            "debug": True,
-        },
-    },
-]
-
-WSGI_APPLICATION = "project_site.wsgi.application"
-
-
-# Database
-# https://docs.djangoproject.com/en/5.1/ref/settings/#databases
-
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
-    }
-}
-
-
-# Password validation
-# https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
-
-AUTH_PASSWORD_VALIDATORS = [
-    {
-        "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
-    },
-    {
-        "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
-    },
-    {
-        "NAME": "django.contrib.auth.password_validation.CommonPasswordValidator",
-    },
-    {
-        "NAME": "django.contrib.auth.password_validation.NumericPasswordValidator",
-    },
-]
-
-
-# Internationalization
-# https://docs.djangoproject.com/en/5.1/topics/i18n/
-
-LANGUAGE_CODE = "en-us"
-
-TIME_ZONE = "UTC"
-
-USE_I18N = True
-
-USE_TZ = True
-
-
-# Static files (CSS, JavaScript, Images)
-# https://docs.djangoproject.com/en/5.1/howto/static-files/
-
-STATIC_URL = "static/"
-
-STATICFILES_DIRS = [BASE_DIR / "app_acceuil" / "static"] # (Nouveau Ajout)
-
-# Dossier où collectstatic va tout mettre (Nouveau Ajout)
-STATIC_ROOT = BASE_DIR / 'staticfiles'
-
-# Cloudinary Configuration - Initialize early for all environments
-cloudinary.config(
-    cloud_name=os.environ.get('CLOUDINARY_CLOUD_NAME', 'dhtuftwkj'),
-    api_key=os.environ.get('CLOUDINARY_API_KEY', '735469273677619'),
-    api_secret=os.environ.get('CLOUDINARY_API_SECRET', 'qxEcRPEG8Ml4CRwrFt3cW_NJBOg'),
-)
-
-CLOUDINARY_STORAGE = {
-    'CLOUD_NAME': os.environ.get('CLOUDINARY_CLOUD_NAME', 'dhtuftwkj'),
-    'API_KEY': os.environ.get('CLOUDINARY_API_KEY', '735469273677619'),
-    'API_SECRET': os.environ.get('CLOUDINARY_API_SECRET', 'qxEcRPEG8Ml4CRwrFt3cW_NJBOg'),
-}
-
-# Always use Cloudinary for file storage (development & production)
-DEFAULT_FILE_STORAGE = 'cloudinary_storage.storage.MediaCloudinaryStorage'
-
-# Media files (uploads)
-MEDIA_URL = '/media/'
-MEDIA_ROOT = BASE_DIR / 'media'  
-
-
-# Default primary key field type
-# https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
-
-DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
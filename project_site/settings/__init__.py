@@ -0,0 +1,22 @@
+"""
+Paramètres Django, par couches : `base.py` (commun), puis `dev.py` ou `prod.py`.
+
+`DJANGO_SETTINGS_MODULE` reste `project_site.settings` ; la couche est choisie
+par `DJANGO_ENV` (`production` sur Heroku, `development` par défaut).
+"""
+
+import os
+
+import cloudinary
+
+if os.environ.get('DJANGO_ENV', 'development') == 'production':
+    from .prod import *  # noqa: F401,F403
+else:
+    from .dev import *  # noqa: F401,F403
+
+# Initialiser Cloudinary tôt, pour tous les environnements
+cloudinary.config(
+    cloud_name=CLOUDINARY_STORAGE['CLOUD_NAME'],  # noqa: F405
+    api_key=CLOUDINARY_STORAGE['API_KEY'],  # noqa: F405
+    api_secret=CLOUDINARY_STORAGE['API_SECRET'],  # noqa: F405
+)
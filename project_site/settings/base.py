@@ -0,0 +1,296 @@
+"""
+Django settings for project_site project : paramètres communs.
+
+Generated by 'django-admin startproject' using Django 5.1.6.
+Les réglages propres à chaque environnement sont dans `dev.py` et `prod.py`,
+choisis par la variable `DJANGO_ENV` (voir `__init__.py`).
+
+For more information on this file, see
+https://docs.djangoproject.com/en/5.1/topics/settings/
+
+For the full list of settings and their values, see
+https://docs.djangoproject.com/en/5.1/ref/settings/
+"""
+
+import os
+from pathlib import Path
+
+from project_site.database import database_config
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+# Quick-start development settings - unsuitable for production
+# See https://docs.djangoproject.com/en/5.1/howto/deployment/checklist/
+
+# SECURITY WARNING: keep the secret key used in production secret!
+# (clé de développement par défaut ; prod.py exige DJANGO_SECRET_KEY)
+SECRET_KEY = os.environ.get('DJANGO_SECRET_KEY', "django-insecure-$gd7$7o(&v&i9fld#-cfqlu!1vqvk-eq23q56=12l$s#2_oxjq")
+
+# SECURITY WARNING: don't run with debug turned on in production!
+DEBUG = os.environ.get('DJANGO_DEBUG', 'False') == 'True'
+
+ALLOWED_HOSTS = [
+    'localhost',
+    '127.0.0.1',
+    '.herokuapp.com',  # Autorise tous les sous-domaines herokuapp.com
+    'www.youssouphamarega.com',
+    'youssouphamarega.com',
+]
+
+# CSRF trusted origins for Heroku
+CSRF_TRUSTED_ORIGINS = [
+    'https://*.herokuapp.com',
+    'https://youssouphamarega.com',
+    'https://www.youssouphamarega.com',
+]
+
+
+# Application definition
+
+INSTALLED_APPS = [
+    "django.contrib.admin",
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    "cloudinary_storage",
+    "cloudinary",
+    "app_acceuil", # Application acceuil
+    "app_blog", # Application blog
+    "app_projet", # Application projet
+    "app_service", # Application service
+    "app_chat", # Application chat
+    "app_recherche", # Application recherche plein texte
+    'ckeditor',
+    'ckeditor_uploader',
+]
+
+CKEDITOR_UPLOAD_PATH = "uploads/"
+
+CKEDITOR_CONFIGS = {
+    'default': {
+        'toolbar': [
+            ['Format', 'Bold', 'Italic', 'Underline', '-', 'RemoveFormat'],
+            ['FontSize', 'TextColor', 'BGColor'],
+            ['NumberedList', 'BulletedList', '-', 'Outdent', 'Indent'],
+            ['JustifyLeft', 'JustifyCenter', 'JustifyRight', 'JustifyBlock'],
+            ['Link', 'Unlink', 'Anchor'],
+            ['Image', 'Table', 'HorizontalRule', 'SpecialChar'],
+            ['Source'],
+        ],
+        'height': 300,
+        'width': '100%',
+        'removePlugins': 'stylesheetparser',
+        'allowedContent': True,
+    },
+}
+
+CKEDITOR_IMAGE_BACKEND = "pillow"
+X_FRAME_OPTIONS = 'SAMEORIGIN'
+
+MIDDLEWARE = [
+    "django.middleware.security.SecurityMiddleware",
+    # Fichiers statiques servis ici, avant sessions, CSRF, profil courant, etc.
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "app_acceuil.middleware.SiteProfileMiddleware",  # Profil courant résolu une fois par requête
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+]
+
+ROOT_URLCONF = "project_site.urls"
+
+# Gabarits : chaque processus ne lit et ne compile un gabarit qu'une seule fois
+# (chargeur en cache, précompilé au démarrage par wsgi.py ; runserver le vide
+# quand un gabarit est modifié). DJANGO_TEMPLATE_CACHE=False relit les gabarits à
+# chaque requête. Le mode debug des gabarits (traces d'erreur détaillées, plus
+# lent) suit DEBUG sauf si DJANGO_TEMPLATE_DEBUG est défini : False en production.
+TEMPLATE_CACHE = os.environ.get('DJANGO_TEMPLATE_CACHE', 'True') == 'True'
+TEMPLATE_DEBUG = os.environ.get('DJANGO_TEMPLATE_DEBUG', str(DEBUG)) == 'True'
+TEMPLATE_LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+
+TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "DIRS": [BASE_DIR / "templates"],
+        "OPTIONS": {
+            "context_processors": [
+                "django.template.context_processors.debug",
+                "django.template.context_processors.request",
+                "django.contrib.auth.context_processors.auth",
+                "django.contrib.messages.context_processors.messages",
+                'app_acceuil.context_processors.menu_items',
+                'app_acceuil.context_processors.site_profile',
+            ],
+            "loaders": [("django.template.loaders.cached.Loader", TEMPLATE_LOADERS)] if TEMPLATE_CACHE else TEMPLATE_LOADERS,
+            "debug": TEMPLATE_DEBUG,
+        },
+    },
+]
+
+WSGI_APPLICATION = "project_site.wsgi.application"
+
+
+# Database
+# https://docs.djangoproject.com/en/5.1/ref/settings/#databases
+
+# DATABASE_URL (postgres://... ou sqlite:///...) ; sans elle, le db.sqlite3 du dépôt.
+# DATABASE_CONN_MAX_AGE : durée de vie des connexions PostgreSQL persistantes.
+# SQLITE_BUSY_TIMEOUT : secondes d'attente quand un autre worker écrit.
+DATABASES = {
+    "default": database_config(
+        os.environ.get('DATABASE_URL'),
+        default_sqlite=BASE_DIR / "db.sqlite3",
+        conn_max_age=int(os.environ.get('DATABASE_CONN_MAX_AGE', 600)),
+        busy_timeout=int(os.environ.get('SQLITE_BUSY_TIMEOUT', 20)),
+    )
+}
+
+# PRAGMA appliqués à chaque connexion SQLite (voir app_acceuil/sqlite_pragmas.py) :
+# WAL pour que les lecteurs ne soient pas bloqués par un enregistrement dans l'admin.
+# SQLITE_WAL : WAL activé (écrit dans le fichier). En développement, seulement
+# avec DATABASE_URL : le db.sqlite3 versionné n'est pas modifié par manage.py ;
+# toujours en production (prod.py), y compris avec le db.sqlite3 embarqué.
+SQLITE_WAL = os.environ.get('SQLITE_WAL', str(bool(os.environ.get('DATABASE_URL')))) == 'True'
+SQLITE_PRAGMAS = {
+    'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT', 20)) * 1000,
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -int(os.environ.get('SQLITE_CACHE_SIZE_KB', 20000)),
+    'mmap_size': int(os.environ.get('SQLITE_MMAP_SIZE', 128 * 1024 * 1024)),
+}
+
+
+# Cache
+# Le cache local (locmem) suffit en développement ; définir DJANGO_CACHE_DIR
+# pour partager le cache entre les workers gunicorn via le disque. En
+# production, prod.py remplace locmem par le cache en base (voir ce fichier).
+
+if os.environ.get('DJANGO_CACHE_DIR'):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": os.environ['DJANGO_CACHE_DIR'],
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "site-youssoupha-marega",
+        }
+    }
+
+# Durée de vie (secondes) des profils hydratés en cache ; 0 désactive le cache
+SITE_PROFILE_CACHE_TIMEOUT = int(os.environ.get('SITE_PROFILE_CACHE_TIMEOUT', 60 * 60 * 24))
+
+# Durée de vie (secondes) des pages publiques complètes en cache ; 0 (défaut) désactive
+# le cache de pages. Les modifications faites dans l'admin invalident les pages touchées.
+PAGE_CACHE_TIMEOUT = int(os.environ.get('PAGE_CACHE_TIMEOUT', 0))
+
+# Durée de vie (secondes) des cartes de sections de la page d'accueil en cache ;
+# la clé change à chaque modification d'une section ou d'un élément. 0 désactive.
+SECTION_FRAGMENT_TIMEOUT = int(os.environ.get('SECTION_FRAGMENT_TIMEOUT', 60 * 60 * 24))
+# Partie de la clé de ces cartes, avec l'empreinte de section_fragment.html : à
+# augmenter quand leur HTML change hors du gabarit (tags de templatetags/utils.py).
+SECTION_FRAGMENT_VERSION = os.environ.get('SECTION_FRAGMENT_VERSION', '1')
+
+# Emails du formulaire de contact : mis en file par la vue et envoyés par
+# `python manage.py send_queued_emails` avec les identifiants Gmail du profil.
+# CONTACT_EMAIL_WORKER=True quand ce worker tourne (process `worker` démarré par
+# les workflows de déploiement) ; sinon la vue envoie ses propres emails dans un
+# thread, après la réponse.
+CONTACT_EMAIL_WORKER = os.environ.get('CONTACT_EMAIL_WORKER', 'False') == 'True'
+CONTACT_EMAIL_BACKEND = os.environ.get('CONTACT_EMAIL_BACKEND', 'django.core.mail.backends.smtp.EmailBackend')
+CONTACT_EMAIL_MAX_ATTEMPTS = int(os.environ.get('CONTACT_EMAIL_MAX_ATTEMPTS', 6))
+CONTACT_EMAIL_HOST = os.environ.get('CONTACT_EMAIL_HOST', 'smtp.gmail.com')
+CONTACT_EMAIL_PORT = int(os.environ.get('CONTACT_EMAIL_PORT', 587))
+CONTACT_EMAIL_USE_TLS = os.environ.get('CONTACT_EMAIL_USE_TLS', 'True') == 'True'
+# Pool de sessions SMTP du worker : connexions simultanées par adresse et
+# inactivité (secondes) au-delà de laquelle un NOOP vérifie la session.
+CONTACT_SMTP_POOL_SIZE = int(os.environ.get('CONTACT_SMTP_POOL_SIZE', 2))
+CONTACT_SMTP_KEEPALIVE_SECONDS = int(os.environ.get('CONTACT_SMTP_KEEPALIVE_SECONDS', 30))
+
+
+# Password validation
+# https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
+
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.MinimumLengthValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.CommonPasswordValidator",
+    },
+    {
+        "NAME": "django.contrib.auth.password_validation.NumericPasswordValidator",
+    },
+]
+
+
+# Internationalization
+# https://docs.djangoproject.com/en/5.1/topics/i18n/
+
+LANGUAGE_CODE = "en-us"
+
+TIME_ZONE = "UTC"
+
+USE_I18N = True
+
+USE_TZ = True
+
+
+# Static files (CSS, JavaScript, Images)
+# https://docs.djangoproject.com/en/5.1/howto/static-files/
+
+STATIC_URL = "static/"
+
+STATICFILES_DIRS = [BASE_DIR / "app_acceuil" / "static"] # (Nouveau Ajout)
+
+# Dossier où collectstatic va tout mettre (Nouveau Ajout)
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+# `collectstatic` écrit des noms hachés (styles.3f2a9c1b7d4e.css, manifeste
+# staticfiles.json) et leurs versions .gz/.br ; WhiteNoise sert ces fichiers
+# avec `Cache-Control: max-age=315360000, public, immutable` et choisit la
+# version compressée selon `Accept-Encoding`. (dev.py garde des noms non
+# hachés pour le serveur de développement et les tests.)
+STORAGES = {
+    # `DEFAULT_FILE_STORAGE` ci-dessous n'est plus lu depuis Django 5.1 : les
+    # médias restent sur le système de fichiers, comme avant ce réglage
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
+}
+
+# Cloudinary : identifiants lus dans l'environnement (dev.py garde ceux du compte
+# de développement par défaut) ; `cloudinary.config()` est appelé par __init__.py.
+CLOUDINARY_STORAGE = {
+    'CLOUD_NAME': os.environ.get('CLOUDINARY_CLOUD_NAME'),
+    'API_KEY': os.environ.get('CLOUDINARY_API_KEY'),
+    'API_SECRET': os.environ.get('CLOUDINARY_API_SECRET'),
+}
+
+# Always use Cloudinary for file storage (development & production)
+DEFAULT_FILE_STORAGE = 'cloudinary_storage.storage.MediaCloudinaryStorage'
+
+# Media files (uploads)
+MEDIA_URL = '/media/'
+MEDIA_ROOT = BASE_DIR / 'media'  
+
+
+# Default primary key field type
+# https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
+
+DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
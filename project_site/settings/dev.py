@@ -0,0 +1,26 @@
+"""
+Paramètres de développement (poste local, CI) : debug actif, SQLite en mode
+WAL sauf si `DATABASE_URL` est défini, compte Cloudinary de développement.
+"""
+
+import os
+
+from .base import *  # noqa: F401,F403
+from .base import CLOUDINARY_STORAGE, STORAGES, TEMPLATES
+
+DEBUG = os.environ.get('DJANGO_DEBUG', 'True') == 'True'
+
+TEMPLATE_DEBUG = os.environ.get('DJANGO_TEMPLATE_DEBUG', str(DEBUG)) == 'True'
+TEMPLATES[0]["OPTIONS"]["debug"] = TEMPLATE_DEBUG
+
+CLOUDINARY_STORAGE = {
+    'CLOUD_NAME': CLOUDINARY_STORAGE['CLOUD_NAME'] or 'dhtuftwkj',
+    'API_KEY': CLOUDINARY_STORAGE['API_KEY'] or '735469273677619',
+    'API_SECRET': CLOUDINARY_STORAGE['API_SECRET'] or 'qxEcRPEG8Ml4CRwrFt3cW_NJBOg',
+}
+
+# Serveur de développement et tests : statiques servis sous leur nom d'origine,
+# sans `collectstatic` ni manifeste. Le Dockerfile active la chaîne de
+# production (noms hachés, .gz/.br) avec DJANGO_STATIC_MANIFEST=True.
+if os.environ.get('DJANGO_STATIC_MANIFEST', 'False') != 'True':
+    STORAGES = {**STORAGES, "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"}}
@@ -0,0 +1,56 @@
+"""
+Paramètres de production (Heroku, `DJANGO_ENV=production`).
+
+Debug coupé (y compris dans les gabarits), secrets lus dans l'environnement
+et base PostgreSQL via `DATABASE_URL` avec connexions persistantes : SQLite
+n'encaisse pas les écritures concurrentes de plusieurs workers gunicorn.
+
+Sans `DATABASE_URL`, l'instance sert le `db.sqlite3` embarqué dans l'image :
+il passe en WAL (`SQLITE_WAL`) pour que les lecteurs ne soient pas bloqués
+par un enregistrement dans l'admin.
+
+Le cache doit être partagé entre les workers : avec locmem, chaque processus
+garde sa copie et une invalidation (profil, pages, sections) ne touche que
+le worker qui a traité l'enregistrement dans l'admin.
+"""
+
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .base import *  # noqa: F401,F403
+from .base import CACHES, CLOUDINARY_STORAGE, DATABASES, SECRET_KEY, TEMPLATES
+
+DEBUG = False
+
+TEMPLATE_DEBUG = os.environ.get('DJANGO_TEMPLATE_DEBUG', 'False') == 'True'
+TEMPLATES[0]["OPTIONS"]["debug"] = TEMPLATE_DEBUG
+
+if SECRET_KEY.startswith('django-insecure-'):
+    raise ImproperlyConfigured("DJANGO_SECRET_KEY doit être défini en production.")
+
+missing = [name for name, value in CLOUDINARY_STORAGE.items() if not value]
+if missing:
+    raise ImproperlyConfigured(f"Identifiants Cloudinary manquants : CLOUDINARY_{', CLOUDINARY_'.join(missing)}.")
+
+# Heroku exige TLS vers PostgreSQL
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    DATABASES["default"]["OPTIONS"].setdefault("sslmode", "require")
+
+# WAL pour toute base SQLite servie (DATABASE_URL ou db.sqlite3 embarqué)
+SQLITE_WAL = os.environ.get('SQLITE_WAL', 'True') == 'True'
+
+# Cache partagé par tous les workers et dynos : table `django_cache` de la base
+# (créée au démarrage du conteneur par `createcachetable`), sauf DJANGO_CACHE_DIR
+if CACHES["default"]["BACKEND"] == "django.core.cache.backends.locmem.LocMemCache":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "django_cache",
+        }
+    }
+
+# HTTPS terminé par le routeur Heroku
+SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
+SESSION_COOKIE_SECURE = True
+CSRF_COOKIE_SECURE = True
@@ -22,6 +22,7 @@ from django.conf.urls.static import static
 from app_projet import views as projet_views
 from app_blog import views as blog_views
 from app_service import views as service_views
+from app_recherche import views as recherche_views
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -31,6 +32,7 @@ urlpatterns = [
     path('blogue/', include('app_blog.urls')),
     path('projets/', include('app_projet.urls')),
     path('services/', include('app_service.urls')),
+    path('recherche/', include('app_recherche.urls')),
     
     # URLs pour les profils spécifiques avec paramètres dans le chemin
     # Format: /profil/nom=youssoupha-marega&profession=scientifique-de-donnees/projets/
@@ -40,6 +42,8 @@ urlpatterns = [
     re_path(r'^profil/nom=(?P<nom>[^&/]+)&profession=(?P<profession>[^/]+)/blog/(?P<slug>[\w-]+)/$', blog_views.blogue_detail, name='profile_blogue_detail'),
     re_path(r'^profil/nom=(?P<nom>[^&/]+)&profession=(?P<profession>[^/]+)/services/$', service_views.service_list, name='profile_service_list'),
     re_path(r'^profil/nom=(?P<nom>[^&/]+)&profession=(?P<profession>[^/]+)/services/(?P<slug>[\w-]+)/$', service_views.service_detail, name='profile_service_detail'),
+    re_path(r'^profil/nom=(?P<nom>[^&/]+)&profession=(?P<profession>[^/]+)/recherche/$', recherche_views.recherche, name='profile_recherche'),
+    re_path(r'^profil/nom=(?P<nom>[^&/]+)&profession=(?P<profession>[^/]+)/recherche/api/$', recherche_views.recherche_api, name='profile_recherche_api'),
     
     # CKEditor
     path('ckeditor/', include('ckeditor_uploader.urls')),
@@ -14,3 +14,11 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project_site.settings")
 
 application = get_wsgi_application()
+
+# Compiler les gabarits avant la première requête du worker (chargeur en cache)
+from django.conf import settings  # noqa: E402
+
+if settings.TEMPLATE_CACHE:
+    from app_acceuil.template_warmup import precompile_templates  # noqa: E402
+
+    precompile_templates()